@@ -1,4 +1,5 @@
 from .calculator import *
 from .qcalc import *
+from .energy_cache import EnergyCache, get_energy_cache, get_energy_key, get_energy_options
 
 from . import mbdecomp
@@ -10,6 +10,8 @@ from potential_fitting.utils import constants
 
 from potential_fitting.exceptions import LibraryNotAvailableError, LibraryCallError, NoSuchLibraryError, ConfigMissingSectionError, ConfigMissingPropertyError
 
+from .energy_cache import get_energy_cache, get_energy_key, get_energy_options
+
 has_psi4 = True
 
 try:
@@ -31,6 +33,8 @@ def calculate_energy(molecule, fragment_indicies, model, cp, settings):
     """
     Calculates the energy of a subset of the fragments of a molecule.
 
+    Energies are looked up in the energy cache before they are calculated and added to it afterwards, see get_energy_cache().
+
     Args:
         molecule    - the Molecule object to calculate the energy of
         fragment_indicies - list of indicies of fragments to include in the calculation
@@ -45,20 +49,36 @@ def calculate_energy(molecule, fragment_indicies, model, cp, settings):
 
         # check which library to use to calculate the energy
     code = settings.get("energy_calculator", "code")
+
+    # check if this energy has already been calculated, in this or any other molecule or database
+    cache = get_energy_cache(settings)
+
+    if cache is not None:
+        key = get_energy_key(molecule, fragment_indicies, model, cp, code, get_energy_options(settings, code))
+        energy = cache.get(key)
+
+        if energy is not None:
+            return energy
     
     if code == "psi4":
-        return calc_psi4_energy(molecule, fragment_indicies, model, cp, settings)
+        energy = calc_psi4_energy(molecule, fragment_indicies, model, cp, settings)
     
     elif code == "TensorMol":
-        return TensorMol_convert_str(molecule, fragment_indicies, settings)
+        energy = TensorMol_convert_str(molecule, fragment_indicies, settings)
   
     elif code == "qchem":
-        return calc_qchem_energy(molecule, fragment_indicies, model, cp, settings)
+        energy = calc_qchem_energy(molecule, fragment_indicies, model, cp, settings)
     
     # if the user has specified a code that does not exist, raise an Exception
     else:
         raise NoSuchLibraryError(code)
 
+    # failed calculations raise an exception above, so only successful energies are cached
+    if cache is not None:
+        cache.set(key, energy)
+
+    return energy
+
 
 def calc_psi4_energy(molecule, fragment_indicies, model, cp, settings):
     """
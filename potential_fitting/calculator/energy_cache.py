@@ -0,0 +1,182 @@
+"""
+Contains the EnergyCache class, a persistent cache of calculated energies shared between databases
+"""
+import os
+import sqlite3
+from hashlib import sha1
+
+from potential_fitting.exceptions import ConfigMissingPropertyError
+
+# number of seconds to wait for another process to release its lock on the cache before giving up
+CACHE_TIMEOUT = 600
+
+# name of the cache file inside the log directory, used when the settings file does not specify one
+CACHE_FILE_NAME = "energy_cache.db"
+
+# options in the section of the code in the settings file that only change how fast an energy is calculated and not its value,
+# so they are not part of the key of an energy. fill_database() divides them between its worker processes.
+UNKEYED_OPTIONS = ["num_threads", "memory"]
+
+# the open caches, from (file name, id of the process that opened it) to EnergyCache, see get_energy_cache()
+open_caches = {}
+
+class EnergyCache():
+    """
+    A persistent cache of energies, keyed by the SHA1 hash of everything that determines the result of an energy calculation.
+
+    Counts the number of hits and misses of this process.
+    """
+
+    def __init__(self, file_name):
+        """
+        Opens the cache file, creating it if it does not exist
+
+        Args:
+            file_name   - path to the cache file
+
+        Returns:
+            a new EnergyCache object
+        """
+
+        self.file_name = file_name
+
+        # the cache may be shared by many processes filling databases at once, so wait for them to release their locks instead of failing
+        self.connection = sqlite3.connect(file_name, timeout = CACHE_TIMEOUT)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS Energies(key TEXT PRIMARY KEY, energy REAL)")
+        self.connection.commit()
+
+        # number of lookups of this process that found or did not find an energy
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the cache file
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        self.connection.close()
+
+    def get(self, key):
+        """
+        Looks up an energy in the cache
+
+        Args:
+            key         - the key of the energy, from get_energy_key()
+
+        Returns:
+            the cached energy, or None if there is no energy with this key
+        """
+
+        row = self.connection.execute("SELECT energy FROM Energies WHERE key=?", (key,)).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return row[0]
+
+    def set(self, key, energy):
+        """
+        Adds an energy to the cache, replacing any energy with the same key
+
+        Args:
+            key         - the key of the energy, from get_energy_key()
+            energy      - the calculated energy
+
+        Returns:
+            None
+        """
+
+        # energies take much longer to calculate than to commit, so every energy is committed immediately
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO Energies (key, energy) VALUES (?, ?)", (key, energy))
+
+def get_energy_key(molecule, fragment_indicies, model, cp, code, options = {}):
+    """
+    Generates the key of an energy calculation in the cache
+
+    The key is the SHA1 hash of the xyz of the fragments in the calculation (including ghost atoms if cp is True), their charge and
+    spin multiplicity, the model, the code, and the options of the code, so the same calculation in any molecule or database has the same key.
+
+    Args:
+        molecule    - the Molecule object to calculate the energy of
+        fragment_indicies - list of indicies of fragments to include in the calculation
+        model       - the model to use for this calculation, should be specified as method/basis
+        cp          - whether to use counterpoise correction
+        code        - the library used to calculate the energy
+        options     - dictionary of the options of the code that may change the energy, from get_energy_options(). Default is none.
+
+    Returns:
+        the key of this calculation
+    """
+
+    key_string = "\n".join([molecule.to_xyz(fragment_indicies, cp), str(molecule.get_charge(fragment_indicies)), str(molecule.get_spin_multiplicity(fragment_indicies)), model, code]
+            + ["{} = {}".format(option, value) for option, value in sorted(options.items())])
+
+    return sha1(key_string.encode()).hexdigest()
+
+def get_energy_options(settings, code):
+    """
+    Gets the options of a code in a settings file that may change the energies it calculates, such as the ecp of qchem
+
+    These are all the options in the section of the code except UNKEYED_OPTIONS.
+
+    Args:
+        settings    - .ini file with settings information
+        code        - the library used to calculate the energy
+
+    Returns:
+        dictionary from each option to its value
+    """
+
+    return {option: value for option, value in settings.getoptions(code).items() if option not in UNKEYED_OPTIONS}
+
+def get_energy_cache(settings):
+    """
+    Gets the energy cache of this process specified by a settings file.
+
+    The cache is only enabled if use_cache in the energy_calculator section is True. Its file is the cache_file in the energy_calculator section,
+    or CACHE_FILE_NAME inside the log_path in the files section by default.
+
+    Args:
+        settings    - .ini file with settings information
+
+    Returns:
+        the EnergyCache, or None if the cache is disabled
+    """
+
+    if not settings.getboolean("energy_calculator", "use_cache", False):
+        return None
+
+    # log_path is only needed if there is no cache_file, so settings files without it may still use the cache
+    try:
+        file_name = settings.get("energy_calculator", "cache_file")
+    except ConfigMissingPropertyError:
+        file_name = os.path.join(settings.get("files", "log_path"), CACHE_FILE_NAME)
+
+    # a connection may not be used in a process forked from the one that opened it, so caches are kept per process
+    key = (file_name, os.getpid())
+
+    if key not in open_caches:
+
+        # create the cache's directory if it does not already exist
+        if os.path.dirname(file_name) != "" and not os.path.exists(os.path.dirname(file_name)):
+            os.makedirs(os.path.dirname(file_name))
+
+        open_caches[key] = EnergyCache(file_name)
+
+    return open_caches[key]
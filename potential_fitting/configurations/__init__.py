@@ -1,5 +1,5 @@
 from .configuration_generator_2b import generate_2b_configurations
-from .configurations_splitter import split_configurations, MolecularDescriptor, RMSDDescriptor, RMSDDistanceDescriptor, RandomDescriptor
+from .configurations_splitter import split_configurations, MolecularDescriptor, FeatureDescriptor, RMSDDescriptor, RMSDDistanceDescriptor, SortedDistanceDescriptor, CoulombMatrixDescriptor, RandomDescriptor
 from .configuration_generator import generate_1b_configurations
 from .geometry_optimizer import optimize_geometry
 from .normal_modes_generator import generate_normal_modes
@@ -1,8 +1,56 @@
-import os
+import collections
 
-from potential_fitting.molecule import xyz_to_molecules
-from potential_fitting.utils import SettingsReader
-def generate_1b_configurations(settings_path, geo_path, nm_path, dim_null, config_path):
+import numpy
+
+from potential_fitting.molecule import Molecule, xyz_to_coordinates
+from potential_fitting.molecule.molecule_parser import get_fragment_properties
+from potential_fitting.database import add_molecules_to_database
+from potential_fitting.utils import SettingsReader, get_sobol_points, constants
+from potential_fitting.exceptions import InvalidValueError, InconsistentValueError, ParsingError
+
+# number of configurations whose displacements are generated at once, each needs 3 * (number of atoms) floats of memory
+CONFIG_BATCH_SIZE = 4096
+
+# ways of drawing the standard normal numbers that displace the normal modes, "P" for pseudo-random and "Q" for quasi-random (Sobol)
+RANDOM_METHODS = ["P", "Q"]
+
+# the normal mode sampler works in atomic units, frequencies are converted from wavenumbers and masses from daltons
+AU_TO_WAVENUMBER = 2.194746313e5 # cm^-1 / hartree
+DALTON_TO_AU = 1822.888486 # electron masses / dalton, 2014 CODATA
+
+# normal modes with frequencies below this (cm^-1) are not displaced at all, so the sampled distribution has a finite breadth
+FREQUENCY_CUTOFF = 10
+
+# masses (daltons) of the most common isotope of each element, and of deuterium and tritium. Elements not in this list use
+# their average atomic mass
+ISOTOPE_MASSES = {
+    "H": 1.00782503223,
+    "D": 2.01410177812,
+    "T": 3.0160492779,
+    "Li": 7.0160034366,
+    "B": 11.00930536,
+    "C": 12.0000000,
+    "N": 14.00307400443,
+    "O": 15.99491461957,
+    "F": 18.99840316273,
+    "Na": 22.989769282,
+    "P": 30.97376199842,
+    "S": 31.9720711744,
+    "Cl": 34.968852682,
+    "K": 38.9637064864,
+    "Br": 78.9183376,
+    "Rb": 84.9114977282,
+    "I": 126.9044719,
+    "Cs": 132.905429,
+}
+
+# coefficients of the Beasley-Springer-Moro approximation of the inverse of the standard normal CDF
+BSM_A = [2.50662823884, -18.61500062529, 41.39119773534, -25.44106049637]
+BSM_B = [-8.47351093090, 23.08336743743, -21.06224101826, 3.13082909833]
+BSM_C = [0.3374754822726147, 0.9761690190917186, 0.1607979714918209, 0.0276438810333863, 0.0038405729373609, 0.0003951896511919,
+        0.0000321767881768, 0.0000002888167364, 0.0000003960315187]
+
+def generate_1b_configurations(settings_path, geo_path, nm_path, dim_null, config_path, seed = None, database_name = None):
     """
     Generates a set of 1b configurations for a molecule given its optimized geometry and normal modes.
 
@@ -11,34 +59,246 @@ def generate_1b_configurations(settings_path, geo_path, nm_path, dim_null, confi
         geo_path - path to the optimized geometry .xyz file
         nm_path - path to normal modes file as generated by generate_normal_modes
         dim_null - the null dimension of this molecule, as returned by generate_normal_modes
-        config_path - path to the file to write the configurations, existing content will be clobbered.
+        config_path - path to the file to write the configurations, existing content will be clobbered. May be None to not
+                write any file, if database_name is given.
+        seed - seed of the pseudo-random numbers used when the random setting is P. Default is None, for a different set
+                of configurations every time.
+        database_name - the database to add a calculation of every configuration to as it is generated, using the energy
+                calculator settings in the settings file. Default is None, to not add the configurations to any database.
     """
 
     print("Running normal distribution configuration generator...")
-    
+
     settings = SettingsReader(settings_path)
 
-    # read the optimized geometry    
-    molecule = xyz_to_molecules(geo_path, settings)[0]
+    # read the optimized geometry
+    symbols, coordinates = xyz_to_coordinates(geo_path)
+
+    frequencies, normal_modes = read_normal_modes(nm_path, 3 * len(symbols) - dim_null, len(symbols))
+
+    batches = generate_normal_mode_coordinates(symbols, coordinates[0], frequencies, normal_modes, settings.getint("config_generator", "num_configs"),
+            random_method = settings.get("config_generator", "random"), geometric = settings.getboolean("config_generator", "geometric"),
+            linear = settings.getboolean("config_generator", "linear"), seed = seed)
 
-    input_path = settings.get("files", "log_path") + "/config_generator/{}.in".format(molecule.get_name())
+    frames = (frame for first_index, batch in batches for frame in format_configurations(symbols, batch, first_index))
 
-    # make sure that the directory in which to write the input_path file exists
-    if not os.path.exists(os.path.dirname(input_path)):
-        os.makedirs(os.path.dirname(input_path))
+    if config_path is not None:
+        frames = write_configurations(frames, config_path)
 
-    # construct the input file for the Fortran configurations generator code
-    with open(input_path, "w") as input_file:
-        input_file.write("'" + geo_path + "'\n") # path to optimized geometry
-        input_file.write("'" + nm_path + "'\n") # path to normal modes
-        input_file.write(str(3 * molecule.get_num_atoms()) + " " + str(dim_null) + "\n") # dim followed by dimnull
-        input_file.write(settings.get("config_generator", "random") + " " + settings.get("config_generator", "num_configs") + "\n") # random method followed by number of configs
-        input_file.write("'" + config_path + "'\n") # path to output file
-        input_file.write(settings.get("config_generator", "geometric") + " " + settings.get("config_generator", "linear") + "\n") # whether to use geometric progression followed by whether to use linear progression
-        input_file.write(".true.") # provide verbose output
-    
-    log_path = settings.get("files", "log_path") + "/config_generator/{}.log".format(molecule.get_name())
+    if database_name is not None:
+        fragment_properties = get_fragment_properties(geo_path, settings)
 
-    os.system("generate_configs_normdistrbn < " + input_path + " > " + log_path)
+        add_molecules_to_database(settings_path, database_name, (Molecule().read_xyz(frame, *fragment_properties) for frame in frames))
+
+    else:
+        # consume the frames, which writes them to the file
+        collections.deque(frames, maxlen = 0)
 
     print("Normal Distribution Configuration generation complete.")
+
+def write_configurations(frames, config_path):
+    """
+    Writes configurations to a file as they are generated
+
+    Args:
+        frames      - iterable of the xyz strings of each configuration
+        config_path - the file to write the configurations to, existing content will be clobbered
+
+    Returns:
+        generator of the frames, each yielded after it is written
+    """
+
+    with open(config_path, "w") as config_file:
+        for frame in frames:
+            config_file.write(frame)
+
+            yield frame
+
+def read_normal_modes(nm_path, num_modes, num_atoms):
+    """
+    Reads the frequencies and normal modes of a molecule from a normal modes file, as written by generate_normal_modes
+
+    Args:
+        nm_path     - the normal modes file
+        num_modes   - the number of normal modes to read, 3 * num_atoms - dim_null
+        num_atoms   - the number of atoms in the molecule
+
+    Returns:
+        (frequencies, normal_modes) where frequencies is an array of the frequency (cm^-1) of each normal mode and normal_modes
+        is an array of shape (num_modes, 3 * num_atoms) of the cartesian displacements of each normal mode
+    """
+
+    with open(nm_path, "r") as nm_file:
+        lines = [line for line in nm_file.read().splitlines() if line.strip() != ""]
+
+    # each normal mode has a header line, a frequency line, a reduced mass line, and a line for each atom
+    lines_per_mode = 3 + num_atoms
+
+    if len(lines) < num_modes * lines_per_mode:
+        raise ParsingError(nm_path, "expected {} normal modes of {} atoms, but the file only has {} non-blank lines".format(num_modes, num_atoms, len(lines)))
+
+    frequencies = numpy.empty(num_modes)
+    normal_modes = numpy.empty((num_modes, 3 * num_atoms))
+
+    for mode in range(num_modes):
+        mode_lines = lines[mode * lines_per_mode:(mode + 1) * lines_per_mode]
+
+        try:
+            frequencies[mode] = float(mode_lines[1])
+            normal_modes[mode] = numpy.array(" ".join(mode_lines[3:]).split(), dtype = float)
+        except ValueError:
+            raise ParsingError(nm_path, "normal mode {} is not a frequency followed by {} lines of 3 numbers".format(mode + 1, num_atoms)) from None
+
+    return frequencies, normal_modes
+
+def get_mode_variances(frequencies, num_configs, geometric = False, linear = True):
+    """
+    Gets the variance of the normal distribution of the displacement along each normal mode in every configuration
+
+    The first half of the configurations sample the quantum harmonic distributions of a progression of temperatures from
+    the lowest to twice the highest frequency (geometric) or from 0 to the highest frequency (linear). The second half sample
+    the "fixed-A" distributions of a progression of A from 1 to 2 (geometric) or 0 to 2 (linear).
+
+    Args:
+        frequencies - array of the frequency (cm^-1) of each normal mode, from lowest to highest, imaginary frequencies may be negative
+        num_configs - the number of configurations, at least 2
+        geometric   - if True, the temperatures and A form geometric progressions. Default is False.
+        linear      - if True, the temperatures and A form linear progressions. Default is True. Exactly one of geometric and
+                linear must be True.
+
+    Returns:
+        array of shape (num_configs, number of modes) of the variances, in atomic units of mass-weighted coordinates
+    """
+
+    if num_configs < 2:
+        raise InvalidValueError("num_configs", num_configs, "at least 2")
+
+    if geometric == linear:
+        raise InconsistentValueError("geometric", "linear", geometric, linear, "exactly one of geometric and linear must be True")
+
+    # the extra configuration of an odd number of configurations goes to the temperatures
+    num_amplitudes = num_configs // 2
+    num_temperatures = num_configs - num_amplitudes
+
+    if geometric:
+        temperatures = numpy.geomspace(abs(frequencies[0]), 2 * frequencies[-1], num_temperatures) / AU_TO_WAVENUMBER
+        amplitudes = numpy.geomspace(1, 2, num_amplitudes)
+    else:
+        temperatures = numpy.linspace(0, frequencies[-1], num_temperatures) / AU_TO_WAVENUMBER
+        amplitudes = numpy.linspace(0, 2, num_amplitudes)
+
+    frequencies = numpy.abs(frequencies) / AU_TO_WAVENUMBER
+
+    # d = 1 / (2 w tanh(w / 2T)) is the variance of the quantum harmonic oscillator at temperature T, at T = 0 and A = 0 the tanh is 1
+    with numpy.errstate(divide = "ignore", invalid = "ignore"):
+        variances = numpy.concatenate([
+                0.5 / (numpy.tanh(frequencies / (2 * temperatures[:, numpy.newaxis])) * frequencies),
+                0.5 / (numpy.tanh(0.5 / amplitudes[:, numpy.newaxis]) * frequencies)])
+
+    variances[:, frequencies < FREQUENCY_CUTOFF / AU_TO_WAVENUMBER] = 0
+
+    return variances
+
+def inverse_normal_cdf(u):
+    """
+    Transforms numbers uniform in (0, 1) to numbers of the standard normal distribution by the Beasley-Springer-Moro approximation
+    of the inverse of its cumulative distribution function
+
+    Unlike drawing normal numbers directly, this keeps the evenness of quasi-random points.
+
+    Args:
+        u           - array of numbers in (0, 1)
+
+    Returns:
+        array of the same shape of the standard normal numbers
+    """
+
+    y = numpy.asarray(u, dtype = float) - 0.5
+
+    # rational approximation in the center of the distribution
+    r = y * y
+    center = y * numpy.polyval(BSM_A[::-1], r) / (numpy.polyval(BSM_B[::-1], r) * r + 1)
+
+    # polynomial in log(-log(u)) in its tails, which is mirrored onto the lower tail
+    with numpy.errstate(divide = "ignore", invalid = "ignore"):
+        r = numpy.log(-numpy.log(0.5 - numpy.abs(y)))
+        tail = numpy.copysign(numpy.polyval(BSM_C[::-1], r), y)
+
+    return numpy.where(numpy.abs(y) < 0.42, center, tail)
+
+def generate_normal_mode_coordinates(symbols, coordinates, frequencies, normal_modes, num_configs, random_method = "P", geometric = False,
+        linear = True, seed = None, batch_size = CONFIG_BATCH_SIZE):
+    """
+    Generates configurations of a molecule by displacing its optimized geometry along its normal modes by amounts drawn from
+    the normal distributions of get_mode_variances()
+
+    The displacements of a whole batch of configurations are found by two matrix products: the standard normal numbers of each
+    configuration are projected on the mass-scaled normal modes, scaled by the standard deviation of each mode, and projected back.
+
+    Args:
+        symbols     - the atomic symbol of each atom
+        coordinates - array of shape (number of atoms, 3) of the optimized geometry, in angstroms
+        frequencies - array of the frequency (cm^-1) of each normal mode
+        normal_modes - array of shape (number of modes, 3 * number of atoms) of the normal modes
+        num_configs - the number of configurations to generate
+        random_method - "P" to draw pseudo-random numbers, or "Q" to take them from the Sobol sequence, starting after the largest
+                power of 2 no greater than num_configs. Default is "P".
+        geometric   - if True, use geometric progressions of temperatures, see get_mode_variances(). Default is False.
+        linear      - if True, use linear progressions of temperatures, see get_mode_variances(). Default is True.
+        seed        - seed of the pseudo-random numbers. Default is None, for different numbers every time.
+        batch_size  - the number of configurations generated at once. Default is CONFIG_BATCH_SIZE.
+
+    Returns:
+        generator of (first_index, batch) where batch is an array of shape (configurations, number of atoms, 3) of the coordinates
+        in angstroms of the next configurations, and first_index is the index of the first of them
+    """
+
+    if random_method.upper() not in RANDOM_METHODS:
+        raise InvalidValueError("random", random_method, "one of {}".format(", ".join(RANDOM_METHODS)))
+
+    variances = get_mode_variances(frequencies, num_configs, geometric, linear)
+
+    # mass-scale and normalize the normal modes, masses are in atomic units
+    sqrt_masses = numpy.repeat(numpy.sqrt([ISOTOPE_MASSES[symbol] if symbol in ISOTOPE_MASSES else constants.symbol_to_mass(symbol) for symbol in symbols]) * numpy.sqrt(DALTON_TO_AU), 3)
+
+    modes = normal_modes * sqrt_masses
+    modes /= numpy.linalg.norm(modes, axis = 1)[:, numpy.newaxis]
+
+    standard_deviations = numpy.sqrt(variances)
+
+    # for the Sobol sequence, skip the largest power of 2 no greater than num_configs
+    skip = max(2, 1 << (num_configs.bit_length() - 1))
+
+    random_state = numpy.random.RandomState(numpy.random.MT19937(numpy.random.SeedSequence(None if seed is None else seed % 2 ** 32)))
+
+    for start in range(0, num_configs, batch_size):
+        stop = min(start + batch_size, num_configs)
+
+        if random_method.upper() == "Q":
+            uniforms = get_sobol_points(numpy.arange(skip + start, skip + stop), modes.shape[1])
+        else:
+            uniforms = random_state.random_sample((stop - start, modes.shape[1]))
+
+        # displacements in bohr of all the configurations of this batch
+        displacements = ((inverse_normal_cdf(uniforms) @ modes.T) * standard_deviations[start:stop]) @ modes / sqrt_masses
+
+        yield start, coordinates + displacements.reshape(stop - start, len(symbols), 3) * constants.bohr_to_ang
+
+def format_configurations(symbols, configurations, first_index = 0):
+    """
+    Formats configurations as xyz strings in the same format as the Fortran normal distribution generator, with the 1-based
+    index of each configuration as its comment line
+
+    Args:
+        symbols     - the atomic symbol of each atom
+        configurations - array of shape (number of configurations, number of atoms, 3) of the coordinates of each configuration
+        first_index - the 0-based index of the first configuration. Default is 0.
+
+    Returns:
+        list of the xyz string of each configuration
+    """
+
+    # template of a configuration, filled in with its index and coordinates
+    template = "{:2d}\n{{:9d}}\n".format(len(symbols)) + "".join("{:2}{{:13.8f}}{{:13.8f}}{{:13.8f}}\n".format(symbol) for symbol in symbols)
+
+    return [template.format(first_index + index + 1, *configuration.ravel().tolist()) for index, configuration in enumerate(configurations)]
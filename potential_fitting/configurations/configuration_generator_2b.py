@@ -1,14 +1,31 @@
-import math
+import math, collections
+import concurrent.futures
 from random import Random, randint
 
-from potential_fitting.utils import Quaternion
+import numpy
+
+from potential_fitting.exceptions import InvalidValueError
+from potential_fitting.utils import Quaternion, get_random_rotation_matrices, get_sobol_rotation_matrices
 
 from potential_fitting.molecule import Molecule, xyz_to_molecules
 
-def generate_2b_configurations(geo1, geo2, number_of_configs, config_path, min_distance = 1, max_distance = 5, min_inter_distance = 1.2, use_grid = False, step_size = 0.5, seed = randint(-100000, 1000000)):
+# number of configurations in each shard, which are generated at once, each needs attempts * (atoms in 1st monomer) * (atoms in 2nd monomer)
+#   intermolecular distances of memory. changing this changes the configurations generated from a given seed
+CONFIG_BATCH_SIZE = 4096
+
+# ways of choosing the orientations of the monomers, see generate_2b_configurations()
+ORIENTATION_SAMPLERS = ["random", "sobol"]
+
+# number of times configurations that failed at the largest distance of a shard are tried again before they are skipped
+MAX_RETRY_ROUNDS = 10
+
+def generate_2b_configurations(geo1, geo2, number_of_configs, config_path, min_distance = 1, max_distance = 5, min_inter_distance = 1.2, use_grid = False, step_size = 0.5, seed = randint(-100000, 1000000), workers = 1, orientation_sampler = "random"):
     """
     Generates a set of 2 body configurations of the two optimized geometries and outputs them to an xyz file
 
+    The configurations are planned in increasing order of distance and split into shards of CONFIG_BATCH_SIZE configurations, each
+    generated with its own random stream derived from seed and the shard's index. The output therefore only depends on seed, not on workers.
+
     Args:
         geo1        - the first optimized (or series of unoptimized) geometry
         geo2        - the second optimized (or series of unoptimized) geometry
@@ -19,11 +36,22 @@ def generate_2b_configurations(geo1, geo2, number_of_configs, config_path, min_d
         min_inter_distance - the minimum distance between any two atoms from oposite monomers
         use_grid    - if True, then distance between the center of mass of the monomers will be on a grid, otherwise, it will be smooth
         step_size - only used if use_grid is True, this is the step size of the grid in angstroms
+        seed        - the same seed will generate the same configurations
+        workers     - the number of processes to generate shards in. Default is 1, which generates them in this process.
+        orientation_sampler - "random" to rotate the monomers randomly, or "sobol" to take the orientations of the first attempt at each
+                config from a low-discrepancy Sobol sequence, which covers the space of orientations more evenly with fewer configs.
+                Default is "random".
 
     Returns:
         None
     """
 
+    if workers < 1:
+        raise InvalidValueError("workers", workers, "1 or greater")
+
+    if orientation_sampler not in ORIENTATION_SAMPLERS:
+        raise InvalidValueError("orientation_sampler", orientation_sampler, "one of {}".format(", ".join(ORIENTATION_SAMPLERS)))
+
     # if use_grid is false, set the step size to even space the configurations
     if not use_grid:
         step_size = (max_distance - min_distance) / number_of_configs
@@ -31,61 +59,228 @@ def generate_2b_configurations(geo1, geo2, number_of_configs, config_path, min_d
     # how many steps the grid will have
     num_steps = math.floor((max_distance - min_distance) / step_size)
 
-    # how many configurations to generate per step in the grid (will be 1 if use_grid is False)
-    configs_per_distance = math.ceil(number_of_configs / num_steps)
+    # spread the configs evenly over the steps of the grid, the first steps get one extra config if they do not divide evenly.
+    #   this is the same as giving each step the number of configs remaining divided by the number of steps left.
+    configs_per_step = numpy.full(num_steps, number_of_configs // num_steps)
+    configs_per_step[:number_of_configs % num_steps] += 1
+
+    # the distance between the centers of mass of every planned config, in increasing order
+    planned_distances = numpy.repeat(min_distance + numpy.arange(num_steps) * step_size, configs_per_step)
 
     # parse the molecules from the input xyz files
     molecules1 = xyz_to_molecules(geo1)
     molecules2 = xyz_to_molecules(geo2)
 
+    # put every geometry in standard orientation once, and stack their coordinates into one array per monomer
+    coordinates1 = get_standard_coordinates(molecules1)
+    coordinates2 = get_standard_coordinates(molecules2)
+
+    # template of the atom lines of a configuration, filled in with the coordinates of each configuration
+    atom_template = "".join("{:2} {{:22.14e}} {{:22.14e}} {{:22.14e}}\n".format(atom.get_name()) for molecule in [molecules1[0], molecules2[0]] for atom in molecule.get_atoms())
+
+    num_atoms = coordinates1.shape[1] + coordinates2.shape[1]
+
+    # the arguments of generate_2b_shard() for each shard, which only depend on the seed and the planned distances
+    shards = [(coordinates1, coordinates2, planned_distances[start:start + CONFIG_BATCH_SIZE], min_inter_distance, seed, shard_index, atom_template, orientation_sampler, start)
+            for shard_index, start in enumerate(range(0, len(planned_distances), CONFIG_BATCH_SIZE))]
+
     # keeps track of how many total configurations have been generated
     total_configs = 0
 
-    # construct a psuedo-random number generator
-    random = Random(seed)
-
     # open the config file to write to
     with open(config_path, "w") as config_file:
 
-        # loop over each step on our grid
-        for step in range(num_steps):
+        for configurations in generate_2b_shards(shards, workers):
 
-            # loop over how many configs we want to generate at this step in the grid, which is equal
-            #   to the number of configs remaining to be generated divided by the number of steps left.
-            #   this ensures that unless a config at the last step is impossible, we will always have
-            #   exactly number_of_configs configs.
-            for config in range(math.ceil((number_of_configs - total_configs) / (num_steps - step))):
+            # shards are merged in order, so the configs stay in increasing order of distance
+            for configuration in configurations:
 
-                # first select a random geometry for each monomer
-                molecule1 = random.choice(molecules1)
-                molecule2 = random.choice(molecules2)
+                # write total number of atoms and, in the comment line, how many configs have been generated before this one
+                config_file.write("{}\n{}\n".format(num_atoms, total_configs))
 
-                try:
-                    # move the molecules to a valid configuration, making 5 attempts
-                    move_to_config(random, molecule1, molecule2, min_distance + step * step_size, min_inter_distance, 5)
+                # write the xyz of each monomer to the config file
+                config_file.write(configuration)
 
-                except RanOutOfAttemptsException:
-                    # if we didn't find a valid configuration, skip this config
-                    continue
+                total_configs += 1
 
-                # write total number of atoms to config file
-                config_file.write("{}\n".format(molecule1.get_num_atoms() + molecule2.get_num_atoms()))
+    # if we did not hit our target number of configs, the user can see it here
+    print("Generated {} configurations".format(total_configs))
 
-                # in the comment line, write how many configs have been generated before this one
-                config_file.write("{}\n".format(total_configs))
+def generate_2b_shards(shards, workers):
+    """
+    Generates shards of 2 body configurations, in a pool of worker processes if workers is greater than 1
 
-                # write the xyz of each monomer to the config file
-                config_file.write("{}\n{}\n".format(molecule1.to_xyz(), molecule2.to_xyz()))
-            
-                total_configs += 1
+    Args:
+        shards      - list of the arguments of generate_2b_shard() for each shard
+        workers     - the number of worker processes
 
-                # if we have hit our target number of configs, return
-                if total_configs == number_of_configs:
-                    print("Generated {} configurations".format(total_configs))
-                    return
+    Returns:
+        a generator of the result of generate_2b_shard() for each shard, in order
+    """
 
-    # if we did not hit our target number of configs, notify the user
-    print("Generated {} configurations".format(total_configs))
+    if workers == 1:
+        for shard in shards:
+            yield generate_2b_shard(*shard)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers = workers) as executor:
+
+        # futures of the shards being generated, in order. at most 2 shards per worker are submitted at a time so finished shards waiting
+        #   to be written do not pile up in memory
+        running = collections.deque()
+
+        for shard in shards:
+            running.append(executor.submit(generate_2b_shard, *shard))
+
+            if len(running) >= 2 * workers:
+                yield running.popleft().result()
+
+        while len(running) > 0:
+            yield running.popleft().result()
+
+def generate_2b_shard(coordinates1, coordinates2, distances, min_inter_distance, seed, shard_index, atom_template, orientation_sampler = "random", first_index = 0):
+    """
+    Generates one shard of 2 body configurations with the random stream of this shard
+
+    Configs whose attempts all fail are moved to the next larger distance in the shard and tried again. At the largest distance
+    in the shard, they are tried again at the same distance up to MAX_RETRY_ROUNDS times before being skipped.
+
+    Args:
+        coordinates1 - array of shape (number of geometries, number of atoms, 3) of the geometries of the 1st monomer in standard orientation
+        coordinates2 - array of shape (number of geometries, number of atoms, 3) of the geometries of the 2nd monomer in standard orientation
+        distances   - array of the distance between the centers of mass of the two monomers of each config in this shard, in increasing order
+        min_inter_distance - minimum distance for any inter-molecular atomic distance
+        seed        - the seed of the whole set of configurations
+        shard_index - the index of this shard, which together with seed determines its random stream
+        atom_template - format string of the atom lines of one configuration
+        orientation_sampler - how the orientations of the first attempt at each config are chosen, see generate_2b_configurations()
+        first_index - the index of the first config of this shard among all the configs, which is its index in the Sobol sequence
+
+    Returns:
+        list of the atom lines of each config generated, in increasing order of distance
+    """
+
+    # derive an independent random stream for this shard, numpy only accepts non-negative seeds
+    random_state = numpy.random.RandomState(numpy.random.MT19937(numpy.random.SeedSequence([seed % 2 ** 32, shard_index])))
+
+    # the distinct distances in this shard, failed configs move from one to the next
+    steps = numpy.unique(distances)
+
+    generated_distances = []
+    generated_coordinates = []
+
+    pending = numpy.asarray(distances, dtype = float)
+
+    for retry_round in range(MAX_RETRY_ROUNDS + 1):
+
+        if len(pending) == 0:
+            break
+
+        # the first attempt at each config in the first round takes its orientations from the Sobol sequence, which is shifted
+        #   by the same seed-dependent amount in every shard so the shards are parts of one sequence
+        first_rotations = None
+
+        if orientation_sampler == "sobol" and retry_round == 0:
+            shift = numpy.random.SeedSequence(seed % 2 ** 32).generate_state(6)
+            first_rotations = get_sobol_rotation_matrices(numpy.arange(first_index, first_index + len(pending)), 2, shift)
+
+        # generate the pending configs, making 5 attempts at each
+        coordinates, successful = generate_2b_configuration_batch(random_state, coordinates1, coordinates2, pending, min_inter_distance, 5, return_successful = True, first_rotations = first_rotations)
+
+        generated_distances.append(pending[successful])
+        generated_coordinates.append(coordinates)
+
+        # move each failed config to the next larger distance in this shard, or keep it at the largest distance
+        failed = pending[~successful]
+        pending = steps[numpy.minimum(numpy.searchsorted(steps, failed, side = "right"), len(steps) - 1)]
+
+    if len(generated_coordinates) == 0:
+        return []
+
+    # sort the configs by distance, keeping the order they were generated in for each distance
+    order = numpy.argsort(numpy.concatenate(generated_distances), kind = "stable")
+    coordinates = numpy.concatenate(generated_coordinates)[order]
+
+    return [atom_template.format(*configuration.ravel().tolist()) for configuration in coordinates]
+
+def get_standard_coordinates(molecules):
+    """
+    Moves each molecule to its center of mass and rotates it on its principal axes, then stacks their coordinates into one array
+
+    Args:
+        molecules   - list of Molecules with the same atoms
+
+    Returns:
+        array of shape (number of molecules, number of atoms, 3)
+    """
+
+    for molecule in molecules:
+        molecule.move_to_center_of_mass()
+        molecule.rotate_on_principal_axes()
+
+    return numpy.array([molecule.get_coordinate_array() for molecule in molecules])
+
+def generate_2b_configuration_batch(random_state, coordinates1, coordinates2, distances, min_inter_distance, attempts, return_successful = False, first_rotations = None):
+    """
+    Generates many 2 body configurations at once
+
+    For each distance, picks a random geometry of each monomer, rotates each of them randomly about its center of mass, and separates their
+    centers of mass by the distance along x. If any intermolecular atom pair is closer than min_inter_distance, the rotations are drawn
+    again, up to attempts times. All the attempts of all the configurations are drawn and checked at once.
+
+    Args:
+        random_state - the numpy RandomState used to generate the configurations
+        coordinates1 - array of shape (number of geometries, number of atoms, 3) of the geometries of the 1st monomer in standard orientation
+        coordinates2 - array of shape (number of geometries, number of atoms, 3) of the geometries of the 2nd monomer in standard orientation
+        distances   - list of the distance between the centers of mass of the two monomers of each configuration
+        min_inter_distance - minimum distance for any inter-molecular atomic distance
+        attempts    - the number of configurations to try before giving up on each distance
+        return_successful - if True, also return which configurations were successful. Default is False.
+        first_rotations - array of shape (number of configurations, 2, 3, 3) of the rotation matrices of the two monomers in the first attempt at
+                each configuration, the other attempts are random. Default is None, which makes every attempt random.
+
+    Returns:
+        array of shape (number of successful configurations, number of atoms in both monomers, 3) of the coordinates of each configuration
+        whose attempts did not all fail, in the same order as distances. If return_successful is True, returns a tuple of this array and a
+        boolean array of whether each configuration was successful.
+    """
+
+    distances = numpy.asarray(distances, dtype = float)
+
+    # first select a random geometry for each monomer of each configuration
+    geometries1 = coordinates1[random_state.randint(len(coordinates1), size = len(distances))]
+    geometries2 = coordinates2[random_state.randint(len(coordinates2), size = len(distances))]
+
+    # rotate each monomer of each attempt a random amount, giving arrays of shape (configurations, attempts, atoms, 3)
+    rotations1 = get_random_rotation_matrices(random_state, (len(distances), attempts))
+    rotations2 = get_random_rotation_matrices(random_state, (len(distances), attempts))
+
+    if first_rotations is not None:
+        rotations1[:, 0] = first_rotations[:, 0]
+        rotations2[:, 0] = first_rotations[:, 1]
+
+    rotated1 = geometries1[:, numpy.newaxis] @ rotations1
+    rotated2 = geometries2[:, numpy.newaxis] @ rotations2
+
+    # move the 2nd monomer away from the first
+    rotated2[..., 0] += distances[:, numpy.newaxis, numpy.newaxis]
+
+    # squared distance of every intermolecular pair of atoms of every attempt, of shape (configurations, attempts, atoms1, atoms2)
+    squared_distances = ((rotated1[:, :, :, numpy.newaxis] - rotated2[:, :, numpy.newaxis]) ** 2).sum(axis = 4)
+
+    # an attempt is valid if its minimum intermolecular distance is greater than or equal to min_inter_distance
+    valid = squared_distances.min(axis = (2, 3)) >= min_inter_distance ** 2
+
+    # use the first valid attempt of each configuration, and skip those without one
+    successful = valid.any(axis = 1)
+    first_valid = valid.argmax(axis = 1)[successful]
+
+    coordinates = numpy.concatenate([rotated1[successful, first_valid], rotated2[successful, first_valid]], axis = 1)
+
+    if return_successful:
+        return coordinates, successful
+
+    return coordinates
 
 def move_to_config(random, molecule1, molecule2, distance, min_inter_distance, attempts):
     """
@@ -121,11 +316,7 @@ def move_to_config(random, molecule1, molecule2, distance, min_inter_distance, a
         molecule2.rotate(Quaternion.get_random_rotation_quaternion(random), distance, 0, 0)
 
         # calculate the minimum distance of any intermolecular interaction
-        closest_distance = min_inter_distance
-        for atom1 in molecule1.get_atoms():
-            for atom2 in molecule2.get_atoms():
-                if atom1.distance(atom2) < closest_distance:
-                    closest_distance = atom1.distance(atom2)
+        closest_distance = numpy.linalg.norm(molecule1.get_coordinate_array()[:, numpy.newaxis] - molecule2.get_coordinate_array(), axis = 2).min()
 
         # if the minimum intermolecular distance in this configuration is ngreater than or equal to min_inter_distance, then this is a valid configuration
         if closest_distance >= min_inter_distance:
@@ -1,8 +1,13 @@
-import random
-from potential_fitting.molecule import xyz_to_molecules
-from potential_fitting.utils import SettingsReader
+import math, random
+import concurrent.futures
 
-def split_configurations(settings_file, configurations_path, training_set_path, test_set_path, training_set_size, molecular_descriptor = None):
+import numpy
+
+from potential_fitting.exceptions import InvalidValueError, InconsistentValueError
+from potential_fitting.molecule import xyz_to_molecules, rmsd_many, get_distances
+from potential_fitting.utils import SettingsReader, constants
+
+def split_configurations(settings_file, configurations_path, training_set_path, test_set_path, training_set_size, molecular_descriptor = None, workers = 1):
     """
     Splits a set of configurations into a training set and a test set using furthest
     point sampling by some measure defined by the given molecular_descriptor
@@ -16,88 +21,70 @@ def split_configurations(settings_file, configurations_path, training_set_path,
         test_set_path - file path to the xyz file to write the test set to.
         training_set_size - the desired size of the training set, all other molecules will be put into the test set
         molecular_descriptor - the MolecularDescriptor used to measure the difference between two molecules.
+        workers - the number of processes to compute differences in. Default is 1, which computes them in this process.
+
+    Returns:
+        None
     """
 
     # if the user did not specify a molecular descriptor, use the RMSD descriptor    
     if molecular_descriptor is None:
         molecular_descriptor = RMSDDescriptor()
 
-    # parse the configurations into a list of [id, molecule]
-    molecules = list(enumerate(xyz_to_molecules(configurations_path, SettingsReader(settings_file))))
+    if workers < 1:
+        raise InvalidValueError("workers", workers, "1 or greater")
+
+    # parse the configurations
+    molecules = xyz_to_molecules(configurations_path, SettingsReader(settings_file))
 
     # move all molecules to their center of mass and rotate them on their principal axes
-    for index, molecule in molecules:
+    for molecule in molecules:
         molecule.move_to_center_of_mass()
         molecule.rotate_on_principal_axes()
 
-    # construct a matrix where the item at index [i, k] is the difference between the ith molecule and the kth molecule
-    # it starts empty, and will be filled in
-    difference_matrix = [[None for k in range(i + 1)] for i in range(len(molecules) - 1)]
-
-    # this array will hold the [id, molecule] pairs of the training set, those for the test set will be left in molecules
+    # the index in molecules of each molecule in the training set, in the order they were chosen
     training_set = []
 
-    # if training_set_size is at least 1, then move a random molecule from molecules to training_set
-    if training_set_size > 0:
-        first_train_set_molecule = random.choice(molecules)
-        molecules.remove(first_train_set_molecule)
-        training_set.append(first_train_set_molecule)
-
-    # loop once for every molecule to be added to the training_set
-    for i in range(training_set_size - 1):
-
-        # this array holds a list of the minimum differences to any element in the training set for each element in molecules
-        minimum_difference_to_train_set = []
-
-        # loop over each [id, molecule] pair still in molecules
-        for index, molecule in molecules:
-
-            # if the difference between this molecule and the first molecule in the training_set has not been calculated, calculate it.
-            if difference_matrix[index - 1][0] is None:
-                difference_matrix[index - 1][0] = molecular_descriptor.difference(molecule, training_set[0][1])
+    # whether each molecule has been moved to the training set
+    in_training_set = numpy.zeros(len(molecules), dtype = bool)
 
-            # initialize this molecule's entry in minimum_difference_to_train_set to the difference between this molecule and the first molecule in the training_set
-            minimum_difference_to_train_set.append(difference_matrix[index - 1][0])
+    # the minimum difference between each molecule and any molecule in the training set, updated every time a molecule is added to it
+    # this is all that furthest point sampling needs to remember, so memory use is linear in the number of molecules
+    minimum_difference_to_train_set = numpy.full(len(molecules), numpy.inf)
 
-        # loop over each [id, molecule] pair still in molecules
-        for molecule_index, index_molecule_pair in enumerate(molecules):
+    # if training_set_size is at least 1, then move a random molecule to the training_set
+    if training_set_size > 0 and len(molecules) > 0:
+        first_index = random.randrange(len(molecules))
+        training_set.append(first_index)
+        in_training_set[first_index] = True
 
-            # loop over each [id, molecule] pair in the training_set
-            for train_index_molecule_pair in training_set[1:]:
+    with DifferenceCalculator(molecules, molecular_descriptor, workers) as difference_calculator:
 
-                # sort the two ids of the molecules being compared so the smaller one goes into index2 and the larger into index1
-                index2, index1 = sorted([index_molecule_pair[0], train_index_molecule_pair[0]])
-                index1 -= 1
+        # loop once for every molecule to be added to the training_set
+        for i in range(min(training_set_size, len(molecules)) - 1):
 
-                # if the difference for this pair has not been computed, compute it
-                if difference_matrix[index1][index2] is None:
-                    difference_matrix[index1][index2] = molecular_descriptor.difference(index_molecule_pair[1], train_index_molecule_pair[1])
+            # indices of the molecules not yet in the training set
+            remaining = numpy.flatnonzero(~in_training_set)
 
-                # loop up the difference between the two molecules in the difference_matrix
-                difference = difference_matrix[index1][index2]
+            # only the differences to the molecule most recently added to the training set are new, so each round only compares
+            # one molecule to the remaining molecules
+            differences = difference_calculator.differences(training_set[-1], remaining)
 
-                # if this difference is less than the current minimum difference for this molecule, update the minimum difference
-                if difference < minimum_difference_to_train_set[molecule_index]:
-                    minimum_difference_to_train_set[molecule_index] = difference
+            minimum_difference_to_train_set[remaining] = numpy.minimum(minimum_difference_to_train_set[remaining], differences)
 
-        # this holds the index of the molecule with the largest minimum difference to the training_set
-        largest_min_difference_molecule_index = 0
+            # move the molecule furthest from the training set to the training set
+            furthest_index = remaining[numpy.argmax(minimum_difference_to_train_set[remaining])]
+            training_set.append(furthest_index)
+            in_training_set[furthest_index] = True
 
-        # loop over each molecule not yet in the training_set
-        for molecule_index in range(len(molecules)):
-
-            # if its minimum difference to the training_set is greater than the current furthest molecule's minimum difference to the training set, then this molecule becoms the new furthest molecule
-            if minimum_difference_to_train_set[molecule_index] > minimum_difference_to_train_set[largest_min_difference_molecule_index]:
-                largest_min_difference_molecule_index = molecule_index
-
-        # move the molecule furthest from the training set to the training set
-        train_set_molecule = molecules[largest_min_difference_molecule_index]
-        training_set.append(train_set_molecule)
-        molecules.remove(train_set_molecule)
+    # the test set is every molecule not in the training set, in the order they appear in the configurations file
+    test_set = numpy.flatnonzero(~in_training_set)
 
     with open(training_set_path, "w") as training_set_file:
 
-        for index, molecule in training_set:
+        for index in training_set:
+
+            molecule = molecules[index]
 
             # write number of atoms to training set file
             training_set_file.write("{}\n".format(molecule.get_num_atoms()))
@@ -110,7 +97,9 @@ def split_configurations(settings_file, configurations_path, training_set_path,
         
     with open(test_set_path, "w") as test_set_file:
 
-        for index, molecule in molecules:
+        for index in test_set:
+
+            molecule = molecules[index]
 
             # write number of atoms to test set file
             test_set_file.write("{}\n".format(molecule.get_num_atoms()))
@@ -121,18 +110,340 @@ def split_configurations(settings_file, configurations_path, training_set_path,
             # write geometry to test set file
             test_set_file.write("{}\n".format(molecule.to_xyz()))
 
+class DifferenceCalculator():
+    """
+    Computes the differences between one molecule and many others by some MolecularDescriptor, optionally in a pool of worker processes
+
+    If the descriptor is a FeatureDescriptor, the features of every molecule are computed once when the DifferenceCalculator is created.
+    """
+
+    def __init__(self, molecules, molecular_descriptor, workers = 1):
+        """
+        Creates a new DifferenceCalculator, starting its worker processes if workers is greater than 1
+
+        Args:
+            molecules   - the list of molecules to compute differences between
+            molecular_descriptor - the MolecularDescriptor used to measure the difference between two molecules
+            workers     - the number of processes to compute differences in. Default is 1, which computes them in this process.
+
+        Returns:
+            a new DifferenceCalculator object
+        """
+
+        self.molecules = molecules
+        self.molecular_descriptor = molecular_descriptor
+        self.workers = workers
+        self.executor = None
+
+        # matrix of the features of each molecule and their squared norms, None unless the descriptor is a FeatureDescriptor
+        self.features = None
+        self.squared_norms = None
+
+        if isinstance(molecular_descriptor, FeatureDescriptor) and len(molecules) > 0:
+            self.features = molecular_descriptor.get_features(molecules)
+            self.squared_norms = numpy.einsum("ij,ij->i", self.features, self.features)
+
+        # each worker receives a copy of this DifferenceCalculator once when it starts, so each round only sends it the indices of the molecules to compare
+        if workers > 1:
+            self.executor = concurrent.futures.ProcessPoolExecutor(max_workers = workers, initializer = init_worker, initargs = (self,))
+
+    def __getstate__(self):
+
+        # the copies sent to the workers do not need the executor, nor the molecules if they have the features
+        state = self.__dict__.copy()
+        state["executor"] = None
+
+        if self.features is not None:
+            state["molecules"] = None
+
+        return state
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Shuts down the worker processes, if there are any
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def differences(self, index, other_indices):
+        """
+        Computes the differences between one molecule and many others
+
+        Args:
+            index       - the index of the molecule to compare to the others
+            other_indices - array of the indices of the molecules to compare it to
+
+        Returns:
+            array of the difference between the molecule and each of the others
+        """
+
+        if self.executor is None:
+            return self.calculate_differences(index, other_indices)
+
+        # split the other molecules evenly between the workers
+        futures = [self.executor.submit(calculate_differences, index, chunk) for chunk in numpy.array_split(other_indices, self.workers)]
+
+        return numpy.concatenate([future.result() for future in futures])
+
+    def calculate_differences(self, index, other_indices):
+        """
+        Computes the differences between one molecule and many others in this process
+
+        Args:
+            index       - the index of the molecule to compare to the others
+            other_indices - array of the indices of the molecules to compare it to
+
+        Returns:
+            array of the difference between the molecule and each of the others
+        """
+
+        if self.features is not None:
+            return self.molecular_descriptor.compare_features(self.features[index], self.features[other_indices], self.squared_norms[other_indices])
+
+        return self.molecular_descriptor.differences(self.molecules[index], [self.molecules[other_index] for other_index in other_indices])
+
+# DifferenceCalculator used by calculate_differences() in each worker process, set by init_worker()
+worker_calculator = None
+
+def init_worker(difference_calculator):
+    """
+    Initializes a worker process of a DifferenceCalculator
+
+    Args:
+        difference_calculator - copy of the DifferenceCalculator that started this worker
+
+    Returns:
+        None
+    """
+
+    global worker_calculator
+
+    worker_calculator = difference_calculator
+
+def calculate_differences(index, other_indices):
+    """
+    Computes the differences between one molecule and many others in a worker process of a DifferenceCalculator
+
+    Args:
+        index       - the index of the molecule to compare to the others
+        other_indices - array of the indices of the molecules to compare it to
+
+    Returns:
+        array of the difference between the molecule and each of the others
+    """
+
+    return worker_calculator.calculate_differences(index, other_indices)
+
+def feature_differences(feature, features, squared_norms = None):
+    """
+    Computes the euclidean distances between one feature vector and each row of a feature matrix
+
+    Args:
+        feature     - the feature vector to compare to the others
+        features    - matrix whose rows are the feature vectors to compare it to
+        squared_norms - the squared norm of each row of features, computed if not given
+
+    Returns:
+        array of the distance between feature and each row of features
+    """
+
+    if squared_norms is None:
+        squared_norms = numpy.einsum("ij,ij->i", features, features)
+
+    # |a - b|^2 = |a|^2 - 2 a.b + |b|^2, so all the dot products are a single matrix-vector product
+    squared_distances = squared_norms - 2 * (features @ feature) + feature @ feature
+
+    # rounding can make the squared distance between nearly identical features slightly negative
+    return numpy.sqrt(numpy.maximum(squared_distances, 0))
+
+def get_coordinate_arrays(molecules):
+    """
+    Stacks the coordinates of many molecules with the same number of atoms into one array
+
+    Args:
+        molecules   - the list of molecules
+
+    Returns:
+        array of shape (number of molecules, number of atoms, 3)
+    """
+
+    num_atoms = molecules[0].get_num_atoms()
+
+    for molecule in molecules:
+        if molecule.get_num_atoms() != num_atoms:
+            raise InconsistentValueError("number of atoms in first molecule", "number of atoms in other molecule", num_atoms, molecule.get_num_atoms(), "number of atoms in each molecule must be the same, make sure you are comparing molecules with the same atoms and fragments")
+
+    return numpy.array([molecule.get_coordinate_array() for molecule in molecules])
+
 class MolecularDescriptor():
-    def difference(molecule1, molecule2):
+    def difference(self, molecule1, molecule2):
+        raise NotImplementedError
+
+    def differences(self, molecule, other_molecules):
+        """
+        Computes the difference between one molecule and each of many others
+
+        Args:
+            molecule    - the molecule to compare to the others
+            other_molecules - list of the molecules to compare it to
+
+        Returns:
+            array of the difference between molecule and each of other_molecules
+        """
+
+        return numpy.array([self.difference(molecule, other_molecule) for other_molecule in other_molecules], dtype = float)
+
+class FeatureDescriptor(MolecularDescriptor):
+    """
+    A MolecularDescriptor that describes each molecule by a vector of features, the difference between two molecules is
+    the euclidean distance between their features
+
+    The features of all the molecules are computed at once by get_features(), so each one-to-many comparison is a single matrix-vector product.
+    """
+
+    def get_features(self, molecules):
+        """
+        Computes the features of many molecules
+
+        Args:
+            molecules   - the list of molecules
+
+        Returns:
+            matrix whose rows are the features of each molecule
+        """
+
         raise NotImplementedError
 
-class RMSDDescriptor(MolecularDescriptor):
+    def compare_features(self, feature, features, squared_norms = None):
+        """
+        Computes the differences between the molecule with one feature vector and the molecules with each row of a feature matrix
+
+        Args:
+            feature     - the features of the molecule to compare to the others
+            features    - matrix whose rows are the features of the molecules to compare it to
+            squared_norms - the squared norm of each row of features, computed if not given
+
+        Returns:
+            array of the difference between the molecule and each of the others
+        """
+
+        return feature_differences(feature, features, squared_norms)
+
+    def difference(self, molecule1, molecule2):
+        return self.differences(molecule1, [molecule2])[0]
+
+    def differences(self, molecule, other_molecules):
+        features = self.get_features([molecule] + list(other_molecules))
+
+        return self.compare_features(features[0], features[1:])
+
+class RMSDDescriptor(FeatureDescriptor):
+    """
+    The RMSD between the positions of the atoms in two molecules, same as Molecule.rmsd()
+
+    The features are the flattened coordinates. Unless align is True, they are scaled so their distance is the RMSD.
+    """
+
+    def __init__(self, align = False):
+        """
+        Creates a new RMSDDescriptor
+
+        Args:
+            align   - if True, each pair of molecules is optimally superimposed by the Kabsch algorithm before computing their RMSD,
+                    instead of relying on their principal axes. Default is False.
+
+        Returns:
+            a new RMSDDescriptor object
+        """
+
+        self.align = align
+
     def difference(self, molecule1, molecule2):
-        return molecule1.rmsd(molecule2)
+        return molecule1.rmsd(molecule2, self.align)
+
+    def get_features(self, molecules):
+        coordinates = get_coordinate_arrays(molecules)
+
+        if self.align:
+            return coordinates.reshape(len(molecules), -1)
+
+        return coordinates.reshape(len(molecules), -1) / math.sqrt(coordinates.shape[1])
+
+    def compare_features(self, feature, features, squared_norms = None):
+
+        # aligned RMSDs are not distances between fixed vectors, so the features are turned back into coordinates and superimposed
+        if self.align:
+            return rmsd_many(feature.reshape(-1, 3), features.reshape(len(features), -1, 3), align = True)
+
+        return feature_differences(feature, features, squared_norms)
+
+class RMSDDistanceDescriptor(FeatureDescriptor):
+    """
+    The RMSD of the interatomic distances in two molecules, same as Molecule.distancermsd()
+
+    The features are the distance between every pair of atoms, scaled so their distance is the RMSD.
+    """
 
-class RMSDDistanceDescriptor(MolecularDescriptor):
     def difference(self, molecule1, molecule2):
         return molecule1.distancermsd(molecule2)
 
+    def differences(self, molecule, other_molecules):
+        return molecule.distancermsd_many(other_molecules)
+
+    def get_features(self, molecules):
+        coordinates = get_coordinate_arrays(molecules)
+
+        return get_distances(coordinates) / math.sqrt(coordinates.shape[1])
+
+class SortedDistanceDescriptor(FeatureDescriptor):
+    """
+    The RMSD between the sorted interatomic distances of two molecules
+
+    Unlike RMSDDistanceDescriptor, this does not change if the atoms are permuted.
+    """
+
+    def get_features(self, molecules):
+        distances = numpy.sort(get_distances(get_coordinate_arrays(molecules)), axis = 1)
+
+        return distances / math.sqrt(max(1, distances.shape[1]))
+
+class CoulombMatrixDescriptor(FeatureDescriptor):
+    """
+    The euclidean distance between the sorted eigenvalues of the Coulomb matrices of two molecules
+
+    The Coulomb matrix has 0.5 * Z^2.4 on its diagonal and Z_i * Z_j / r_ij elsewhere, with distances in bohr. Its eigenvalues
+    do not change if the molecule is translated, rotated, or its atoms are permuted.
+    """
+
+    def get_features(self, molecules):
+        coordinates = get_coordinate_arrays(molecules) * constants.ang_to_bohr
+        atomic_numbers = numpy.array([atom.get_number() for atom in molecules[0].get_atoms()], dtype = float)
+
+        # distance between every pair of atoms, the diagonal is set to 1 to avoid dividing by 0 and then replaced
+        distances = numpy.linalg.norm(coordinates[:, :, numpy.newaxis] - coordinates[:, numpy.newaxis, :], axis = 3)
+        diagonal = numpy.arange(coordinates.shape[1])
+        distances[:, diagonal, diagonal] = 1
+
+        coulomb_matrices = numpy.outer(atomic_numbers, atomic_numbers) / distances
+        coulomb_matrices[:, diagonal, diagonal] = 0.5 * atomic_numbers ** 2.4
+
+        # eigenvalues of every molecule at once, sorted largest first
+        return numpy.linalg.eigvalsh(coulomb_matrices)[:, ::-1]
+
 class RandomDescriptor(MolecularDescriptor):
     def difference(self, molecule1, molecule2):
         return random.random()
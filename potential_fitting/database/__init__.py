@@ -1,7 +1,7 @@
 from .database import Database
 from .database_cleaner import clean_database
 from .database_filler import fill_database
-from .database_initializer import initialize_database
+from .database_initializer import initialize_database, add_molecules_to_database
 from .database_job_maker import make_all_jobs, make_job, write_job
 from .database_job_reader import read_job
 from .training_set_generator import generate_1b_training_set, generate_2b_training_set
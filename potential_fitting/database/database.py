@@ -1,22 +1,54 @@
 """
 Contains the Database class, used to read and write to a database
 """
-import itertools, datetime
+import itertools, datetime, os, socket, time, collections
 import sqlite3
 from potential_fitting.molecule import Atom, Fragment, Molecule
 from potential_fitting.exceptions import InconsistentDatabaseError, InvalidValueError
 
+# version of the schema created by Database.create(), stored in the user_version pragma of the database file.
+# Databases with an older version are upgraded by Database.upgrade() when they are opened.
+SCHEMA_VERSION = 4
+
+# maximum number of molecules reconstructed by a single pair of queries in get_molecules()
+MOLECULE_BATCH_SIZE = 500
+
+# default number of reconstructed molecules kept in memory by each Database, see get_molecules()
+MOLECULE_CACHE_SIZE = 1024
+
+# maximum number of molecules inserted in a single transaction by add_calculations()
+INSERT_BATCH_SIZE = 10000
+
+# number of seconds a worker may hold a job it has claimed before the job is considered abandoned, unless the worker sends a heartbeat
+LEASE_TIME = 24 * 60 * 60
+
+# number of seconds to wait for another process to release its lock on the database before giving up
+DATABASE_TIMEOUT = 600
+
+# by default, changes made by set_energy() and set_failed() are committed after this many writes or this many seconds, whichever comes first
+COMMIT_WRITES = 100
+COMMIT_SECONDS = 30
+
+# size of the page cache of each connection in kibibytes
+CACHE_SIZE = 64 * 1024
+
 class Database():
     """
     Database class. Allows one to access a database and perform operations on it.
     """
     
-    def __init__(self, file_name):
+    def __init__(self, file_name, commit_writes = COMMIT_WRITES, commit_seconds = COMMIT_SECONDS, wal = True, molecule_cache_size = MOLECULE_CACHE_SIZE):
         """
         Initializer, sets up connection, and cursor
 
         Args:
             file_name   - path to the database file
+            commit_writes - commit changes after this many calls to set_energy() or set_failed(), default is COMMIT_WRITES
+            commit_seconds - commit changes when set_energy() or set_failed() is called this many seconds after the last commit, default is COMMIT_SECONDS
+            wal         - if True, the database is put in write-ahead-log mode, which lets other processes read from the database
+                    while this one is writing to it. Should be False for databases on network file systems, which do not support it. Default is True.
+            molecule_cache_size - the number of recently used molecules to keep in memory instead of reconstructing them from the database,
+                    default is MOLECULE_CACHE_SIZE. 0 disables the cache.
 
         Returns:
             a new Database object
@@ -25,9 +57,13 @@ class Database():
         if file_name[-3:] != ".db":
             print("Automatically ending '.db' suffix to database name {}.".format(file_name))
             file_name += ".db"
+
+        # save the file name so that we can include it in error messages
+        self.file_name = file_name
         
         # connection is used to get the cursor, commit to the database, and close the database
-        self.connection = sqlite3.connect(file_name)
+        # many processes may use the same database at once, so wait for them to release their locks instead of failing
+        self.connection = sqlite3.connect(file_name, timeout = DATABASE_TIMEOUT)
         
         # the cursor is used to execute operations on the database
         self.cursor = self.connection.cursor()
@@ -38,6 +74,36 @@ class Database():
         except:
             self.close()
             raise InconsistentDatabaseError(file_name, "File exists but is not a valid database file.") from None
+
+        # in WAL mode readers are not blocked by writers, and a commit does not need to wait for the data to reach the disk
+        if wal:
+            self.cursor.execute("PRAGMA journal_mode=WAL")
+            self.cursor.execute("PRAGMA synchronous=NORMAL")
+
+        # a negative cache size is in kibibytes rather than pages
+        self.cursor.execute("PRAGMA cache_size=-{}".format(CACHE_SIZE))
+
+        # commit policy for set_energy() and set_failed(), see autosave()
+        self.commit_writes = commit_writes
+        self.commit_seconds = commit_seconds
+
+        # number of writes since the last commit, and time of the last commit
+        self.uncommitted_writes = 0
+        self.last_commit = time.time()
+
+        # least recently used cache of molecules reconstructed by get_molecules(), from molecule id to Molecule
+        self.molecule_cache = collections.OrderedDict()
+        self.molecule_cache_size = molecule_cache_size
+
+        # the default id of the worker that claims jobs through this Database, unique to this process
+        self.worker = "{}:{}".format(socket.gethostname(), os.getpid())
+
+        # bring databases made by older versions of this code up to date
+        try:
+            self.upgrade()
+        except:
+            self.close()
+            raise
     
 
     # the __enter__() and __exit__() methods define a database as a context manager, meaning you can use with ... as ... syntax on it
@@ -65,6 +131,26 @@ class Database():
 
         self.connection.commit()
 
+        self.uncommitted_writes = 0
+        self.last_commit = time.time()
+
+    def autosave(self):
+        """
+        Records that a change was made to the database, and saves the changes if commit_writes changes
+        have been made or commit_seconds have passed since the last save.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        self.uncommitted_writes += 1
+
+        if self.uncommitted_writes >= self.commit_writes or time.time() - self.last_commit >= self.commit_seconds:
+            self.save()
+
     def close(self):
         """
         Close the database.
@@ -135,10 +221,159 @@ class Database():
         # create the Jobs table
         self.cursor.execute(
             """
-            CREATE TABLE IF NOT EXISTS Jobs(status TEXT, log_file TEXT, start_date TEXT, end_date TEXT)
+            CREATE TABLE IF NOT EXISTS Jobs(status TEXT, log_file TEXT, start_date TEXT, end_date TEXT, worker TEXT, lease_expiry REAL)
+            """
+        )
+
+        # create the Summaries table, which holds the number of jobs with each status of every calculation
+        self.cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS Summaries(calculation_id INTEGER PRIMARY KEY, pending INT, running INT, completed INT, failed INT)
+            """
+        )
+
+        # create the indexes used to look up calculations, energies, and jobs
+        self.create_indexes()
+
+        # create the triggers that keep the Summaries table up to date
+        self.create_triggers()
+
+        # a newly created database is always at the current schema version
+        self.cursor.execute("PRAGMA user_version={}".format(SCHEMA_VERSION))
+
+    def create_indexes(self):
+        """
+        Creates the indexes on the tables in the database, if they do not exist
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        # used to find a molecule by its name and hash, no molecule may be in the table twice
+        self.cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS molecules_index ON Molecules(name, hash)")
+
+        # used to find the calculations of a molecule with a given model, tag, and optimized flag, no calculation may be in the table twice
+        self.cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS calculations_index ON Calculations(molecule_id, model_id, tag, optimized)")
+
+        # used to find the energies of a calculation
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS energies_calculation_index ON Energies(calculation_id)")
+
+        # used to find the energy of a job
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS energies_job_index ON Energies(job_id)")
+
+        # used to find jobs with a given status
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS jobs_status_index ON Jobs(status)")
+
+        # used to find the fragments of a molecule
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS fragments_index ON Fragments(molecule_id)")
+
+        # used to find the atoms of a fragment
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS atoms_index ON Atoms(fragment_id)")
+
+    def create_triggers(self):
+        """
+        Creates the triggers that keep the Summaries table up to date as energies are added and the statuses of jobs change, if they do not exist
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        # count the job of each new energy towards its calculation
+        self.cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS energies_insert_trigger AFTER INSERT ON Energies
+            BEGIN
+                INSERT OR IGNORE INTO Summaries (calculation_id, pending, running, completed, failed) VALUES (NEW.calculation_id, 0, 0, 0, 0);
+                UPDATE Summaries SET pending=pending+((SELECT status FROM Jobs WHERE ROWID=NEW.job_id)='pending'), running=running+((SELECT status FROM Jobs WHERE ROWID=NEW.job_id)='running'),
+                        completed=completed+((SELECT status FROM Jobs WHERE ROWID=NEW.job_id)='completed'), failed=failed+((SELECT status FROM Jobs WHERE ROWID=NEW.job_id)='failed')
+                    WHERE calculation_id=NEW.calculation_id;
+            END
             """
         )
 
+        # move the job from its old status to its new one in the counts of its calculation
+        self.cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS jobs_status_trigger AFTER UPDATE OF status ON Jobs WHEN OLD.status IS NOT NEW.status
+            BEGIN
+                UPDATE Summaries SET pending=pending+(NEW.status='pending')-(OLD.status='pending'), running=running+(NEW.status='running')-(OLD.status='running'),
+                        completed=completed+(NEW.status='completed')-(OLD.status='completed'), failed=failed+(NEW.status='failed')-(OLD.status='failed')
+                    WHERE calculation_id=(SELECT calculation_id FROM Energies WHERE job_id=NEW.ROWID);
+            END
+            """
+        )
+
+    def upgrade(self):
+        """
+        Upgrades a database made by an older version of this code to the current schema version.
+
+        Does nothing if the database is already up to date, or if its tables have not been created yet.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        if self.cursor.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+
+        # if the tables do not exist yet, then create() will make them with the current schema
+        if not self.cursor.execute("SELECT EXISTS(SELECT * FROM sqlite_master WHERE type='table' AND name='Calculations')").fetchone()[0]:
+            return
+
+        # the whole upgrade, including the new version, is one transaction, so a database is never left half upgraded. BEGIN IMMEDIATE
+        # takes the write lock, so if another process upgraded the database first, its version is read again after it is done.
+        self.save()
+        self.cursor.execute("BEGIN IMMEDIATE")
+
+        try:
+            version = self.cursor.execute("PRAGMA user_version").fetchone()[0]
+
+            # the indexes on Molecules and Calculations are unique, so creating them fails if the database has duplicate rows
+            try:
+                # version 1 added indexes to all tables
+                if version < 1:
+                    self.create_indexes()
+
+                # version 2 added the worker and lease expiry of running jobs
+                if version < 2:
+                    self.cursor.execute("ALTER TABLE Jobs ADD COLUMN worker TEXT")
+                    self.cursor.execute("ALTER TABLE Jobs ADD COLUMN lease_expiry REAL")
+
+                # version 3 made the indexes on Molecules and Calculations unique
+                if version < 3:
+                    self.cursor.execute("DROP INDEX IF EXISTS calculations_index")
+                    self.create_indexes()
+
+            except sqlite3.IntegrityError as e:
+                raise InconsistentDatabaseError(self.file_name, "Duplicate molecules or calculations: {}".format(e)) from None
+
+            # version 4 added the Summaries table and the triggers that maintain it
+            if version < 4:
+                self.cursor.execute("CREATE TABLE IF NOT EXISTS Summaries(calculation_id INTEGER PRIMARY KEY, pending INT, running INT, completed INT, failed INT)")
+                self.cursor.execute("DELETE FROM Summaries")
+                self.cursor.execute("""INSERT INTO Summaries (calculation_id, pending, running, completed, failed)
+                        SELECT Energies.calculation_id, SUM(Jobs.status='pending'), SUM(Jobs.status='running'), SUM(Jobs.status='completed'), SUM(Jobs.status='failed')
+                        FROM Energies JOIN Jobs ON Jobs.ROWID=Energies.job_id GROUP BY Energies.calculation_id""")
+                self.create_triggers()
+
+            if version < SCHEMA_VERSION:
+                self.cursor.execute("PRAGMA user_version={}".format(SCHEMA_VERSION))
+
+            self.save()
+
+        except:
+            self.connection.rollback()
+            raise
+
     def add_calculation(self, molecule, method, basis, cp, tag, optimized):
         """
         Add a calculation to the database.
@@ -218,64 +453,361 @@ class Database():
                 # insert row into Energies table for this energy
                 self.cursor.execute("INSERT INTO Energies (calculation_id, energy_index, job_id) VALUES (?, ?, ?)", (calculation_id, energy_index, job_id))
 
+    def add_calculations(self, calculations):
+        """
+        Adds many calculations to the database at once.
+
+        Equivalent to calling add_calculation() on each calculation, but looks up models and molecules in memory and inserts
+        rows in bulk, committing once every INSERT_BATCH_SIZE calculations.
+
+        Args:
+            calculations - iterable of (molecule, method, basis, cp, tag, optimized) tuples, see add_calculation()
+
+        Returns:
+            the number of calculations that were added, not counting those already in the database
+        """
+
+        # commit any changes so that they are not part of the transactions below
+        self.save()
+
+        # map from (name, hash) to the id of each molecule, updated at the start of every transaction below
+        molecule_ids = {}
+
+        # the largest id in molecule_ids, molecules are never deleted so only those with larger ids need to be read in later transactions
+        last_molecule_id = 0
+
+        # the calculations committed by this call, which are not looked up in the database again
+        new_calculations = set()
+
+        calculations = iter(calculations)
+
+        number_added = 0
+
+        while True:
+            batch = list(itertools.islice(calculations, INSERT_BATCH_SIZE))
+
+            if len(batch) == 0:
+                return number_added
+
+            # BEGIN IMMEDIATE takes the write lock, so no other connection can insert rows with the ids given out below
+            self.cursor.execute("BEGIN IMMEDIATE")
+
+            # ids of the molecules that have been added by this transaction, these cannot have calculations in the database yet
+            new_molecule_ids = set()
+
+            # the calculations added by this transaction
+            batch_calculations = set()
+
+            try:
+                # other connections may have added models and molecules since the last transaction, so the maps are read inside each one.
+                # map from (method, basis, cp) to the id of each model
+                model_ids = {(method, basis, cp): model_id for model_id, method, basis, cp in self.cursor.execute("SELECT ROWID, method, basis, cp FROM Models").fetchall()}
+
+                for molecule_id, name, molecule_hash in self.cursor.execute("SELECT ROWID, name, hash FROM Molecules WHERE ROWID>? ORDER BY ROWID", (last_molecule_id,)).fetchall():
+                    molecule_ids[(name, molecule_hash)] = last_molecule_id = molecule_id
+
+                # the next free id in each table, rows are inserted with explicit ids so that executemany() can be used
+                next_molecule_id, next_fragment_id, next_calculation_id, next_job_id = [self.cursor.execute("SELECT IFNULL(MAX(ROWID), 0) + 1 FROM {}".format(table)).fetchone()[0] for table in ["Molecules", "Fragments", "Calculations", "Jobs"]]
+
+                # rows to insert into each table
+                molecule_rows = []
+                fragment_rows = []
+                atom_rows = []
+                calculation_rows = []
+                job_rows = []
+                energy_rows = []
+
+                for molecule, method, basis, cp, tag, optimized in batch:
+
+                    # get the id of this model, creating an entry in the Models table if it is not already there
+                    try:
+                        model_id = model_ids[(method, basis, cp)]
+                    except KeyError:
+                        self.cursor.execute("INSERT INTO Models (method, basis, cp) VALUES (?, ?, ?)", (method, basis, cp))
+                        model_id = model_ids[(method, basis, cp)] = self.cursor.lastrowid
+
+                    molecule_key = (molecule.get_name(), molecule.get_SHA1())
+
+                    # get the id of this molecule, adding it and its fragments and atoms if it is not already in the database
+                    try:
+                        molecule_id = molecule_ids[molecule_key]
+                    except KeyError:
+                        molecule_id = molecule_ids[molecule_key] = next_molecule_id
+                        next_molecule_id += 1
+
+                        new_molecule_ids.add(molecule_id)
+
+                        molecule_rows.append((molecule_id,) + molecule_key)
+
+                        for fragment in molecule.get_fragments():
+                            fragment_rows.append((next_fragment_id, molecule_id, fragment.get_name(), fragment.get_charge(), fragment.get_spin_multiplicity()))
+
+                            for atom in fragment.get_atoms():
+                                atom_rows.append((next_fragment_id, atom.get_name(), atom.get_symmetry_class(), atom.get_x(), atom.get_y(), atom.get_z()))
+
+                            next_fragment_id += 1
+
+                    calculation_key = (molecule_id, model_id, tag, optimized)
+
+                    # skip this calculation if it was already added
+                    if calculation_key in new_calculations or calculation_key in batch_calculations:
+                        continue
+
+                    # molecules that were not added by this transaction may already have this calculation in the database
+                    if molecule_id not in new_molecule_ids and self.cursor.execute("SELECT EXISTS(SELECT * FROM Calculations WHERE molecule_id=? AND model_id=? AND tag=? AND optimized=?)", calculation_key).fetchone()[0]:
+                        continue
+
+                    batch_calculations.add(calculation_key)
+
+                    calculation_rows.append((next_calculation_id,) + calculation_key)
+
+                    # add a job and an energy for every energy of this calculation
+                    for energy_index in range(number_of_energies(molecule.get_num_fragments(), cp)):
+                        job_rows.append((next_job_id, "pending"))
+                        energy_rows.append((next_calculation_id, energy_index, next_job_id))
+                        next_job_id += 1
+
+                    next_calculation_id += 1
+
+                self.cursor.executemany("INSERT INTO Molecules (ROWID, name, hash) VALUES (?, ?, ?)", molecule_rows)
+                self.cursor.executemany("INSERT INTO Fragments (ROWID, molecule_id, name, charge, spin) VALUES (?, ?, ?, ?, ?)", fragment_rows)
+                self.cursor.executemany("INSERT INTO Atoms (fragment_id, symbol, symmetry_class, x, y, z) VALUES (?, ?, ?, ?, ?, ?)", atom_rows)
+                self.cursor.executemany("INSERT INTO Calculations (ROWID, molecule_id, model_id, tag, optimized) VALUES (?, ?, ?, ?, ?)", calculation_rows)
+                self.cursor.executemany("INSERT INTO Jobs (ROWID, status) VALUES (?, ?)", job_rows)
+                self.cursor.executemany("INSERT INTO Energies (calculation_id, energy_index, job_id) VALUES (?, ?, ?)", energy_rows)
+
+                self.save()
+
+            except:
+                self.connection.rollback()
+
+                # the molecules added by this transaction are no longer in the database
+                for molecule_key in [molecule_key for molecule_key, molecule_id in molecule_ids.items() if molecule_id in new_molecule_ids]:
+                    del molecule_ids[molecule_key]
+
+                raise
+
+            new_calculations.update(batch_calculations)
+
+            number_added += len(calculation_rows)
+
     def get_missing_energy(self):
         """
         Returns a single Job object, which contains the info a user needs to calculate an energy missing in the table.
 
+        The job is claimed by this Database's worker, see claim_jobs().
+
         The user should calculate the energy, then call either set_energy() or set_failed()
 
         Args:
             None
 
         Returns:
-            A Job object describing the calculation to be performed
+            A Job object describing the calculation to be performed, or None if there are no pending jobs
         """
 
-        # retrieve a pending job from the Jobs table
-        try:
-            job_id = self.cursor.execute("SELECT ROWID FROM Jobs WHERE status=?", ("pending",)).fetchone()[0]
-        except TypeError:
-            # this error will be thrown if there are no more energies to calculate, because None[0] throws a TypeError
+        jobs = self.claim_jobs(1)
+
+        if len(jobs) == 0:
             return None
-        
-        # retrieve the calculation and energy to be calculated for this job from the Energies table
-        calculation_id, energy_index = self.cursor.execute("SELECT calculation_id, energy_index FROM Energies WHERE job_id=?", (job_id,)).fetchone()
 
-        # retrieve the molecule and model from the Calculations table
-        molecule_id, model_id, tag, optimized = self.cursor.execute("SELECT molecule_id, model_id, tag, optimized FROM Calculations WHERE ROWID=?", (calculation_id,)).fetchone()
+        return jobs[0]
 
-        # retrieve the method, basis, and cp for this model
-        method, basis, cp = self.cursor.execute("SELECT method, basis, cp FROM Models WHERE ROWID=?", (model_id,)).fetchone()
+    def claim_jobs(self, number_of_jobs, worker = None, lease_time = LEASE_TIME):
+        """
+        Atomically claims up to number_of_jobs pending jobs for a worker.
 
-        # Reconstruct the molecule from the information in this database
-        molecule = self.get_molecule(molecule_id)
+        The jobs are selected and marked as running in a single transaction, so no two workers using the same database file can claim the same job.
 
-        # get the indicies of the fragments to include in this calculation
-        fragment_indicies = energy_index_to_fragment_indicies(energy_index, molecule.get_num_fragments(), True if cp == 1 else False)
+        Each claimed job is leased to the worker for lease_time seconds. Workers that take longer than this should call heartbeat()
+        to extend their leases, otherwise clean() will give their jobs to other workers.
 
-        # update the job with its start date and running status
-        self.cursor.execute("UPDATE Jobs SET status=?, start_date=? WHERE ROWID=?", ("running", datetime.datetime.today().strftime('%Y/%m/%d'), job_id))
-        
-        return Job(molecule, method, basis, True if cp == 1 and energy_index < number_of_energies(molecule.get_num_fragments(), False) else False, fragment_indicies, job_id)
+        The user should calculate the energy of each job, then call either set_energy() or set_failed()
+
+        Args:
+            number_of_jobs - the maximum number of jobs to claim
+            worker      - the id of the worker claiming the jobs, default is this Database's worker
+            lease_time  - the number of seconds the worker may hold the jobs without a heartbeat, default is LEASE_TIME
 
-    def missing_energies(self):
+        Returns:
+            A list of Job objects describing the calculations to be performed, empty if there are no pending jobs
+        """
+
+        if worker is None:
+            worker = self.worker
+
+        # commit any changes so that they are not part of the transaction below
+        self.save()
+
+        # BEGIN IMMEDIATE takes the write lock before reading, so no other connection can claim jobs until this transaction is over
+        self.cursor.execute("BEGIN IMMEDIATE")
+
+        try:
+            # retrieve pending jobs from the Jobs table
+            job_ids = [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT ROWID FROM Jobs WHERE status=? LIMIT ?", ("pending", number_of_jobs)).fetchall()]
+
+            # update the jobs with their start date, running status, and lease
+            self.cursor.executemany("UPDATE Jobs SET status=?, start_date=?, worker=?, lease_expiry=? WHERE ROWID=?",
+                    [("running", datetime.datetime.today().strftime('%Y/%m/%d'), worker, time.time() + lease_time, job_id) for job_id in job_ids])
+
+            self.save()
+
+        except:
+            self.connection.rollback()
+            raise
+
+        return self.get_jobs(job_ids)
+
+    def heartbeat(self, worker = None, lease_time = LEASE_TIME):
+        """
+        Extends the leases of all running jobs claimed by a worker, so they will not be reclaimed by clean()
+
+        Args:
+            worker      - the id of the worker whose jobs should be extended, default is this Database's worker
+            lease_time  - the number of seconds from now that the worker may hold the jobs without another heartbeat, default is LEASE_TIME
+
+        Returns:
+            the number of jobs whose leases were extended
+        """
+
+        if worker is None:
+            worker = self.worker
+
+        self.cursor.execute("UPDATE Jobs SET lease_expiry=? WHERE status=? AND worker=?", (time.time() + lease_time, "running", worker))
+
+        extended = self.cursor.rowcount
+
+        # commit right away, otherwise this connection would hold the write lock and other workers could not claim jobs
+        self.save()
+
+        return extended
+
+    def release_jobs(self, job_ids):
+        """
+        Sets jobs that are still "running" back to "pending", so they can be claimed again without waiting for their leases to expire
+
+        Args:
+            job_ids - the ids of the jobs to release
+
+        Returns:
+            the number of jobs that were set to "pending"
+        """
+
+        job_ids = list(job_ids)
+
+        released = 0
+
+        # split the ids into batches so that queries do not exceed the limit on the number of parameters in sqlite
+        for batch_start in range(0, len(job_ids), MOLECULE_BATCH_SIZE):
+            batch = job_ids[batch_start:batch_start + MOLECULE_BATCH_SIZE]
+
+            self.cursor.execute("UPDATE Jobs SET status=?, worker=NULL, lease_expiry=NULL WHERE status=? AND ROWID IN ({})".format(
+                    ",".join("?" for job_id in batch)), ["pending", "running"] + batch)
+
+            released += self.cursor.rowcount
+
+        self.save()
+
+        return released
+
+    def get_job(self, job_id):
+        """
+        Returns the Job object with the information needed to calculate the energy of a job
+
+        Args:
+            job_id  - the id of the job
+
+        Returns:
+            A Job object describing the calculation to be performed
+        """
+
+        return self.get_jobs([job_id])[0]
+
+    def get_jobs(self, job_ids):
+        """
+        Returns the Job objects with the information needed to calculate the energies of many jobs at once
+
+        Reads the calculations and models of every MOLECULE_BATCH_SIZE jobs in a single query, and reconstructs their molecules with get_molecules().
+
+        Args:
+            job_ids - the ids of the jobs
+
+        Returns:
+            A list of Job objects describing the calculations to be performed, in the same order as job_ids
+        """
+
+        job_ids = list(job_ids)
+
+        # map from job id to (molecule_id, energy_index, method, basis, cp)
+        job_rows = {}
+
+        # split the ids into batches so that queries do not exceed the limit on the number of parameters in sqlite
+        for batch_start in range(0, len(job_ids), MOLECULE_BATCH_SIZE):
+            batch = job_ids[batch_start:batch_start + MOLECULE_BATCH_SIZE]
+
+            # retrieve the energy to be calculated, and the molecule and model of its calculation
+            for job_id, *row in self.cursor.execute(
+                    """
+                    SELECT Energies.job_id, Calculations.molecule_id, Energies.energy_index, Models.method, Models.basis, Models.cp
+                    FROM Energies
+                    JOIN Calculations ON Calculations.ROWID=Energies.calculation_id
+                    JOIN Models ON Models.ROWID=Calculations.model_id
+                    WHERE Energies.job_id IN ({})
+                    """.format(",".join("?" for job_id in batch)), batch).fetchall():
+                job_rows[job_id] = row
+
+        # Reconstruct the molecules from the information in this database
+        molecules = self.get_molecules(set(molecule_id for molecule_id, energy_index, method, basis, cp in job_rows.values()))
+
+        jobs = []
+
+        for job_id in job_ids:
+            molecule_id, energy_index, method, basis, cp = job_rows[job_id]
+
+            molecule = molecules[molecule_id]
+
+            # get the indicies of the fragments to include in this calculation
+            fragment_indicies = energy_index_to_fragment_indicies(energy_index, molecule.get_num_fragments(), True if cp == 1 else False)
+
+            jobs.append(Job(molecule, method, basis, True if cp == 1 and energy_index < number_of_energies(molecule.get_num_fragments(), False) else False, fragment_indicies, job_id))
+
+        return jobs
+
+    def missing_energies(self, batch_size = None):
         """
         A generator to generate Jobs for all the missing energies
 
+        Jobs are claimed batch_size at a time, see claim_jobs(), so the changes made while calculating their energies are
+        committed by the commit policy of this Database rather than by claiming each job. Jobs that were claimed but not
+        generated when the generator is closed are released, see release_jobs().
+
         Args:
-            None
+            batch_size  - the number of jobs to claim at once, default is commit_writes
 
         Returns:
             A generator which generates Job objects until one has been generated for every pending job in the database
         """
+
+        if batch_size is None:
+            batch_size = self.commit_writes
+
         while True:
-            calculation = self.get_missing_energy()
-            
-            if calculation is None:
+            jobs = self.claim_jobs(max(1, batch_size))
+
+            if len(jobs) == 0:
                 return
 
-            yield calculation
-        
+            # the number of the claimed jobs that have been generated
+            generated = 0
+
+            try:
+                for job in jobs:
+                    generated += 1
+                    yield job
+            finally:
+                # if the generator was closed early, give back the jobs nobody is going to calculate
+                if generated < len(jobs):
+                    self.release_jobs(job.job_id for job in jobs[generated:])
 
     def set_energy(self, job_id, energy, log_file):
         """
@@ -300,6 +832,9 @@ class Database():
         # update the information about this job
         self.cursor.execute("UPDATE Jobs SET status=?, log_file=?, end_date=? WHERE ROWID=?", ("completed", log_file, datetime.datetime.today().strftime('%Y/%m/%d'), job_id))
 
+        # save the changes if enough have been made since the last save
+        self.autosave()
+
     def set_failed(self, job_id, status, log_path):
         """
         Sets the status of a job to a specific status
@@ -317,6 +852,9 @@ class Database():
 
         self.cursor.execute("UPDATE Jobs SET status=?, log_file=? WHERE ROWID=?", (status, log_path, job_id))
 
+        # save the changes if enough have been made since the last save
+        self.autosave()
+
     def get_complete_energies(self, molecule_name, optimized = False):
         """
         Returns a generator of pairs of [molecule, energies] where energies is an array of the form [E0, ...]
@@ -352,53 +890,43 @@ class Database():
             a generator of [molecule, [E0, E1, E2, E01, ...]] pairs from the calculated energies in this database using the given model and tag
         """
         
-        # get a list of all molecules with the given name
-        molecule_ids = [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT ROWID FROM Molecules WHERE name=?", (molecule_name,)).fetchall()]
-
-        # get the id of the model corresponding to the given method, basis, and cp
-        model_ids = [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT ROWID FROM Models WHERE method LIKE ? AND basis LIKE ? AND cp LIKE ?", (method, basis, cp)).fetchall()]
-
-        # get a list of all calculations that have the appropriate method, basis, and cp
-        calculation_ids = []
-
-        # loop over all the selected molecules
-        for molecule_id in molecule_ids:
-
-            # loop over all selected models
-            for model_id in model_ids:
-
-                # if optimized is true, get only those calculations which are marked as optimized in the database
-                if optimized:
-                    calculation_ids += [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT ROWID FROM Calculations WHERE model_id=? AND molecule_id=? AND tag LIKE ? AND optimized=?", (model_id, molecule_id, tag, 1)).fetchall()]
+        # only select calculations marked as optimized if optimized is True, otherwise select all calculations (even those marked as optimized)
+        optimized_clause = "AND Calculations.optimized=1" if optimized else ""
+
+        # a single query selects the energies of every calculation with the given molecule, model, and tag for which every job is completed.
+        # Rows are ordered by calculation so all the energies of one calculation are adjacent and in order of their energy index.
+        # A separate cursor is used so that reconstructing the molecules does not interrupt this query
+        energy_cursor = self.connection.cursor()
+        energy_cursor.execute(
+            """
+            SELECT Calculations.ROWID, Calculations.molecule_id, Energies.energy
+            FROM Molecules
+            JOIN Calculations ON Calculations.molecule_id=Molecules.ROWID
+            JOIN Models ON Models.ROWID=Calculations.model_id
+            JOIN Energies ON Energies.calculation_id=Calculations.ROWID
+            WHERE Molecules.name=? AND Models.method LIKE ? AND Models.basis LIKE ? AND Models.cp LIKE ? AND Calculations.tag LIKE ? {}
+            AND NOT EXISTS (
+                SELECT * FROM Energies AS Incomplete JOIN Jobs ON Jobs.ROWID=Incomplete.job_id
+                WHERE Incomplete.calculation_id=Calculations.ROWID AND Jobs.status!=?
+            )
+            ORDER BY Calculations.molecule_id, Calculations.model_id, Calculations.ROWID, Energies.energy_index
+            """.format(optimized_clause), (molecule_name, method, basis, cp, tag, "completed"))
+
+        # group the rows into [molecule_id, energies] pairs, one per calculation
+        calculations = ([molecule_id, [row[2] for row in rows]] for (calculation_id, molecule_id), rows in itertools.groupby(energy_cursor, lambda row: row[:2]))
 
-                # otherwise, get all energies (even those marked as optimized)
-                else:
-                    calculation_ids += [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT ROWID FROM Calculations WHERE model_id=? AND molecule_id=? AND tag LIKE ?", (model_id, molecule_id, tag)).fetchall()]
-        
-        # loop over all the selected calculations
-        for calculation_id in calculation_ids:
-            
-            # get the molecule id corresponding to this calculation
-            molecule_id = self.cursor.execute("SELECT molecule_id FROM Calculations WHERE ROWID=?", (calculation_id,)).fetchone()[0]
+        while True:
 
-            # check if any energies are uncomputed
-            is_complete = True
-            for job_id in [job_id_tuple[0] for job_id_tuple in self.cursor.execute("SELECT job_id FROM Energies WHERE calculation_id=?", (calculation_id,)).fetchall()]:
-                if self.cursor.execute("SELECT status FROM Jobs WHERE ROWID=?", (job_id,)).fetchone()[0] != "completed":
-                    is_complete = False
-                    break
+            # reconstruct the molecules of many calculations at once
+            batch = list(itertools.islice(calculations, MOLECULE_BATCH_SIZE))
 
-            # else statement is only ran if inner for loop
-            if not is_complete:
-                continue
+            if len(batch) == 0:
+                return
 
-            # get the energies corresponding to this calculation
-            energies = [energy_index_value_pair[1] for energy_index_value_pair in sorted(self.cursor.execute("SELECT energy_index, energy FROM Energies WHERE calculation_id=?", (calculation_id,)).fetchall())]
+            molecules = self.get_molecules(set(molecule_id for molecule_id, energies in batch))
 
-            # Reconstruct the molecule from the information in this database
-            molecule = self.get_molecule(molecule_id)
-            
-            yield molecule, energies
+            for molecule_id, energies in batch:
+                yield molecules[molecule_id], energies
 
     def count_calculations(self, molecule_name = "%", method = "%", basis = "%", cp = "%", tag = "%", optimized = False):
         """
@@ -418,80 +946,8 @@ class Database():
             the number of calculations in the database as a 4 item tuple: [pending calculations, partly calculations, completed calculations, failed calculations]
         """
 
-        # get a list of all molecules with the given name
-        molecule_ids = [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT ROWID FROM Molecules WHERE name LIKE ?", (molecule_name,)).fetchall()]
-
-        # get the id of the model corresponding to the given method, basis, and cp
-        model_ids = [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT ROWID FROM Models WHERE method LIKE ? AND basis LIKE ? AND cp LIKE ?", (method, basis, cp)).fetchall()]
-
-        # get a list of all calculations that have the appropriate method, basis, and cp
-        calculation_ids = []
-
-        # loop over all selected molecules
-        for molecule_id in molecule_ids:
-
-            # loop over all selected models
-            for model_id in model_ids:
-
-                # if optimized is True, only get calculations that use optimized geometries
-                if optimized:
-                    calculation_ids += [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT ROWID FROM Calculations WHERE model_id=? AND molecule_id=? AND tag LIKE ? AND optimized=?", (model_id, molecule_id, tag, 1)).fetchall()]
-
-                # if optimized is False, get all calculations (even those with optimized geometries)
-                else:
-                    calculation_ids += [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT ROWID FROM Calculations WHERE model_id=? AND molecule_id=? AND tag LIKE ?", (model_id, molecule_id, tag)).fetchall()]
-
-        # count the number of calculations with each status
-        pending = 0
-        partly = 0
-        completed = 0
-        failed = 0
-
-        # loop over each selected calculation
-        for calculation_id in calculation_ids:
-
-            # get a list of all the jobs for that calculation
-            job_ids = [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT job_id FROM Energies WHERE calculation_id=?", (calculation_id,)).fetchall()]
-
-            # count the number of jobs with each status
-            num_pending = 0
-            num_running = 0
-            num_completed = 0
-            num_failed = 0
-
-            # loop over all the jobs for this calculation
-            for job_id in job_ids:
-
-                # get the status of this job
-                status = self.cursor.execute("SELECT status FROM Jobs WHERE ROWID=?", (job_id,)).fetchone()[0]
-
-                # increment the corresponding counter variable
-                if status == "pending":
-                    num_pending += 1
-                elif status == "running":
-                    num_running += 1
-                elif status == "completed":
-                    num_completed += 1
-                elif status == "failed":
-                    num_failed += 1
-
-            # if any jobs from this calculation failed, the calculation is considered to have failed
-            if num_failed > 0:
-                failed += 1
-
-            # if no jobs failed, are pending, or are running, then the calculation is complete
-            elif num_pending == 0 and num_running == 0:
-                completed += 1
-
-            # if no jobs failed, are running, or are completed, then the calculation is pending
-            elif num_running == 0 and num_completed == 0:
-                pending += 1
-
-            # otherwise the calculation is considered partly done
-            else:
-                partly += 1
-
-        return pending, partly, completed, failed
+        # with no grouping there is exactly one row of counts, which may be all NULL if there are no calculations
+        return tuple(count or 0 for count in self.summarize_calculations([], molecule_name, method, basis, cp, tag, optimized)[0])
 
     def count_energies(self, molecule_name = "%", method = "%", basis = "%", cp = "%", tag = "%", optimized = False):
         """
@@ -511,58 +967,61 @@ class Database():
             the number of energies in the database as a 4 item tuple: [pending, running, completed, failed]
         """
 
-        # get a list of all molecules with the given name
-        molecule_ids = [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT ROWID FROM Molecules WHERE name LIKE ?", (molecule_name,)).fetchall()]
+        # add up the number of jobs with each status of the selected calculations
+        counts = self.cursor.execute("""SELECT SUM(Summaries.pending), SUM(Summaries.running), SUM(Summaries.completed), SUM(Summaries.failed)
+                FROM Molecules
+                JOIN Calculations ON Calculations.molecule_id=Molecules.ROWID
+                JOIN Models ON Models.ROWID=Calculations.model_id
+                JOIN Summaries ON Summaries.calculation_id=Calculations.ROWID
+                WHERE Molecules.name LIKE ? AND Models.method LIKE ? AND Models.basis LIKE ? AND Models.cp LIKE ? AND Calculations.tag LIKE ?
+                AND (? OR Calculations.optimized=1)""", (molecule_name, method, basis, cp, tag, not optimized)).fetchone()
 
-        # get the id of the model corresponding to the given method, basis, and cp
-        model_ids = [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT ROWID FROM Models WHERE method LIKE ? AND basis LIKE ? AND cp LIKE ?", (method, basis, cp)).fetchall()]
-
-        # get a list of all calculations that have the appropriate method, basis, and cp
-        calculation_ids = []
-
-        # loop over all selected molecules
-        for molecule_id in molecule_ids:
+        # SUM() is NULL if no energies were selected
+        return tuple(count or 0 for count in counts)
 
-            # loop over all selected models
-            for model_id in model_ids:
-
-                # if optimized is True, only get calculations that use optimized geometries
-                if optimized:
-                    calculation_ids += [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT ROWID FROM Calculations WHERE model_id=? AND molecule_id=? AND tag LIKE ? AND optimized=?", (model_id, molecule_id, tag, 1)).fetchall()]
-
-                # if optimized is False, get all calculations (even those with optimized geometries)
-                else:
-                    calculation_ids += [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT ROWID FROM Calculations WHERE model_id=? AND molecule_id=? AND tag LIKE ?", (model_id, molecule_id, tag)).fetchall()]
-
-        # count the number of energies with each status
-        pending = 0
-        running = 0
-        completed = 0
-        failed = 0
-
-        # loop over all selected calculations
-        for calculation_id in calculation_ids:
+    def summarize_calculations(self, group_by, molecule_name = "%", method = "%", basis = "%", cp = "%", tag = "%", optimized = False, having = "1", having_parameters = ()):
+        """
+        Counts the number of calculations with each status in groups in a single query over the Summaries table
 
-            # get a list of all the jobs for this calculation
-            job_ids = [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT job_id FROM Energies WHERE calculation_id=?", (calculation_id,)).fetchall()]
+        A calculation is failed if any of its jobs failed, completed if all of its jobs completed, pending if all of its jobs
+        are pending, and partly done otherwise.
 
-            # loop over all the jobs for this calculation
-            for job_id in job_ids:
+        % can be used as a wildcard to stand in for any molecule name, method, basis, cp, or tag.
 
-                # get the status of this job
-                status = self.cursor.execute("SELECT status FROM Jobs WHERE ROWID=?", (job_id,)).fetchone()[0]
+        Args:
+            group_by    - list of columns to group the calculations by, such as Molecules.name, Models.ROWID, Models.method,
+                    or Calculations.tag. If empty, all calculations are counted together
+            molecule_name - count only calculations with this molecule
+            method      - the model's method
+            basis       - the model's basis
+            cp          - the model's cp
+            tag         - count only calculations with this tag
+            optimized   - if True, then only count calculations for optimized geometries
+            having      - SQL condition that must be true for a group to be returned, may use aggregates of the columns of
+                    its calculations and contain ? placeholders. Default is to return every group
+            having_parameters - values of the placeholders in having
 
-                # increment the corresponding counter variable
-                if status == "pending":
-                    pending += 1
-                elif status == "running":
-                    running += 1
-                elif status == "completed":
-                    completed += 1
-                elif status == "failed":
-                    failed += 1
+        Returns:
+            list of tuples of the form (*group_by values, pending, partly, completed, failed), sorted by the group_by values
+        """
 
-        return pending, running, completed, failed
+        # the status of each calculation is found from the number of its jobs with each status in the Summaries table
+        query = """SELECT {columns}
+                SUM(Summaries.failed=0 AND Summaries.running+Summaries.completed=0 AND Summaries.pending>0),
+                SUM(Summaries.failed=0 AND Summaries.pending+Summaries.running>0 AND Summaries.running+Summaries.completed>0),
+                SUM(Summaries.failed=0 AND Summaries.pending+Summaries.running=0),
+                SUM(Summaries.failed>0)
+                FROM Molecules
+                JOIN Calculations ON Calculations.molecule_id=Molecules.ROWID
+                JOIN Models ON Models.ROWID=Calculations.model_id
+                JOIN Summaries ON Summaries.calculation_id=Calculations.ROWID
+                WHERE Molecules.name LIKE ? AND Models.method LIKE ? AND Models.basis LIKE ? AND Models.cp LIKE ? AND Calculations.tag LIKE ?
+                AND (? OR Calculations.optimized=1)
+                {group_by}""".format(
+                    columns = "".join("{}, ".format(column) for column in group_by),
+                    group_by = "GROUP BY {0} HAVING {1} ORDER BY {0}".format(", ".join(group_by), having) if len(group_by) > 0 else "")
+
+        return self.cursor.execute(query, (molecule_name, method, basis, cp, tag, not optimized) + tuple(having_parameters)).fetchall()
 
     def what_models(self, molecule_name = "%", tag = "%", optimized = False):
         """
@@ -577,20 +1036,11 @@ class Database():
             A generator object which yields tuples of the form (method, basis, cp, (pending, partly, completed, failed))
         """
 
-        # get a list of all the molecules in the database with the given name
-        molecule_ids = [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT ROWID FROM Molecules WHERE name LIKE ?", (molecule_name,)).fetchall()]
-
-        model_ids = []
-        for molecule_id in molecule_ids:
-            model_ids += [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT model_id FROM Calculations WHERE molecule_id=? AND tag LIKE ? AND optimized=?", (molecule_id, tag, optimized)).fetchall()]
-
-        model_ids = set(model_ids)
-
-        for model_id in model_ids:
-            method, basis, cp = self.cursor.execute("SELECT method, basis, cp FROM Models WHERE ROWID=?", (model_id,)).fetchone()
-            calculation_count = self.count_calculations(molecule_name, method, basis, cp, tag, optimized)
+        # only models with a calculation whose optimized flag matches exactly are yielded
+        for model_id, method, basis, cp, *calculation_count in self.summarize_calculations(["Models.ROWID", "Models.method", "Models.basis", "Models.cp"],
+                molecule_name, tag = tag, optimized = optimized, having = "SUM(Calculations.optimized=?) > 0", having_parameters = (optimized,)):
 
-            yield method, basis, True if cp == 1 else False, calculation_count
+            yield method, basis, True if cp == 1 else False, tuple(calculation_count)
 
     def what_molecules(self, method = "%", basis = "%", cp = "%", tag = "%", optimized = False):
         """
@@ -611,19 +1061,11 @@ class Database():
         except TypeError:
             return
 
-        molecule_ids = [fetch_tuple[0] for fetch_tuple in self.cursor.execute("SELECT molecule_id FROM Calculations WHERE model_id=? AND tag LIKE ? AND optimized=?", (model_id, tag, optimized)).fetchall()]
+        # only molecules with a calculation of the first matching model whose optimized flag matches exactly are yielded
+        for molecule_name, *calculation_count in self.summarize_calculations(["Molecules.name"], method = method, basis = basis, cp = cp, tag = tag,
+                optimized = optimized, having = "SUM(Calculations.model_id=? AND Calculations.optimized=?) > 0", having_parameters = (model_id, optimized)):
 
-        molecule_names = []
-
-        for molecule_id in molecule_ids:
-            molecule_names.append(self.cursor.execute("SELECT name FROM Molecules WHERE ROWID=?", (molecule_id,)).fetchone()[0])
-
-        molecule_names = set(molecule_names)
-
-        for molecule_name in molecule_names:
-            calculation_count = self.count_calculations(molecule_name, method, basis, cp, tag, optimized)
-
-            yield molecule_name, calculation_count
+            yield molecule_name, tuple(calculation_count)
             
     def get_symmetry(self, molecule_name):
         molecule_id = self.cursor.execute("SELECT ROWID FROM Molecules WHERE name=?", (molecule_name,)).fetchone()[0]
@@ -631,28 +1073,112 @@ class Database():
         return self.get_molecule(molecule_id).get_symmetry()
 
     def get_molecule(self, molecule_id):
-        # Reconstruct the molecule from the information in the database
-        molecule = Molecule()
-        
-        # loop over all rows in the Fragments table that correspond to this molecule
-        for fragment_id, name, charge, spin in self.cursor.execute("SELECT ROWID, name, charge, spin FROM Fragments WHERE molecule_id=?", (molecule_id,)).fetchall():
-            fragment = Fragment(name, charge, spin)
+        """
+        Reconstructs a molecule from the information in the database
 
-            # loop over all rows in the Atoms table that correspond to this fragment
-            for symbol, symmetry_class, x, y, z in self.cursor.execute("SELECT symbol, symmetry_class, x, y, z FROM Atoms WHERE fragment_id=?", (fragment_id,)).fetchall():
-                fragment.add_atom(Atom(symbol, symmetry_class, x, y, z))
+        The molecule may be shared with other callers through the molecule cache, so it should not be modified.
 
-            molecule.add_fragment(fragment)
+        Args:
+            molecule_id - the id of the molecule to reconstruct
 
-        return molecule
-    
+        Returns:
+            the reconstructed Molecule
+        """
+
+        return self.get_molecules([molecule_id])[molecule_id]
+
+    def get_molecules(self, molecule_ids):
+        """
+        Reconstructs many molecules from the information in the database at once
+
+        Molecules in the molecule cache are not reconstructed again. The rest are reconstructed with one query for the fragments
+        and one for the atoms of every MOLECULE_BATCH_SIZE molecules, instead of one query per fragment, and added to the cache.
+        Since the molecules may be shared with other callers through the cache, they should not be modified.
+
+        Args:
+            molecule_ids - the ids of the molecules to reconstruct
+
+        Returns:
+            dictionary from each molecule id to its reconstructed Molecule
+        """
+
+        molecules = {}
+
+        # ids of the molecules that are not in the cache
+        missing_ids = []
+
+        for molecule_id in molecule_ids:
+            try:
+                molecules[molecule_id] = self.molecule_cache[molecule_id]
+
+                # mark this molecule as the most recently used
+                self.molecule_cache.move_to_end(molecule_id)
+            except KeyError:
+                missing_ids.append(molecule_id)
+
+        # split the ids into batches so that queries do not exceed the limit on the number of parameters in sqlite
+        for batch_start in range(0, len(missing_ids), MOLECULE_BATCH_SIZE):
+            batch = missing_ids[batch_start:batch_start + MOLECULE_BATCH_SIZE]
+
+            parameters = ",".join("?" for molecule_id in batch)
+
+            # map from fragment id to [molecule_id, Fragment], in the order the fragments were added to the database
+            fragments = {}
+            for molecule_id, fragment_id, name, charge, spin in self.cursor.execute("SELECT molecule_id, ROWID, name, charge, spin FROM Fragments WHERE molecule_id IN ({}) ORDER BY ROWID".format(parameters), batch).fetchall():
+                fragments[fragment_id] = [molecule_id, Fragment(name, charge, spin)]
+
+            # add every atom of these molecules to its fragment
+            for fragment_id, symbol, symmetry_class, x, y, z in self.cursor.execute("SELECT Atoms.fragment_id, Atoms.symbol, Atoms.symmetry_class, Atoms.x, Atoms.y, Atoms.z FROM Atoms JOIN Fragments ON Fragments.ROWID=Atoms.fragment_id WHERE Fragments.molecule_id IN ({}) ORDER BY Atoms.ROWID".format(parameters), batch).fetchall():
+                fragments[fragment_id][1].add_atom(Atom(symbol, symmetry_class, x, y, z))
+
+            for molecule_id in batch:
+                molecules[molecule_id] = Molecule()
+
+            for molecule_id, fragment in fragments.values():
+                molecules[molecule_id].add_fragment(fragment)
+
+            for molecule_id in batch:
+                self.cache_molecule(molecule_id, molecules[molecule_id])
+
+        return molecules
+
+    def cache_molecule(self, molecule_id, molecule):
+        """
+        Adds a molecule to the molecule cache, removing the least recently used molecules if the cache is full
+
+        Args:
+            molecule_id - the id of the molecule
+            molecule    - the reconstructed Molecule
+
+        Returns:
+            None
+        """
+
+        if self.molecule_cache_size <= 0:
+            return
+
+        self.molecule_cache[molecule_id] = molecule
+        self.molecule_cache.move_to_end(molecule_id)
+
+        while len(self.molecule_cache) > self.molecule_cache_size:
+            self.molecule_cache.popitem(last = False)
 
     def clean(self):
         """
-        Goes thru all jobs in the database, and sets any that are "running" to "pending". Should only be used when you are prepared to give up on any currently running jobs
+        Goes thru all jobs in the database, and sets any that are "running" with an expired lease to "pending".
+
+        Jobs claimed before leases were added to the database have no lease, and are always set to "pending".
+
+        Args:
+            None
+
+        Returns:
+            the number of jobs that were set to "pending"
         """
 
-        self.cursor.execute("UPDATE Jobs SET status=? WHERE status=?", ("pending", "running"))
+        self.cursor.execute("UPDATE Jobs SET status=?, worker=NULL, lease_expiry=NULL WHERE status=? AND (lease_expiry IS NULL OR lease_expiry<?)", ("pending", "running", time.time()))
+
+        return self.cursor.rowcount
 
 class Job(object):
     """
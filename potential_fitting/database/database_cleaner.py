@@ -2,7 +2,7 @@ from .database import Database
 
 def clean_database(settings_file, database_name):
     """
-    Calls the database.clean() method on the given database. Sets all running calculations back to pending.
+    Calls the database.clean() method on the given database. Sets all running calculations whose lease has expired back to pending.
         
     """
 
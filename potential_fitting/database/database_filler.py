@@ -1,23 +1,36 @@
-import sys, os
+import sys, os, re
 import sqlite3
-from .database import Database
+import concurrent.futures, time
+from .database import Database, LEASE_TIME
 
 from potential_fitting import calculator
-from potential_fitting.exceptions import LibraryCallError
+from potential_fitting.exceptions import LibraryCallError, InvalidValueError
 from potential_fitting.utils import SettingsReader
 
-def fill_database(settings_file, database_name):
+# maximum number of seconds the parent process waits for a result before checking whether the leases of the jobs being calculated
+# need to be renewed
+HEARTBEAT_INTERVAL = 60
+
+# settings used by calculate_job() in each worker process, set by init_worker()
+worker_settings = None
+
+def fill_database(settings_file, database_name, workers = 1):
     """
     Calculates all the pending energies in a database
 
     Args:
         settings_file   - the file with all relevant settings information
         database_name   - the database file
+        workers         - the number of processes to calculate energies in. If greater than 1, the threads and memory in the
+                settings file are divided evenly between the processes. Default is 1, which calculates energies in this process.
 
     Returns:
         None
     """
 
+    if workers < 1:
+        raise InvalidValueError("workers", workers, "1 or greater")
+
     # open the database
     with Database(database_name) as database:
 
@@ -25,6 +38,12 @@ def fill_database(settings_file, database_name):
         # parse settings file
         settings = SettingsReader(settings_file)
 
+        if workers > 1:
+            hits, misses = fill_database_parallel(settings_file, database, workers)
+            print_cache_statistics(settings, hits, misses)
+            print("\nFilling of database {} successful".format(database_name))
+            return
+
         counter = 0
         
         for calculation in database.missing_energies():
@@ -39,12 +58,215 @@ def fill_database(settings_file, database_name):
                 database.set_energy(calculation.job_id, energy, "some/log/path")
             except LibraryCallError:
                 database.set_failed(calculation.job_id, "failed", "some/log/path")
-            
-            # save changes to the database
-            database.save()
+
+            # changes are saved by the database's commit policy and when it is closed
+
+        print_cache_statistics(settings)
 
         print("\nFilling of database {} successful".format(database_name))
 
+def fill_database_parallel(settings_file, database, workers):
+    """
+    Calculates all the pending energies in a database in a pool of worker processes
+
+    This process claims jobs from the database and is the only one to write results back to it. Jobs are claimed
+    in batches of size workers. Results are committed as soon as they arrive, so this process never holds the write lock
+    of the database while it waits for the workers, and the leases of the jobs are renewed once half of LEASE_TIME has passed.
+
+    Args:
+        settings_file   - the file with all relevant settings information
+        database        - the open Database to fill
+        workers         - the number of worker processes
+
+    Returns:
+        (hits, misses) the number of energies the worker processes found in and missing from the energy cache
+    """
+
+    counter = 0
+
+    # the hits and misses of the energy caches of all the workers
+    hits = 0
+    misses = 0
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers = workers, initializer = init_worker, initargs = (settings_file, workers)) as executor:
+
+        # futures of the jobs currently being calculated
+        running = set()
+
+        # map from each future to the id of its job
+        job_ids = {}
+
+        # whether there may be pending jobs left in the database
+        has_pending = True
+
+        # the time every running job was last given a full lease, either by claim_jobs() or heartbeat()
+        last_heartbeat = time.time()
+
+        try:
+            while True:
+
+                # claim another batch once the workers are close to running out of jobs
+                if has_pending and len(running) <= workers:
+                    jobs = database.claim_jobs(workers)
+
+                    if len(jobs) == 0:
+                        has_pending = False
+
+                    for job in jobs:
+                        future = executor.submit(calculate_job, job)
+                        job_ids[future] = job.job_id
+                        running.add(future)
+
+                if len(running) == 0:
+                    break
+
+                done, running = concurrent.futures.wait(running, timeout = HEARTBEAT_INTERVAL, return_when = concurrent.futures.FIRST_COMPLETED)
+
+                # renew the leases of the jobs still running before they are close to expiring, so they are not reclaimed by clean()
+                if time.time() - last_heartbeat >= LEASE_TIME / 2:
+                    database.heartbeat()
+                    last_heartbeat = time.time()
+
+                for future in done:
+
+                    job_id = job_ids.pop(future)
+
+                    # any error in a worker only fails its own job, like a failed calculation
+                    try:
+                        job_id, energy, job_hits, job_misses = future.result()
+
+                        hits += job_hits
+                        misses += job_misses
+                    except Exception as e:
+                        print("Job {} raised {}: {}".format(job_id, type(e).__name__, e))
+                        energy = None
+
+                    counter += 1
+                    print_progress(counter)
+
+                    # update the energy in the database, energy is None if the calculation failed
+                    if energy is not None:
+                        database.set_energy(job_id, energy, "some/log/path")
+                    else:
+                        database.set_failed(job_id, "failed", "some/log/path")
+
+                # commit the results, so other processes are not kept from claiming jobs while this one waits
+                database.save()
+
+        finally:
+            # if this process is stopped, cancel the jobs not started yet and return every unfinished job to the database,
+            # so they do not wait for their leases to expire before another process can claim them
+            for future in running:
+                future.cancel()
+
+            database.release_jobs(job_ids.values())
+
+            # save the results of the last batch
+            database.save()
+
+    return hits, misses
+
+def init_worker(settings_file, workers):
+    """
+    Initializes a worker process of fill_database_parallel() by reading the settings file and dividing
+    the threads and memory of the energy calculator between the workers
+
+    Args:
+        settings_file   - the file with all relevant settings information
+        workers         - the number of worker processes
+
+    Returns:
+        None
+    """
+
+    global worker_settings
+
+    worker_settings = SettingsReader(settings_file)
+
+    code = worker_settings.get("energy_calculator", "code")
+
+    if code == "psi4":
+        worker_settings.set("psi4", "num_threads", str(max(1, worker_settings.getint("psi4", "num_threads") // workers)))
+        worker_settings.set("psi4", "memory", divide_memory(worker_settings.get("psi4", "memory"), workers))
+
+    elif code == "qchem":
+        worker_settings.set("qchem", "num_threads", str(max(1, worker_settings.getint("qchem", "num_threads") // workers)))
+
+def calculate_job(job):
+    """
+    Calculates the energy of a Job in a worker process of fill_database_parallel()
+
+    Args:
+        job             - the Job to calculate the energy of
+
+    Returns:
+        (job_id, energy, hits, misses) where energy is None if the calculation failed, and hits and misses are the number of
+        energies of this job found in and missing from the energy cache
+    """
+
+    cache = calculator.get_energy_cache(worker_settings)
+
+    # the counts of the cache of this worker before this job
+    hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+
+    try:
+        energy = calculator.calculate_energy(job.molecule, job.fragments, job.method + "/" + job.basis, job.cp, worker_settings)
+    except LibraryCallError:
+        energy = None
+
+    if cache is not None:
+        hits, misses = cache.hits - hits, cache.misses - misses
+
+    return job.job_id, energy, hits, misses
+
+def divide_memory(memory, divisor):
+    """
+    Divides an amount of memory as specified in a settings file ("1GB", "500 MB", "1000000") into equal parts
+
+    Args:
+        memory          - the amount of memory, a number followed by an optional unit
+        divisor         - the number of parts to divide it into
+
+    Returns:
+        the amount of memory in each part, in the same unit
+    """
+
+    match = re.fullmatch(r"\s*([0-9]*\.?[0-9]+)\s*([a-zA-Z]*)\s*", memory)
+
+    if match is None:
+        raise InvalidValueError("memory", memory, "a number followed by an optional unit, such as '1GB'")
+
+    value, unit = match.groups()
+
+    # memory without a unit is in bytes, so it must stay an integer
+    if unit == "":
+        return str(int(float(value) / divisor))
+
+    return "{} {}".format(float(value) / divisor, unit)
+
+def print_cache_statistics(settings, hits = None, misses = None):
+    """
+    Prints the number of energies that were found in and missing from the energy cache
+
+    Args:
+        settings        - the SettingsReader of the settings file used to calculate the energies
+        hits            - the number of energies found in the cache, default is those of this process
+        misses          - the number of energies missing from the cache, default is those of this process
+
+    Returns:
+        None
+    """
+
+    cache = calculator.get_energy_cache(settings)
+
+    if cache is None:
+        return
+
+    if hits is None:
+        hits, misses = cache.hits, cache.misses
+
+    print("\nEnergy cache {}: {} hits, {} misses".format(cache.file_name, hits, misses))
+
 def print_progress(counter):
     s = "{:6d}".format(counter)
     if counter % 10 == 0:
@@ -6,7 +6,7 @@ from potential_fitting.utils import SettingsReader
 
 from potential_fitting.exceptions import ConfigMissingSectionError, ConfigMissingPropertyError, ParsingError, InvalidValueError, XYZFormatError, InconsistentValueError
 
-from potential_fitting.molecule import xyz_to_molecules
+from potential_fitting.molecule import xyz_to_molecules_generator
 """
 initializes a database from the config files in a directory
 """
@@ -54,26 +54,65 @@ def initialize_database(settings_file, database_name, directory):
             if filename[-4:] != ".xyz":
                 continue
 
-            # get list of all molecules in file
-            try:
-                molecules = xyz_to_molecules(filename, settings)
-            except (XYZFormatError, InconsistentValueError) as e:
-                raise ParsingError(filename, str(e)) from e
+            # get a generator of all molecules in file, which are read as they are added to the database
+            molecules = xyz_to_molecules_generator(filename, settings)
 
             # does this file contain optimized geometries?
             optimized = filename.endswith(".opt.xyz")
             
-            # for each molecule in the file
-            for molecule in molecules:
+            # add a calculation for every molecule in the file to the database in bulk
+            try:
+                database.add_calculations((molecule, method, basis, cp, tag, optimized) for molecule in standardize_molecules(molecules))
+            except (XYZFormatError, InconsistentValueError) as e:
+                raise ParsingError(filename, str(e)) from e
 
-                molecule.move_to_center_of_mass()
-                molecule.rotate_on_principal_axes()
+        print("Initializing of database {} successful".format(database_name))
 
-                # add this molecule to the database
-                database.add_calculation(molecule, method, basis, cp, tag, optimized)
 
-        print("Initializing of database {} successful".format(database_name))
+def add_molecules_to_database(settings_file, database_name, molecules, optimized = False):
+    """
+    Adds a calculation of every molecule in an iterable to a new or existing database, reading the molecules only as they are added
+
+    Args:
+        settings_file - the .ini file with the method, basis, cp, and tag of the calculations
+        database_name - the name of the file to save the database in
+        molecules   - iterable of the molecules to add, such as a generator of configurations
+        optimized   - whether the molecules are optimized geometries. Default is False.
+
+    Returns:
+        None
+    """
+
+    with Database(database_name) as database:
+
+        database.create()
+
+        settings = SettingsReader(settings_file)
+
+        method = settings.get("energy_calculator", "method")
+        basis = settings.get("energy_calculator", "basis")
+        cp = settings.getboolean("energy_calculator", "cp")
+        tag = settings.get("molecule", "tag")
+
+        database.add_calculations((molecule, method, basis, cp, tag, optimized) for molecule in standardize_molecules(molecules))
+
+def standardize_molecules(molecules):
+    """
+    Moves each molecule to its center of mass and rotates it onto its principal axes, so that identical
+    geometries have identical hashes in the database
+
+    Args:
+        molecules - iterable of molecules to standardize
+
+    Returns:
+        generator of the standardized molecules
+    """
+    for molecule in molecules:
+
+        molecule.move_to_center_of_mass()
+        molecule.rotate_on_principal_axes()
 
+        yield molecule
 
 def get_filenames(directory):
     """
@@ -1,4 +1,5 @@
 from .atom import Atom
 from .fragment import Fragment
 from .molecule import Molecule
-from .molecule_parser import xyz_to_molecules
+from .molecule_parser import xyz_to_molecules, xyz_to_molecules_generator, xyz_to_coordinates, XYZIndex
+from .rmsd import rmsd_many, get_kabsch_rotations, get_distances, distance_rmsd_many
@@ -1,11 +1,20 @@
 import math
+
+import numpy
+
 from potential_fitting.utils import constants
 
 class Atom(object):
     """
     Stores name, x, y, and z of a single atom
+
+    The position of an atom is a row of a coordinate array. Once the atom is added to a Fragment or Molecule, this is a row
+    of the Fragment's or Molecule's array, so the atom is a view of its position in that array.
     """
 
+    # atoms do not have a __dict__, which saves memory when there are many of them
+    __slots__ = ("name", "symmetry_class", "coordinates", "index")
+
     def __init__(self, name, symmetry_class, x, y, z):
         """
         Creates a new atom
@@ -22,9 +31,27 @@ class Atom(object):
 
         self.name = name
         self.symmetry_class = symmetry_class
-        self.x = x
-        self.y = y
-        self.z = z
+
+        # the position of this atom is row index of the coordinates array
+        self.coordinates = numpy.array([[x, y, z]], dtype = float)
+        self.index = 0
+
+    def bind(self, coordinates, index):
+        """
+        Moves the position of this atom into a row of another coordinate array, which this atom will be a view of from now on
+
+        Args:
+            coordinates - array of shape (number of atoms, 3)
+            index   - the row of coordinates to store the position of this atom in
+
+        Returns:
+            None
+        """
+
+        coordinates[index] = self.coordinates[self.index]
+
+        self.coordinates = coordinates
+        self.index = index
 
     def get_name(self):
         """
@@ -127,7 +154,7 @@ class Atom(object):
             The x position of this atom in angstroms
         """
 
-        return self.x
+        return float(self.coordinates[self.index, 0])
 
     def get_y(self):
         """
@@ -140,7 +167,7 @@ class Atom(object):
             The y position of this atom in angstroms
         """
 
-        return self.y
+        return float(self.coordinates[self.index, 1])
 
     def get_z(self):
         """
@@ -153,7 +180,7 @@ class Atom(object):
             The z position of this atom in angstroms
         """
 
-        return self.z
+        return float(self.coordinates[self.index, 2])
 
     def set_x(self, x):
         """
@@ -166,7 +193,7 @@ class Atom(object):
             None
         """
 
-        self.x = x
+        self.coordinates[self.index, 0] = x
 
     def set_y(self, y):
         """
@@ -179,7 +206,7 @@ class Atom(object):
             None
         """
 
-        self.y = y
+        self.coordinates[self.index, 1] = y
 
     def set_z(self, z):
         """
@@ -192,7 +219,7 @@ class Atom(object):
             None
         """
 
-        self.z = z
+        self.coordinates[self.index, 2] = z
 
     def set_xyz(self, x, y, z):
         """
@@ -207,9 +234,7 @@ class Atom(object):
             None
         """
 
-        self.x = x
-        self.y = y
-        self.z = z
+        self.coordinates[self.index] = (x, y, z)
 
     def translate(self, x, y, z):
         """
@@ -224,9 +249,7 @@ class Atom(object):
             None
         """
 
-        self.x += x
-        self.y += y
-        self.z += z
+        self.coordinates[self.index] += (x, y, z)
 
     def rotate(self, quaternion, origin_x = 0, origin_y = 0, origin_z = 0):
         """
@@ -257,7 +280,10 @@ class Atom(object):
             distance between them, in Angstroms
         """
         # compute distance in 3d coordinate plane
-        return math.sqrt((self.get_x() - atom.get_x()) ** 2 + (self.get_y() - atom.get_y()) ** 2 + (self.get_z() - atom.get_z()) ** 2)
+        x1, y1, z1 = self.coordinates[self.index].tolist()
+        x2, y2, z2 = atom.coordinates[atom.index].tolist()
+
+        return math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2 + (z1 - z2) ** 2)
 
     def to_xyz(self):
         """
@@ -269,7 +295,7 @@ class Atom(object):
         Returns:
             String containing this atom's atomic symbol and coordinates in the xyz format
         """
-        return "{:2} {:22.14e} {:22.14e} {:22.14e}".format(self.name, self.x, self.y, self.z)
+        return "{:2} {:22.14e} {:22.14e} {:22.14e}".format(self.name, *self.coordinates[self.index].tolist())
 
     def is_bonded(self, atom, bond_sensitivity = 1.1):
         """
@@ -32,6 +32,11 @@ class Fragment(object):
             raise InvalidValueError("spin multiplicity", spin_multiplicity, "1 or greater")
         self.spin_multiplicity = spin_multiplicity
 
+        # array of the positions of the atoms in this fragment in standard order if it is not in a molecule, or None if it needs to be rebuilt, see get_coordinate_array()
+        self.coordinates = None
+        # the molecule this fragment has been added to, which stores the positions of its atoms
+        self.molecule = None
+
     def get_name(self):
         """
         Gets the name of this fragment
@@ -62,6 +67,12 @@ class Fragment(object):
 
         self.atoms.append(atom)
 
+        # the positions of the atoms are rebuilt to include this one the next time they are needed
+        self.coordinates = None
+
+        if self.molecule is not None:
+            self.molecule.coordinates = None
+
     def get_atoms(self):
         """
         Gets a list of the atoms in this fragment, sorted in standard order (alphabetically by xyz representation
@@ -75,6 +86,40 @@ class Fragment(object):
 
         return sorted(self.atoms, key=lambda atom: atom.get_symmetry_class())
 
+    def get_coordinate_array(self):
+        """
+        Gets the positions of the atoms in this fragment as an array
+
+        The atoms of this fragment are views of the rows of this array, so changing the array moves the atoms. If this fragment
+        has been added to a molecule, the array is a view of the rows of the molecule's array.
+
+        Args:
+            None
+
+        Returns:
+            array of shape (number of atoms, 3) of the positions of the atoms in this fragment in standard order
+        """
+
+        # the atoms of each fragment of a molecule are adjacent in the molecule's array, since it is in standard order
+        if self.molecule is not None:
+            start = 0
+
+            for fragment in self.molecule.get_fragments():
+                if fragment is self:
+                    return self.molecule.get_coordinate_array()[start:start + self.get_num_atoms()]
+
+                start += fragment.get_num_atoms()
+
+        if self.coordinates is None:
+            coordinates = numpy.empty((self.get_num_atoms(), 3))
+
+            for index, atom in enumerate(self.get_atoms()):
+                atom.bind(coordinates, index)
+
+            self.coordinates = coordinates
+
+        return self.coordinates
+
     def get_symmetry(self):
         """
         Gets the symmetry of this fragment
@@ -166,8 +211,8 @@ class Fragment(object):
             None
         """
 
-        for atom in self.get_atoms():
-            atom.translate(x, y, z)
+        coordinates = self.get_coordinate_array()
+        coordinates += (x, y, z)
 
     def rotate(self, quaternion, origin_x = 0, origin_y = 0, origin_z = 0):
         """
@@ -183,8 +228,7 @@ class Fragment(object):
             None
         """
 
-        for atom in self.get_atoms():
-            atom.rotate(quaternion, origin_x, origin_y, origin_z)
+        quaternion.rotate_points(self.get_coordinate_array(), origin_x, origin_y, origin_z)
 
     def get_excluded_pairs(self, max_exclusion = 3):
         """
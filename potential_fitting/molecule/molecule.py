@@ -4,6 +4,7 @@ from hashlib import sha1
 
 from potential_fitting.exceptions import XYZFormatError, InvalidValueError, InconsistentValueError
 from .fragment import Fragment
+from .rmsd import rmsd_many, get_distances, distance_rmsd_many
 
 class Molecule(object):
     """
@@ -23,6 +24,11 @@ class Molecule(object):
 
         # list of fragments in this molecule
         self.fragments = []
+        # array of the positions of the atoms in this molecule in standard order, or None if it needs to be rebuilt, see get_coordinate_array()
+        self.coordinates = None
+        # condensed interatomic distances of this molecule and a copy of the coordinates they were computed from, see get_distances()
+        self.distances = None
+        self.distances_coordinates = None
         # list of energies for this molecule, filled in by get_nmer_energies
         self.energies = {}
         # list of nmer_energies for this molecule, filled by get_nmer_energies
@@ -84,6 +90,10 @@ class Molecule(object):
 
         self.fragments.append(fragment)
 
+        # the positions of the fragment's atoms will be stored in this molecule's array
+        fragment.molecule = self
+        fragment.coordinates = None
+
         # adjust the symmetry class of atoms to be in the right order
         next_symmetry = 65
         new_symmetries = {}
@@ -97,6 +107,47 @@ class Molecule(object):
             for atom in fragment.get_atoms():
                 atom.set_symmetry_class(new_symmetries[atom.get_symmetry_class()])
 
+        # the standard order of the atoms may have changed, so their positions are rebuilt the next time they are needed
+        self.coordinates = None
+
+    def get_coordinate_array(self):
+        """
+        Gets the positions of the atoms in this molecule as an array
+
+        The atoms of this molecule are views of the rows of this array, so changing the array moves the atoms.
+
+        Args:
+            None
+
+        Returns:
+            array of shape (number of atoms, 3) of the positions of the atoms in this molecule in standard order
+        """
+
+        if self.coordinates is None:
+            atoms = self.get_atoms()
+
+            coordinates = numpy.empty((len(atoms), 3))
+
+            for index, atom in enumerate(atoms):
+                atom.bind(coordinates, index)
+
+            self.coordinates = coordinates
+
+        return self.coordinates
+
+    def get_masses(self):
+        """
+        Gets the masses of the atoms in this molecule as an array
+
+        Args:
+            None
+
+        Returns:
+            array of the masses of the atoms in this molecule in standard order
+        """
+
+        return numpy.array([atom.get_mass() for atom in self.get_atoms()])
+
     def get_fragments(self):
         """
         Gets a list of the fragments in this molecule in standard order
@@ -206,8 +257,8 @@ class Molecule(object):
             None
         """
 
-        for fragment in self.get_fragments():
-            fragment.translate(x, y, z)
+        coordinates = self.get_coordinate_array()
+        coordinates += (x, y, z)
 
     def rotate(self, quaternion, origin_x = 0, origin_y = 0, origin_z = 0):
         """
@@ -223,8 +274,7 @@ class Molecule(object):
             None
         """
 
-        for fragment in self.get_fragments():
-            fragment.rotate(quaternion, origin_x, origin_y, origin_z)
+        quaternion.rotate_points(self.get_coordinate_array(), origin_x, origin_y, origin_z)
 
     def move_to_center_of_mass(self):
         """
@@ -237,29 +287,14 @@ class Molecule(object):
             None
         """
 
-        # keep track of the total weighted mass along each axis
-        total_x = 0
-        total_y = 0
-        total_z = 0
+        coordinates = self.get_coordinate_array()
+        masses = self.get_masses()
 
-        # keeps track of the total mass
-        total_mass = 0
-
-        # loop thru every atom in the molecule, adding its contribution to each coordinate mass
-        for atom in self.get_atoms():
-            total_x += atom.get_x() * atom.get_mass()
-            total_y += atom.get_y() * atom.get_mass()
-            total_z += atom.get_z() * atom.get_mass()
-
-            total_mass += atom.get_mass()
-
-        # calculate the center of mass my dividing the total weighted mass by the total mass
-        center_x = total_x / total_mass
-        center_y = total_y / total_mass
-        center_z = total_z / total_mass
+        # calculate the center of mass by dividing the mass weighted positions by the total mass
+        center = masses @ coordinates / masses.sum()
 
         # translate this molecule to the center of mass
-        self.translate(-center_x, -center_y, -center_z)
+        coordinates -= center
 
     def rotate_on_principal_axes(self):
         """
@@ -272,37 +307,15 @@ class Molecule(object):
             None
         """
 
+        coordinates = self.get_coordinate_array()
+        masses = self.get_masses()
+
         # first we calculate the moment of inertia tensor
         # [ Ixx Ixy Ixz ]
         # [ Iyx Iyy Iyz ]
         # [ Izx Izy Izz ]
-        I = [[0, 0, 0] for i in range(3)]
-
-        # loop over every atom and add their contributions to the moment of inertia tensor
-        for atom in self.get_atoms():
-            # Ixx
-            I[0][0] += (atom.get_y() ** 2 + atom.get_z() ** 2) * atom.get_mass()
-            # Ixy
-            I[1][0] += - (atom.get_x() * atom.get_y()) * atom.get_mass()
-            # Ixz
-            I[2][0] += - (atom.get_x() * atom.get_z()) * atom.get_mass()
-
-            # Iyx
-            I[0][1] += - (atom.get_y() * atom.get_x()) * atom.get_mass()
-            # Iyy
-            I[1][1] += (atom.get_x() ** 2 + atom.get_z() ** 2) * atom.get_mass()
-            # Iyz
-            I[2][1] += - (atom.get_y() * atom.get_z()) * atom.get_mass()
-
-            # Izx
-            I[0][2] += - (atom.get_z() * atom.get_x()) * atom.get_mass()
-            # Izy
-            I[1][2] += - (atom.get_z() * atom.get_y()) * atom.get_mass()
-            # Izz
-            I[2][2] += (atom.get_x() ** 2 + atom.get_y() ** 2) * atom.get_mass()
-
-        # get numpy matrix from the matrix of principle moments
-        inertia_tensor = numpy.matrix(I)
+        # as the sum over every atom of mass * (r^2 * identity - outer product of r with itself)
+        inertia_tensor = numpy.identity(3) * (masses @ (coordinates ** 2).sum(axis = 1)) - (coordinates.T * masses) @ coordinates
 
         # get the moments and principle axis as eigen values and eigen vectors
         (moments, principle_axes) = numpy.linalg.eig(inertia_tensor)
@@ -313,43 +326,73 @@ class Molecule(object):
         principle_axes = principle_axes[:,idx]
 
         # update the position of each atom
-        for atom in self.get_atoms():
-            x, y, z = (numpy.matrix([atom.get_x(), atom.get_y(), atom.get_z()]) * principle_axes).getA1()
-            atom.set_xyz(float(x), float(y), float(z))
+        coordinates[:] = coordinates @ principle_axes
 
-    def rmsd(self, other):
+    def rmsd(self, other, align = False):
         """
         Computes the RMSD between the positions of the atoms in two molecules
 
         molecules must have the same fragments and atoms or an InconsistentValueError will be raised.
 
-        generally, you should make sure that both molecules have been moved to their center of mass and rotated on their principal axes.
+        unless align is True, you should make sure that both molecules have been moved to their center of mass and rotated on their principal axes.
 
         Args:
             other - the molecule to compare this one to
+            align - if True, the other molecule is optimally superimposed onto this one by the Kabsch algorithm before computing the RMSD,
+                    neither molecule is moved. Default is False.
 
         Returns:
             The square-root of the mean squared distance between the atoms in this molecule and the other
         """
 
-        # fist make sure these molecules have the same number of atoms
-        if self.get_num_atoms() != other.get_num_atoms():
-            raise InconsistentValueError("number of atoms in self", "number of atoms in other", self.get_num_atoms(), other.get_num_atoms(), "number of atoms in each molecule must be the same, make sure you are computing the rmsd of two molecules with the same atoms and fragments")
+        self.check_same_atoms(other)
 
-        squared_distance = 0
+        return rmsd_many(self.get_coordinate_array(), other.get_coordinate_array(), align)
 
-        # loop thru every pair of atoms in the two molecules
-        for this_atom, other_atom in zip(self.get_atoms(), other.get_atoms()):
+    def get_distances(self):
+        """
+        Gets the distance between every pair of atoms in this molecule, in condensed form, see rmsd.get_distances()
 
-            # check to make sure that these atoms are the same type
-            if this_atom.get_name() != other_atom.get_name():
-                raise InconsistentValueError("self atom symbol", "other atom symbol", this_atom.get_name(), other_atom.get_name(), "symbols must be the same, make sure you are computing the rmsd of two molecules with the same atoms and fragments")
+        The distances are cached, and only recomputed if the atoms have moved since they were last computed.
+
+        Args:
+            None
+
+        Returns:
+            array of the distance between each pair of atoms, in the same order as the loops of distancermsd()
+        """
+
+        coordinates = self.get_coordinate_array()
+
+        # atoms can be moved through their own setters without this molecule knowing, so compare the coordinates themselves,
+        # which is much cheaper than recomputing every distance
+        if self.distances is None or not numpy.array_equal(coordinates, self.distances_coordinates):
+            self.distances = get_distances(coordinates)
+            self.distances_coordinates = coordinates.copy()
+
+        return self.distances
+
+    def check_same_atoms(self, other):
+        """
+        Checks that another molecule has the same atoms as this one in the same order
+
+        Raises an InconsistentValueError if it does not.
+
+        Args:
+            other   - the molecule to check
+
+        Returns:
+            None
+        """
 
-            # add this atom pair's contribution to the squared distance
-            squared_distance += this_atom.distance(other_atom) ** 2
+        # fist make sure these molecules have the same number of atoms
+        if len(self.get_coordinate_array()) != len(other.get_coordinate_array()):
+            raise InconsistentValueError("number of atoms in self", "number of atoms in other", self.get_num_atoms(), other.get_num_atoms(), "number of atoms in each molecule must be the same, make sure you are computing the rmsd of two molecules with the same atoms and fragments")
 
-        # compute rmsd as sqrt of mean squared distance
-        return math.sqrt(squared_distance / self.get_num_atoms())
+        # check to make sure that each pair of atoms is the same type
+        for this_atom, other_atom in zip(self.get_atoms(), other.get_atoms()):
+            if this_atom.name != other_atom.name:
+                raise InconsistentValueError("self atom symbol", "other atom symbol", this_atom.get_name(), other_atom.get_name(), "symbols must be the same, make sure you are computing the rmsd of two molecules with the same atoms and fragments")
 
     def distancermsd(self, other_molecule):
         """
@@ -357,8 +400,6 @@ class Molecule(object):
 
         molecules must have the same fragments and atoms or an InconsistentValueError will be raised.
 
-        generally, you should make sure that both molecules have been moved to their center of mass and rotated on their principal axes.
-
         Note:
             this function is distinct from rmsd() because this function takes the rmsd of the differneces between the distances between pairs of atoms within each molecule
             while rmsd() takes the rmsd of the distance between the positions of the same atoms in each molecule.
@@ -370,37 +411,45 @@ class Molecule(object):
             the square-root of the mean squared difference in the distance between each pair of atoms in this molecule and the other
         """
 
-        # fist make sure these molecules have the same number of atoms
-        if self.get_num_atoms() != other_molecule.get_num_atoms():
-            raise InconsistentValueError("number of atoms in self", "number of atoms in other", self.get_num_atoms(), other_molecule.get_num_atoms(), "number of atoms in each molecule must be the same, make sure you are computing the rmsd of two molecules with the same atoms and fragments")
+        self.check_same_atoms(other_molecule)
+
+        return distance_rmsd_many(self.get_distances(), other_molecule.get_distances())
 
-        squared_distance_difference = 0
+    def distancermsd_many(self, other_molecules):
+        """
+        Computes the RMSD of intramolecular interatomic distances between this molecule and each of many others, see distancermsd()
+
+        molecules must have the same fragments and atoms or an InconsistentValueError will be raised.
+
+        Args:
+            other_molecules - list of the molecules to compare this one to
+
+        Returns:
+            array of the distance RMSD between this molecule and each of the others
+        """
 
-        # loop over each pair of atoms
-        for atom_index, this_atom1, other_atom1 in zip(range(self.get_num_atoms()), self.get_atoms(), other_molecule.get_atoms()):
-            for this_atom2, other_atom2 in zip(self.get_atoms()[atom_index + 1:], other_molecule.get_atoms()[atom_index + 1:]):
+        symbols = [atom.name for atom in self.get_atoms()]
 
-                # check to make sure that the atom1s have the same type
-                if this_atom1.get_name() != other_atom1.get_name():
-                    raise InconsistentValueError("self atom symbol", "other atom symbol", this_atom.get_name(), other_atom.get_name(), "symbols must be the same, make sure you are computing the rmsd of two molecules with the same atoms and fragments")
+        # only do the full check, which explains what is different, for molecules whose atoms do not match
+        for other_molecule in other_molecules:
+            if [atom.name for atom in other_molecule.get_atoms()] != symbols:
+                self.check_same_atoms(other_molecule)
 
-                # check to make sure that the atom2s have the same type
-                if this_atom2.get_name() != other_atom2.get_name():
-                    raise InconsistentValueError("self atom symbol", "other atom symbol", this_atom.get_name(), other_atom.get_name(), "symbols must be the same, make sure you are computing the rmsd of two molecules with the same atoms and fragments")
+        own_distances = self.get_distances()
 
-                # add these atom pairs' contribution to the squared distance difference
-                squared_distance_difference += (this_atom1.distance(this_atom2) - other_atom1.distance(other_atom2)) ** 2
+        # the shape is given explicitly so that an empty list of molecules gives an empty array
+        distances = numpy.reshape([other_molecule.get_distances() for other_molecule in other_molecules], (len(other_molecules), len(own_distances)))
 
-        # compute the rmsd of the sqrt of mean squared distance difference
-        return math.sqrt(squared_distance_difference / self.get_num_atoms())
+        return distance_rmsd_many(own_distances, distances)
 
-    def compare(self, other, cutoff_rmsd = 0.1):
+    def compare(self, other, cutoff_rmsd = 0.1, align = False):
         """
         Compares two molecules to see if they are similar to eachother bellow a cutoff rmsd
 
         Args:
             other - the molecule to compare this one to
             cutoff_rmsd - the rmsd level at which False will be returned, defailt is 0.1
+            align - if True, the molecules are optimally superimposed before computing the rmsd, see rmsd(). Default is False.
 
         Returns:
             True if the rmsd between this molecule and the other is less than cutoff_rmsd, otherwise False
@@ -408,7 +457,7 @@ class Molecule(object):
         """
 
         try:
-            return self.rmsd(other) < cutoff_rmsd
+            return self.rmsd(other, align) < cutoff_rmsd
         except InconsistentValueError:
             return False
 
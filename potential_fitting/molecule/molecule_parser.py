@@ -1,20 +1,33 @@
+import itertools
+
+import numpy
+
 from potential_fitting.exceptions import XYZFormatError, InconsistentValueError
 from .molecule import Molecule
 
-'''
-Generates a list of Molecule objects from xyz files in the given directory
-'''
-def xyz_to_molecules(file_path, settings = None):
+def get_fragment_properties(file_path, settings = None):
+    """
+    Gets the number of atoms, names, charges, spin multiplicities, and symmetries of the fragments of the molecules in an xyz file
+
+    Will infer a single fragment with charge 0, spin 1, and a unique symmetry class for each atom if settings is None
+
+    Args:
+        file_path   - the xyz file, only used if settings is None to read the number of atoms
+        settings    - settings file containing information about the molecule
+
+    Returns:
+        (atoms_per_fragment, name_per_fragment, charge_per_fragment, spin_per_fragment, symmetry_per_fragment)
+    """
 
     if settings is None:
         charge_per_fragment = [0]
         spin_per_fragment = [1]
         name_per_fragment = ["noname"]
-        
+
         with open(file_path, "r") as xyz_file:
             total_atoms = int(xyz_file.readline())
 
-        atoms_per_fragment = [total_atoms]        
+        atoms_per_fragment = [total_atoms]
 
         symmetry = ""
 
@@ -37,19 +50,190 @@ def xyz_to_molecules(file_path, settings = None):
         spin_per_fragment = [int(spin) for spin in settings.get("molecule", "spins").split(",")]
         name_per_fragment = settings.get("molecule", "names").split(",")
         symmetry_per_fragment = settings.get("molecule", "symmetry").split(",")
-        
+
+    return atoms_per_fragment, name_per_fragment, charge_per_fragment, spin_per_fragment, symmetry_per_fragment
+
+'''
+Generates a list of Molecule objects from xyz files in the given directory
+'''
+def xyz_to_molecules(file_path, settings = None):
+
+    return list(xyz_to_molecules_generator(file_path, settings))
+
+def xyz_to_molecules_generator(file_path, settings = None):
+    """
+    Reads the molecules in an xyz file one at a time, so the whole file is never held in memory
+
+    Will infer a single fragment with charge 0, spin 1, and a unique symmetry class for each atom if settings is None
+
+    Args:
+        file_path   - the xyz file to read
+        settings    - settings file containing information about the molecule
+
+    Returns:
+        a generator of the Molecules in the file, in order
+    """
+
+    fragment_properties = get_fragment_properties(file_path, settings)
+
+    # number of lines of each molecule, including the atom count and comment lines
+    lines_per_molecule = 2 + sum(fragment_properties[0])
 
     # open the file
     with open(file_path, "r") as xyz_file:
 
-        # define the list of molecules
-        molecules = []
-
         while True:
-            try:
-                molecule = Molecule().read_xyz_file(xyz_file, atoms_per_fragment, name_per_fragment, charge_per_fragment, spin_per_fragment, symmetry_per_fragment)
-                molecules.append(molecule)
-            except StopIteration:
-                break
-        
-        return molecules
+
+            lines = list(itertools.islice(xyz_file, lines_per_molecule))
+
+            # if there are no lines left, then every molecule has been read
+            if len(lines) == 0:
+                return
+
+            if len(lines) < lines_per_molecule:
+                raise XYZFormatError("ran out of lines to read from xyz file {} in the middle of a molecule".format(file_path), "make sure the last molecule in the file has a comment line and a number of atoms equal to the amount indicated in the atom count line.")
+
+            yield Molecule().read_xyz("".join(lines), *fragment_properties)
+
+def xyz_to_coordinates(file_path):
+    """
+    Reads the coordinates of every molecule in an xyz file into a single array in one pass
+
+    Much faster than constructing a Molecule for every frame, but every frame must have the same atoms in the same order.
+
+    Args:
+        file_path   - the xyz file to read
+
+    Returns:
+        (symbols, coordinates) where symbols is the list of the atomic symbols of the atoms in each frame and coordinates is
+        an array of shape (number of frames, number of atoms, 3)
+    """
+
+    with open(file_path, "r") as xyz_file:
+        lines = xyz_file.read().splitlines()
+
+    # ignore any blank lines at the end of the file
+    while len(lines) > 0 and lines[-1].strip() == "":
+        lines.pop()
+
+    if len(lines) == 0:
+        raise XYZFormatError("xyz file {} file is empty".format(file_path), "make sure the xyz file has at least 1 molecule in it")
+
+    try:
+        atom_total = int(lines[0])
+    except ValueError:
+        raise XYZFormatError("atom count line '{}' cannot be parsed into an integer".format(lines[0]), "line should contain a single integer") from None
+
+    lines_per_frame = atom_total + 2
+
+    if len(lines) % lines_per_frame != 0:
+        raise XYZFormatError("xyz file {} has {} lines, which is not a multiple of the {} lines of each frame".format(file_path, len(lines), lines_per_frame), "make sure every frame in the file has the same number of atoms")
+
+    number_of_frames = len(lines) // lines_per_frame
+
+    # every frame must have the same atom count line
+    for frame_index, count in enumerate(lines[::lines_per_frame]):
+        try:
+            frame_total = int(count)
+        except ValueError:
+            raise XYZFormatError("atom count line '{}' of frame {} of xyz file {} cannot be parsed into an integer".format(count, frame_index, file_path), "line should contain a single integer") from None
+
+        if frame_total != atom_total:
+            raise XYZFormatError("xyz file {} has frames with different numbers of atoms".format(file_path), "make sure every frame in the file has the same number of atoms")
+
+    # split every atom line into its symbol and coordinates at once
+    atom_lines = [line for frame_start in range(0, len(lines), lines_per_frame) for line in lines[frame_start + 2:frame_start + lines_per_frame]]
+
+    tokens = " ".join(atom_lines).split()
+
+    if len(tokens) != number_of_frames * atom_total * 4:
+        raise XYZFormatError("atom lines of xyz file {}".format(file_path), "ATOMIC_SYMBOL X Y Z")
+
+    symbols = tokens[0:atom_total * 4:4]
+
+    # every frame must have the same atoms in the same order
+    if tokens[::4] != symbols * number_of_frames:
+        raise InconsistentValueError("atoms of first frame", "atoms of other frames", symbols, "different", "every frame must have the same atoms in the same order")
+
+    # the remaining tokens are the coordinates, which are converted to floats all at once
+    del tokens[::4]
+
+    try:
+        coordinates = numpy.array(tokens, dtype = float)
+    except ValueError:
+        raise XYZFormatError("atom lines of xyz file {}".format(file_path), "ATOMIC_SYMBOL X Y Z") from None
+
+    return symbols, coordinates.reshape(number_of_frames, atom_total, 3)
+
+class XYZIndex(object):
+    """
+    An index of the starting position of every molecule in an xyz file, allowing any one of them to be read without reading those before it
+    """
+
+    def __init__(self, file_path, settings = None):
+        """
+        Creates a new XYZIndex by finding the start of every molecule in the file in one pass
+
+        Will infer a single fragment with charge 0, spin 1, and a unique symmetry class for each atom if settings is None
+
+        Args:
+            file_path   - the xyz file to index
+            settings    - settings file containing information about the molecule
+
+        Returns:
+            a new XYZIndex object
+        """
+
+        self.file_path = file_path
+        self.fragment_properties = get_fragment_properties(file_path, settings)
+
+        # number of lines of each molecule, including the atom count and comment lines
+        self.lines_per_molecule = 2 + sum(self.fragment_properties[0])
+
+        # find the byte offset of the first line of each molecule, the file is read in binary so offsets can be passed to seek()
+        offsets = []
+
+        with open(file_path, "rb") as xyz_file:
+
+            offset = 0
+
+            for line_index, line in enumerate(xyz_file):
+
+                if line_index % self.lines_per_molecule == 0:
+
+                    # ignore blank lines at the end of the file
+                    if line.strip() == b"":
+                        break
+
+                    offsets.append(offset)
+
+                offset += len(line)
+
+        self.offsets = numpy.array(offsets, dtype = numpy.int64)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        """
+        Reads a single molecule from the file
+
+        Args:
+            index       - the index of the molecule in the file, negative indices count from the end
+
+        Returns:
+            the Molecule at this index
+        """
+
+        if index < -len(self) or index >= len(self):
+            raise IndexError("molecule index {} out of range for xyz file {} with {} molecules".format(index, self.file_path, len(self)))
+
+        with open(self.file_path, "rb") as xyz_file:
+            xyz_file.seek(int(self.offsets[index]))
+
+            lines = list(itertools.islice(xyz_file, self.lines_per_molecule))
+
+        if len(lines) < self.lines_per_molecule:
+            raise XYZFormatError("ran out of lines to read from xyz file {} in the middle of a molecule".format(self.file_path), "make sure the last molecule in the file has a comment line and a number of atoms equal to the amount indicated in the atom count line.")
+
+        return Molecule().read_xyz(b"".join(lines).decode(), *self.fragment_properties)
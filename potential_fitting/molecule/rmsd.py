@@ -0,0 +1,109 @@
+import math
+
+import numpy
+
+def get_kabsch_rotations(reference, coordinates):
+    """
+    Finds the rotations that best superimpose many sets of centered coordinates onto a reference by the Kabsch algorithm
+
+    Args:
+        reference   - array of shape (number of atoms, 3) of the centered reference coordinates
+        coordinates - array of shape (number of molecules, number of atoms, 3) of the centered coordinates to rotate
+
+    Returns:
+        array of shape (number of molecules, 3, 3) of rotation matrices, coordinates[i] @ rotations[i] is the best
+        superposition of coordinates[i] onto reference
+    """
+
+    # covariance matrix of each molecule with the reference
+    covariances = numpy.einsum("mai,aj->mij", coordinates, reference)
+
+    u, s, vt = numpy.linalg.svd(covariances)
+
+    # if the best orthogonal matrix is a reflection, flip the axis with the smallest singular value to make it a rotation
+    signs = numpy.sign(numpy.linalg.det(u @ vt))
+    signs[signs == 0] = 1
+    u[:, :, 2] *= signs[:, numpy.newaxis]
+
+    return u @ vt
+
+def rmsd_many(reference, coordinates, align = False):
+    """
+    Computes the RMSD between the positions of the atoms of a reference and many other molecules at once
+
+    Args:
+        reference   - array of shape (number of atoms, 3) of the coordinates of the reference molecule
+        coordinates - array of shape (number of molecules, number of atoms, 3) of the coordinates of the molecules to compare to the reference,
+                or a single array of shape (number of atoms, 3)
+        align       - if True, each molecule is optimally superimposed onto the reference by translating its centroid onto the
+                reference's centroid and rotating it by the Kabsch algorithm before computing its RMSD. If False, the coordinates are compared
+                as they are, so they should already have been moved to their center of mass and rotated on their principal axes. Default is False.
+
+    Returns:
+        array of the RMSD between the reference and each molecule, or a single float if coordinates was a single molecule
+    """
+
+    reference = numpy.asarray(reference, dtype = float)
+    coordinates = numpy.asarray(coordinates, dtype = float)
+
+    if coordinates.ndim == 2:
+
+        # comparing a single pair of unaligned molecules is common enough to skip the batched arithmetic
+        if not align:
+            return math.sqrt(numpy.square(coordinates - reference).sum() / len(reference))
+
+        return float(rmsd_many(reference, coordinates[numpy.newaxis], align)[0])
+
+    if align:
+        reference = reference - reference.mean(axis = 0)
+        coordinates = coordinates - coordinates.mean(axis = 1)[:, numpy.newaxis]
+
+        coordinates = coordinates @ get_kabsch_rotations(reference, coordinates)
+
+    return numpy.sqrt(((coordinates - reference) ** 2).sum(axis = (1, 2)) / reference.shape[0])
+
+def get_distances(coordinates):
+    """
+    Computes the distance between every pair of atoms of one or many molecules
+
+    The distances are in condensed form, like scipy's pdist: the distance between atoms i and j, i < j, comes after those of every atom
+    before i and after those of i with every atom before j.
+
+    Args:
+        coordinates - array of shape (number of atoms, 3) or (number of molecules, number of atoms, 3)
+
+    Returns:
+        array of shape (number of pairs of atoms,) or (number of molecules, number of pairs of atoms) of the distances
+    """
+
+    coordinates = numpy.asarray(coordinates, dtype = float)
+
+    first_atoms, second_atoms = numpy.triu_indices(coordinates.shape[-2], 1)
+
+    return numpy.linalg.norm(coordinates[..., first_atoms, :] - coordinates[..., second_atoms, :], axis = -1)
+
+def distance_rmsd_many(reference_distances, distances):
+    """
+    Computes the RMSD of the interatomic distances of a reference and many other molecules at once, same as Molecule.distancermsd()
+
+    Args:
+        reference_distances - condensed distances of the reference molecule, from get_distances()
+        distances   - array of shape (number of molecules, number of pairs of atoms) of the condensed distances of the molecules to compare to
+                the reference, or the condensed distances of a single molecule
+
+    Returns:
+        array of the distance RMSD between the reference and each molecule, or a single float if distances was a single molecule
+    """
+
+    reference_distances = numpy.asarray(reference_distances, dtype = float)
+    distances = numpy.asarray(distances, dtype = float)
+
+    # as in Molecule.distancermsd(), the mean is taken over the number of atoms, which is found from the number of pairs
+    num_atoms = round((1 + math.sqrt(1 + 8 * len(reference_distances))) / 2)
+
+    squared_differences = numpy.square(distances - reference_distances).sum(axis = -1)
+
+    if distances.ndim == 1:
+        return math.sqrt(squared_differences / num_atoms)
+
+    return numpy.sqrt(squared_differences / num_atoms)
@@ -1,3 +1,4 @@
 from .generate_input_poly import generate_input_poly
 from .generate_poly import generate_poly
+from .polynomial_evaluator import PolynomialEvaluator, read_polynomial_evaluator
 from .filters import *
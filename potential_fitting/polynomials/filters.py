@@ -1,8 +1,15 @@
+import math
+
+import numpy
+
 from potential_fitting.exceptions import InvalidValueError
 
 def parse_filter(*args):
     """
     Takes in the arguments as specified in a poly.in file and returns the filter they represent
+
+    The degree and term strings of the filter are parsed once here, call compile() on the filter to also match its variable strings
+    against the variables of a polynomial and filter many monomials at once.
     """
 
     if args[0] == "not":
@@ -11,6 +18,58 @@ def parse_filter(*args):
         return DegreeFilter(*args[1:])
     raise InvalidValueError("filter type", args[0], "must be one of 'not', 'degree'")
 
+def parse_range(range_string):
+    """
+    Parses a degree or term string of a DegreeFilter into the range of values it affects
+
+    Args:
+        range_string - one of 'y-', 'y+', 'y-z', 'y', or '*', see DegreeFilter
+
+    Returns:
+        (low, high) where the range is [low, high] (inclusive), either may be infinite
+    """
+
+    try:
+        # if the string is the wildcard, it affects all values
+        if range_string == "*":
+            return -math.inf, math.inf
+
+        # if the string ends in "-" then it is a less than or equal to specifier
+        if range_string.endswith("-"):
+            return -math.inf, int(range_string[:-1])
+
+        # if the string ends in "+" then it is a greater than or equal to specifier
+        if range_string.endswith("+"):
+            return int(range_string[:-1]), math.inf
+
+        # if the string has a "-" (but did not end in "-") then it is a range specifier
+        if "-" in range_string:
+            return int(range_string[:range_string.index("-")]), int(range_string[range_string.index("-") + 1:])
+
+        # otherwise, it is a specific number specifier
+        return int(range_string), int(range_string)
+
+    except ValueError:
+        raise InvalidValueError("degree range", range_string, "one of 'y-', 'y+', 'y-z', 'y', or '*' where y and z are integers") from None
+
+def in_ranges(values, ranges):
+    """
+    Tells which of many values are in at least one of the given ranges
+
+    Args:
+        values      - array of values
+        ranges      - list of (low, high) ranges as given by parse_range()
+
+    Returns:
+        boolean array of the same shape as values, True where the value is in one of the ranges
+    """
+
+    lows, highs = numpy.array(ranges, dtype = float).reshape(-1, 2).T
+
+    values = numpy.asarray(values)[..., numpy.newaxis]
+
+    return ((values >= lows) & (values <= highs)).any(axis = -1)
+
 class Filter(object):
     """
     Abstract Class for all filters to extend
@@ -30,6 +89,37 @@ class Filter(object):
 
         raise NotImplementedError
 
+    def compile(self, variables):
+        """
+        Compiles this filter against the variables of a polynomial, so it can filter many monomials of those variables at once
+
+        Args:
+            variables - list of the variables of the monomials to filter
+
+        Returns:
+            A CompiledFilter
+        """
+
+        raise NotImplementedError
+
+class CompiledFilter(object):
+    """
+    Abstract Class for all filters compiled against the variables of a polynomial
+    """
+
+    def keep(self, monomials):
+        """
+        Tells which of the given monomials are filtered out by this filter
+
+        Args:
+            monomials - array of shape (number of monomials, number of variables) of the degrees of the monomials to filter
+
+        Returns:
+            boolean array of shape (number of monomials,), False for each monomial this filter filters out, True otherwise.
+        """
+
+        raise NotImplementedError
+
 class NotFilter(Filter):
     """
     Inverts another filter, so this filter will filter out any terms that would NOT be filtered out by its given filter
@@ -52,6 +142,39 @@ class NotFilter(Filter):
 
         return not self.not_filter.keep(monomial, variables)
 
+    def compile(self, variables):
+        """
+        Compiles this filter against the variables of a polynomial, so it can filter many monomials of those variables at once
+
+        Args:
+            variables - list of the variables of the monomials to filter
+
+        Returns:
+            A CompiledFilter
+        """
+
+        return CompiledNotFilter(self.not_filter.compile(variables))
+
+class CompiledNotFilter(CompiledFilter):
+    """
+    A NotFilter compiled against the variables of a polynomial
+    """
+
+    def __init__(self, not_filter):
+        self.not_filter = not_filter
+
+    def keep(self, monomials):
+        """
+        Tells which of the given monomials are filtered out by this filter
+
+        Args:
+            monomials - array of shape (number of monomials, number of variables) of the degrees of the monomials to filter
+
+        Returns:
+            boolean array of shape (number of monomials,), False for each monomial this filter filters out, True otherwise.
+        """
+
+        return ~self.not_filter.keep(monomials)
 
 class DegreeFilter(Filter):
     """
@@ -103,6 +226,10 @@ class DegreeFilter(Filter):
         self.degrees = degree_string.split("/")
         self.terms = term_string.split("/")
 
+        # the degree and term strings are parsed once, rather than for every monomial
+        self.degree_ranges = [parse_range(degree_string) for degree_string in self.degrees]
+        self.term_ranges = [parse_range(term_string) for term_string in self.terms]
+
     def keep(self, monomial, variables):
         """
         Tells whether the given monomial formed by the given variables is filtered out by this filter
@@ -115,134 +242,131 @@ class DegreeFilter(Filter):
             False if this Filter filters out this monomial, True otherwise.
         """
 
-        # calculate the total degree of this monomial
+        # if this filter does not apply to the monomial's TOTAL degree, then it should not be filtered out
         term = sum(monomial)
 
-        # used to track whether this monomial's TOTAl degree matches one of this filter's applicable terms
-        applicable_term = False
-
-        # loop over each term string this filter effects
-        for term_string in self.terms:
-
-            # if the term string is the wildcard, this filter is applicable to all monomials
-            if term_string == "*":
-                applicable_term = True
-                break
-
-            # if the term string ends in "-" then it is a less than or equal to specifier
-            elif term_string.endswith("-"):
-                if term <= int(term_string[:-1]):
-                    applicable_term = True
-                    break
-
-            # if the term string ends in "+" then it is a greater than or equal to specifier
-            elif term_string.endswith("+"):
-                if term >= int(term_string[:-1]):
-                    applicable_term = True
-                    break
-
-            # if the term has a "-" (but did not end in "-") then it is a range specifier
-            elif "-" in term_string:
-                if term >= int(term_string[:term_string.index("-")]) and term <= int(term_string[term_string.index("-") + 1:]):
-                    applicable_term = True
-                    break
-
-            # otherwise, it is a specific number specifier
-            else:
-                if term == int(term_string):
-                    applicable_term = True
-                    break
-
-        # if this filter does not apply to the monomial's total degree, then it should not be filtered out
-        if not applicable_term:
+        if not any(low <= term <= high for low, high in self.term_ranges):
             return True
 
         # loop over each degree, variable pair in this monomial
         for degree, variable in zip(monomial, variables):
 
-            # used to track whether this variable matches one of this filter's applicable variables
-            applicable_variable = False
-
-            # loop over each variable this filter effects
-            for variable_string in self.variables:
-
-                # if the variable string is the wildcard, this filter is applicable to all variables
-                if variable_string == "*":
-                    applicable_variable = True
-                    break
-
-                # if the variable string has an *, we must perform detailed analysis to figure out what it does
-                if "*" in variable_string:
-
-                    # tracks if the atom portion of this variable string matches the current variable's
-                    fits_atoms = False
-                    # tracks if the type portion of this variable string matches the current variable's (inter or intra)
-                    fits_type = False
-
-                    # if the variable string ends in 2 wildcards, then this filter is eligable to apply to all variables regardless of atom type
-                    if variable_string[-2] == "*" and variable_string[-1] == "*":
-                        fits_atoms = True
-
-                    # if the second to last character or the last character of the variable string is a wildcard (but not both), then this filter is eligable to apply to all variables where one of the atoms is the other atom specified by the variable string
-                    elif variable_string[-2] == "*":
-                        fits_atoms = variable.category[-1] == variable_string[-1] or variable.category[-2] == variable_string[-1]
-                    elif variable_string[-1] == "*":
-                        fits_atoms = variable.category[-1] == variable_string[-2] or variable.category[-2] == variable_string[-2]
-
-                    # otherwise, this variable string simply specifies an exact pair of atoms to be effected by this filter
-                    else:
-                        fits_atoms = variable.category[-2:] == variable_string[-2:]
-
-                    # if the second character of the variable string is an * but not the 3rd (as in x-*-AA but NOT x-**), then this filter is eligable to apply to all variables regardless of inter/intra type
-                    if variable_string[2] == "*" and variable_string[3] != "*":
-                        fits_type = True
-
-                    # otherwise, this variable string specifies an exact inter/intra type (x- or x-intra-)
-                    else:
-                        fits_type = variable_string[:-2] == variable.category[:-2]
-
-                    # if this variable string fits both the atoms and the inter/intra type, then it is applicable to this variable! 
-                    if fits_type and fits_atoms:
-                        applicable_variable = True
-                        break 
-
-                # otherwise, this string simply specifies an exact variable
-                elif variable_string == variable.category:
-                    applicable_variable = True
-                    break
-            
-            # if this filter is not applicable to the current variable, go to the next one
-            if not applicable_variable:
-                continue
-
-            # loop over each degree affected by this filter
-            for degree_string in self.degrees:
-
-                # if this degree string is the wildcard, then it affects all variables regardless of their degree
-                if degree_string == "*":
-                    return False
-
-                # if this degree string ends in a "-", then it is a less than or equal to specifier
-                elif degree_string.endswith("-"):
-                    if degree <= int(degree_string[:-1]):
-                        return False
-
-                # if this degree string ends in a "+", then it is a greater than or equal to specifier
-                elif degree_string.endswith("+"):
-                    if degree >= int(degree_string[:-1]):
-                        return False
-
-                # if this degree contains a "-" (but does not end in "-") then it is a range specifier
-                elif "-" in degree_string:
-                    if degree >= int(degree_string[:degree_string.index("-")]) and degree <= int(degree_string[degree_string.index("-") + 1:]):
-                        return False
-
-                # otherwise, it is an exact value specifier
-                else:
-                    if degree == int(degree_string):
-                        return False
+            # if the degree of one of the variables this filter applies to is one of its degrees, then it is filtered out
+            if self.applies_to(variable) and any(low <= degree <= high for low, high in self.degree_ranges):
+                return False
 
         # if the degree of one of this monomial's variables did not cause it to be filtered out, then it is a keeper!
         return True
 
+    def compile(self, variables):
+        """
+        Compiles this filter against the variables of a polynomial, so it can filter many monomials of those variables at once
+
+        Args:
+            variables - list of the variables of the monomials to filter
+
+        Returns:
+            A CompiledFilter
+        """
+
+        return CompiledDegreeFilter(numpy.array([self.applies_to(variable) for variable in variables], dtype = bool),
+                self.degree_ranges, self.term_ranges)
+
+    def applies_to(self, variable):
+        """
+        Tells whether this filter affects the degree of the given variable
+
+        Args:
+            variable - the variable to check
+
+        Returns:
+            True if one of this filter's variable strings matches the variable, False otherwise.
+        """
+
+        # loop over each variable this filter effects
+        for variable_string in self.variables:
+
+            # if the variable string is the wildcard, this filter is applicable to all variables
+            if variable_string == "*":
+                return True
+
+            # if the variable string has an *, we must perform detailed analysis to figure out what it does
+            if "*" in variable_string:
+
+                # tracks if the atom portion of this variable string matches the current variable's
+                fits_atoms = False
+                # tracks if the type portion of this variable string matches the current variable's (inter or intra)
+                fits_type = False
+
+                # if the variable string ends in 2 wildcards, then this filter is eligable to apply to all variables regardless of atom type
+                if variable_string[-2] == "*" and variable_string[-1] == "*":
+                    fits_atoms = True
+
+                # if the second to last character or the last character of the variable string is a wildcard (but not both), then this filter is eligable to apply to all variables where one of the atoms is the other atom specified by the variable string
+                elif variable_string[-2] == "*":
+                    fits_atoms = variable.category[-1] == variable_string[-1] or variable.category[-2] == variable_string[-1]
+                elif variable_string[-1] == "*":
+                    fits_atoms = variable.category[-1] == variable_string[-2] or variable.category[-2] == variable_string[-2]
+
+                # otherwise, this variable string simply specifies an exact pair of atoms to be effected by this filter
+                else:
+                    fits_atoms = variable.category[-2:] == variable_string[-2:]
+
+                # if the second character of the variable string is an * but not the 3rd (as in x-*-AA but NOT x-**), then this filter is eligable to apply to all variables regardless of inter/intra type
+                if variable_string[2] == "*" and variable_string[3] != "*":
+                    fits_type = True
+
+                # otherwise, this variable string specifies an exact inter/intra type (x- or x-intra-)
+                else:
+                    fits_type = variable_string[:-2] == variable.category[:-2]
+
+                # if this variable string fits both the atoms and the inter/intra type, then it is applicable to this variable!
+                if fits_type and fits_atoms:
+                    return True
+
+            # otherwise, this string simply specifies an exact variable
+            elif variable_string == variable.category:
+                return True
+
+        return False
+
+class CompiledDegreeFilter(CompiledFilter):
+    """
+    A DegreeFilter compiled against the variables of a polynomial
+    """
+
+    def __init__(self, variable_mask, degree_ranges, term_ranges):
+        """
+        Creates a new CompiledDegreeFilter
+
+        Args:
+            variable_mask - boolean array of which variables of the polynomial the filter applies to
+            degree_ranges - list of (low, high) ranges of the degrees the filter applies to, as given by parse_range()
+            term_ranges - list of (low, high) ranges of the TOTAL degrees the filter applies to, as given by parse_range()
+
+        Returns:
+            A new CompiledDegreeFilter
+        """
+
+        self.variable_mask = variable_mask
+        self.degree_ranges = degree_ranges
+        self.term_ranges = term_ranges
+
+    def keep(self, monomials):
+        """
+        Tells which of the given monomials are filtered out by this filter
+
+        Args:
+            monomials - array of shape (number of monomials, number of variables) of the degrees of the monomials to filter
+
+        Returns:
+            boolean array of shape (number of monomials,), False for each monomial this filter filters out, True otherwise.
+        """
+
+        monomials = numpy.asarray(monomials)
+
+        # a monomial is filtered out if its TOTAL degree is one of the terms and one of the applicable variables has one of the degrees
+        applicable_terms = in_ranges(monomials.sum(axis = 1), self.term_ranges)
+        applicable_degrees = in_ranges(monomials[:, self.variable_mask], self.degree_ranges).any(axis = 1)
 
+        return ~(applicable_terms & applicable_degrees)
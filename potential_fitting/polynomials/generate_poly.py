@@ -1,12 +1,41 @@
 import itertools
+import concurrent.futures
+
+import numpy
 
 from . import filters
+from .program import build_polynomial_program, build_product_program, count_flat_operations
+from .polynomial_evaluator import get_polynomial_evaluator
 
 from potential_fitting.utils import SettingsReader
 from potential_fitting.exceptions import ParsingError, InvalidValueError, InconsistentValueError
 
-def generate_poly(settings_file, input_file, order, output_path):
-    
+# variables, filters, and variable permutations used by generate_partition_monomials() in each worker process, set by init_worker()
+worker_variables = None
+worker_monomial_filters = None
+worker_variable_permutations = None
+
+def generate_poly(settings_file, input_file, order, output_path, workers = 1):
+    """
+    Generates the polynomial files of a molecule from its poly.in file
+
+    Args:
+        settings_file - the .ini file with relevant settings
+        input_file  - the poly.in file with the fragments, variables, and filters of the polynomial
+        order       - the degree of the polynomial
+        output_path - the directory to write poly.log, vars.cpp, poly-model.h, poly-direct.cpp, poly-grd.cpp, poly-nogrd.cpp,
+                poly-direct.npy, and the maple files in. poly-direct.npy is read by read_polynomial_evaluator() to evaluate
+                the polynomial in python.
+        workers     - the number of processes to generate and filter the monomials of each degree in. The output does not
+                depend on workers. Default is 1, which generates them in this process.
+
+    Returns:
+        None
+    """
+
+    if workers < 1:
+        raise InvalidValueError("workers", workers, "1 or greater")
+
     # read the settings file
     settings = SettingsReader(settings_file)
 
@@ -119,8 +148,8 @@ def generate_poly(settings_file, input_file, order, output_path):
         poly_log.write("<> variables ({}) <>\n".format(len(variables))) 
         poly_log.write("\n")
 
-        # generate the variable permutations
-        variable_permutations = list(make_variable_permutations(variables, atom_permutations, atom_names))
+        # generate the variable permutations, as an array so all of them can be applied to a monomial at once
+        variable_permutations = numpy.array(list(make_variable_permutations(variables, atom_permutations, atom_names)))
 
         # make the .cpp vars file
         with open(output_path + "/vars.cpp", "w") as vars_file:
@@ -138,24 +167,18 @@ def generate_poly(settings_file, input_file, order, output_path):
         # this list will be filled so that the first item is all the 1st degree monomials, second item is all the 2nd degree monomials, etc
         total_monomials = []
 
+        # the set of permutations of every accepted monomial, found while eliminating redundant monomials and reused to write each monomial
+        orbits = {}
+
         # loop thru every degree in this polynomial
-        for degree in range(1, order + 1):
+        for degree, (number_of_monomials, accepted_monomials) in enumerate(generate_accepted_monomials(variables, monomial_filters, variable_permutations, order, orbits, workers), 1):
 
             # header for this degree
             poly_log.write("<> {} degree <>\n".format(degree))
             poly_log.write("\n")
 
-            # get all the monomials of the current degree
-            monomials = list(generate_monomials(len(variables), degree))
-
             # log number of possible monomials
-            poly_log.write("{} possible {} degree monomials\n".format(len(monomials), degree))
-
-            # filter out monomials from the list based on filters in the poly.in file
-            accepted_monomials = list(filter_monomials(monomials, variables, monomial_filters))
-
-            # filter out redundant monomials (that are a permutation of eachother)
-            accepted_monomials = list(eliminate_redundant_monomials(accepted_monomials, variable_permutations))
+            poly_log.write("{} possible {} degree monomials\n".format(number_of_monomials, degree))
 
             # log number of accpeted terms
             poly_log.write("{} <<== accepted {} degree terms\n".format(len(accepted_monomials), degree))
@@ -175,29 +198,145 @@ def generate_poly(settings_file, input_file, order, output_path):
         with open(output_path + "/poly-model.h", "w") as header_file:
             write_header_file(header_file, total_terms, len(variables))
 
-        # open the three files we will now write to
-        with open(output_path + "/poly-direct.cpp", "w") as cpp_file, open(output_path + "/poly-grd.maple", "w") as grd_file, open(output_path + "/poly-nogrd.maple", "w") as nogrd_file:
-            # write the opening for the cpp file
-            write_cpp_opening(cpp_file, total_terms, len(variables))
+        # open the maple files
+        with open(output_path + "/poly-grd.maple", "w") as grd_file, open(output_path + "/poly-nogrd.maple", "w") as nogrd_file:
 
             # keeps track of what index in a list of all monomials the current monomial would occupy
             monomial_index = 0
 
+            # the orbit of every monomial, in order, to write the C++ from
+            monomial_orbits = []
+
             # loop thru every degree in this polynomial
             for degree in range(1, order + 1):
                 for monomial in total_monomials[degree - 1]:
-                    write_cpp_monomial(cpp_file, monomial_index, monomial, variable_permutations)
-                    write_grd_monomial(grd_file, monomial_index, monomial, variable_permutations)
-                    write_nogrd_monomial(nogrd_file, monomial_index, monomial, variable_permutations)
+                    orbit = orbits[tuple(monomial)]
+
+                    write_grd_monomial(grd_file, monomial_index, orbit)
+                    write_nogrd_monomial(nogrd_file, monomial_index, orbit)
+                    monomial_orbits.append(orbit)
                     monomial_index += 1
 
-                cpp_file.write("\n")
                 grd_file.write("\n")
 
-            write_cpp_closing(cpp_file, total_terms)
             write_grd_closing(grd_file, total_terms, len(variables))
             write_nogrd_closing(nogrd_file, total_terms, len(variables))
 
+        # write eval_direct(), with every product of the variables computed once
+        with open(output_path + "/poly-direct.cpp", "w") as cpp_file:
+            direct_operations = write_direct_cpp(cpp_file, monomial_orbits, total_terms, len(variables))
+
+        # write the exponents of every permutation of every monomial, to evaluate the polynomial in python without compiling it
+        get_polynomial_evaluator(monomial_orbits, len(variables)).write(output_path + "/poly-direct.npy")
+
+        # write the C++ that maple would make from the maple files
+        with open(output_path + "/poly-grd.cpp", "w") as grd_file, open(output_path + "/poly-nogrd.cpp", "w") as nogrd_file:
+            nogrd_operations, grd_operations = write_eval_cpp(grd_file, nogrd_file, monomial_orbits, total_terms, len(variables))
+
+        # log the number of additions and multiplications of each function, and of eval_direct() without shared products
+        poly_log.write("\n")
+        poly_log.write(" Floating point operations of eval_direct(): {} as sums of products, {} with shared products\n".format(
+                count_flat_operations(monomial_orbits), direct_operations))
+        poly_log.write(" Floating point operations of eval(): {} without gradients, {} with gradients\n".format(nogrd_operations,
+                grd_operations))
+
+
+def generate_accepted_monomials(variables, monomial_filters, variable_permutations, order, orbits, workers = 1):
+    """
+    Generates, filters, and eliminates redundant monomials of each degree of a polynomial
+
+    In parallel, the monomials of each degree are partitioned by their first variable with a nonzero degree. Each worker
+    generates, filters, and eliminates redundant monomials in its partitions, and the monomials accepted in every partition
+    are merged in order, so the result is the same as in a single process.
+
+    Args:
+        variables   - list of all variables in the monomials
+        monomial_filters - list of Filters to use to filter the monomials
+        variable_permutations - variable permutations as generated by make_variable_permutations
+        order       - the degree of the polynomial
+        orbits      - dictionary to add the orbit of every accepted monomial to, see eliminate_redundant_monomials()
+        workers     - the number of processes to generate the monomials in. Default is 1.
+
+    Returns:
+        generator of (number of possible monomials, accepted monomials) of each degree from 1 to order
+    """
+
+    # the filters are matched against the variables once, rather than for every monomial
+    monomial_filters = [monomial_filter.compile(variables) for monomial_filter in monomial_filters]
+
+    if workers == 1:
+        for degree in range(1, order + 1):
+
+            # get all the monomials of the current degree
+            monomials = list(generate_monomials(len(variables), degree))
+
+            # filter out monomials from the list based on filters in the poly.in file
+            accepted_monomials = filter_monomials(monomials, monomial_filters)
+
+            # filter out redundant monomials (that are a permutation of eachother)
+            yield len(monomials), list(eliminate_redundant_monomials(accepted_monomials, variable_permutations, orbits))
+
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers = workers, initializer = init_worker, initargs = (variables, monomial_filters, variable_permutations)) as executor:
+
+        for degree in range(1, order + 1):
+
+            number_of_monomials = 0
+            candidate_monomials = []
+
+            # the partitions of the first variables are the largest, so they are started first
+            for partition_size, partition_monomials in executor.map(generate_partition_monomials, itertools.repeat(degree), range(len(variables))):
+
+                number_of_monomials += partition_size
+                candidate_monomials += partition_monomials
+
+            # a monomial that is a permutation of an earlier monomial of its partition is also one of an earlier monomial of all the
+            # partitions, so only the monomials accepted in each partition need to be checked again. The orbits are found again in
+            # this process because the order of the permutations in a set changes when it is sent between processes, which would
+            # change the order of the terms in the output
+            yield number_of_monomials, list(eliminate_redundant_monomials(candidate_monomials, variable_permutations, orbits))
+
+def init_worker(variables, monomial_filters, variable_permutations):
+    """
+    Initializes a worker process of generate_accepted_monomials()
+
+    Args:
+        variables   - list of all variables in the monomials
+        monomial_filters - list of CompiledFilters to use to filter the monomials
+        variable_permutations - variable permutations as generated by make_variable_permutations
+
+    Returns:
+        None
+    """
+
+    global worker_variables, worker_monomial_filters, worker_variable_permutations
+
+    worker_variables = variables
+    worker_monomial_filters = monomial_filters
+    worker_variable_permutations = variable_permutations
+
+def generate_partition_monomials(degree, first_variable):
+    """
+    Generates, filters, and eliminates redundant monomials of a degree whose first variable with a nonzero degree is first_variable,
+    in a worker process of generate_accepted_monomials()
+
+    Args:
+        degree      - the degree of the monomials
+        first_variable - the index of the first variable with a nonzero degree
+
+    Returns:
+        (number of possible monomials, accepted monomials) where accepted monomials are in the order in which they were generated
+    """
+
+    monomials = list(generate_monomials_from_variable(len(worker_variables), degree, first_variable))
+
+    accepted_monomials = filter_monomials(monomials, worker_monomial_filters)
+
+    accepted_monomials = list(eliminate_redundant_monomials(accepted_monomials, worker_variable_permutations))
+
+    # eliminate_redundant_monomials() reverses the accepted monomials
+    return len(monomials), accepted_monomials[::-1]
 
 def parse_input(input_path):
     """
@@ -419,48 +558,75 @@ def generate_monomials(number_of_vars, degree):
 
     # loop over all possible first non-zero terms
     for v in range(number_of_vars):
+        yield from generate_monomials_from_variable(number_of_vars, degree, v)
+
+def generate_monomials_from_variable(number_of_vars, degree, first_variable):
+    """
+    Generates all possible monomials of a degree whose first variable with a nonzero degree is first_variable, in the same order
+    as generate_monomials()
+
+    Args:
+        number_of_vars - the number of varibles to generate monomials for
+        degree - the degree of each monomial
+        first_variable - the index of the first variable with a nonzero degree
+
+    Returns:
+        A generator of lists of length number of vars with entries adding to degree
+    """
 
-        # loop over all possible degree values of the first non-zero term
-        for d in range(1, degree + 1):
+    # loop over all possible degree values of the first non-zero term
+    for d in range(1, degree + 1):
 
-            # yield from the list created by all zeros before the first non-zero term, then the first non-zero term, then each result of the recursive call on all terms after the first non-zero term with degree equal to degree minus the degree of the first non-zero term
-            yield from ([0 for i in range(v)] + [d] + monomial for monomial in generate_monomials(number_of_vars - v - 1, degree - d))
+        # yield from the list created by all zeros before the first non-zero term, then the first non-zero term, then each result of the recursive call on all terms after the first non-zero term with degree equal to degree minus the degree of the first non-zero term
+        yield from ([0 for i in range(first_variable)] + [d] + monomial for monomial in generate_monomials(number_of_vars - first_variable - 1, degree - d))
 
-def eliminate_redundant_monomials(monomials, variable_permutations):
+def eliminate_redundant_monomials(monomials, variable_permutations, orbits = None):
     """
     Eliminates any monomial that is a permutation of another monomial
 
+    When a monomial is accepted, every one of its permutations is hashed, so any later monomial that is a permutation of an
+    accepted one is found by a single lookup and the monomials are filtered in one pass. Only accepted monomials are ever permuted.
+
     Args:
         monomials - list of monomials as generated by generate_monomials
         variable_permutations - variable permutations as generated by make_variable_permutations
+        orbits - dictionary to add the orbit of every accepted monomial to, as given by get_orbit(), keyed by the monomial as a
+                tuple, so it can be reused without permuting the monomial again. Default is None.
 
     Returns:
-        list of monomials, with redundant monomials filtered out
-    """
-
-    accepted_monomials = monomials[:]
-    index = 0
-    while(True):
-        try:
-            monomial = accepted_monomials[index]
-        except IndexError:
-            break
-        permutated_monomials = set([tuple(permutation) for permutation in permute_monomial(monomial, variable_permutations)])
-        for permutated_monomial in permutated_monomials:
-            try:
-                accepted_monomials.remove(list(permutated_monomial))
-            except ValueError:
-                pass
-
-        accepted_monomials.insert(0, monomial)
-        index += 1
-
-    yield from (x for x in accepted_monomials)
-    
+        list of monomials, with redundant monomials filtered out. The first of each set of monomials that are permutations of
+        each other is kept, and they are in the reverse order of their first appearance in monomials.
+    """
+
+    variable_permutations = numpy.asarray(variable_permutations)
+
+    # every permutation of every monomial accepted so far
+    permutated_monomials = set()
+
+    accepted_monomials = []
+
+    for monomial in monomials:
+
+        # if this monomial is a permutation of one already accepted, then it is redundant
+        if tuple(monomial) in permutated_monomials:
+            continue
+
+        orbit = get_orbit(monomial, variable_permutations)
+
+        permutated_monomials.update(orbit)
+        accepted_monomials.append(monomial)
+
+        if orbits is not None:
+            orbits[tuple(monomial)] = orbit
+
+    yield from reversed(accepted_monomials)
+
 def permute_monomial(monomial1, variable_permutations):
     """
     Takes in a monomial, and returns all permuttions of said monomial
 
+    All the permutations are applied at once by indexing the monomial with the array of variable permutations.
+
     Args:
         monomial1 - the monomial to permute
         variable_permutations - the permutations of the variables in the monomial as geneated by make_variable_permutations
@@ -469,41 +635,49 @@ def permute_monomial(monomial1, variable_permutations):
         List of all monomials created by permuting monomial1 by all the variable_permutations
     """
 
-    for variable_permutation in variable_permutations:
+    # the variable at index i of a permutation moves to the index of i in the permutation, so the degree of variable j
+    # in the permutated monomial is the degree of variable permutation[j] in the monomial. There is no need for the inverse permutation.
+    return numpy.asarray(monomial1)[numpy.asarray(variable_permutations)].tolist()
 
-        monomial1_permutation = [0 for i in monomial1]
+def get_orbit(monomial, variable_permutations):
+    """
+    Gets the set of all the distinct permutations of a monomial
 
-        for index, degree in zip(range(len(monomial1)), monomial1):
+    Args:
+        monomial - the monomial to permute
+        variable_permutations - the permutations of the variables in the monomial as geneated by make_variable_permutations
 
-            if degree == 0:
-                continue
-            
-            new_index = variable_permutation.index(index)
-            monomial1_permutation[new_index] = monomial1[index]
+    Returns:
+        set of tuples of the permutations of the monomial
+    """
 
-        yield monomial1_permutation
-            
-def filter_monomials(monomials, variables, monomial_filters):
+    return set(map(tuple, permute_monomial(monomial, variable_permutations)))
+
+def filter_monomials(monomials, monomial_filters):
     """
     Filters a list of monomials with the given filters
 
+    All the monomials are filtered at once, as the rows of a matrix.
+
     Args:
         monomials - list of monomials as generated by generate_monomials()
-        variables - list of all variables in the monomials
-        monomial_filters - list of Filters to use to filter the monomials
+        monomial_filters - list of CompiledFilters to use to filter the monomials, compiled against the variables of the monomials
 
     Returns:
         list of monomials, without any monomial that fails at least 1 filter
     """
-    for monomial in monomials:
-        keep = True
-        for monomial_filter in monomial_filters:
-            if not monomial_filter.keep(monomial, variables):
-                keep = False
-                break
 
-        if keep:
-            yield monomial
+    if len(monomials) == 0 or len(monomial_filters) == 0:
+        return list(monomials)
+
+    monomials = numpy.array(monomials)
+
+    keep = numpy.ones(len(monomials), dtype = bool)
+
+    for monomial_filter in monomial_filters:
+        keep &= monomial_filter.keep(monomials)
+
+    return monomials[keep].tolist()
 
 def write_variable_file(variable_file, variables):
     # variable header comment
@@ -554,40 +728,14 @@ double poly_model::eval_direct(const double a[{0}], const double x[{1}])
     double p[{0}];
 """.format(total_terms, number_of_variables))
 
-def write_cpp_monomial(cpp_file, index, monomial, variable_permutations):
-    cpp_file.write("    p[{}] = ".format(index))
-
-    first_term = True
-    for permutation in set([tuple(permutation) for permutation in permute_monomial(monomial, variable_permutations)]):
-
-        if not first_term:
-            cpp_file.write(" + ")
+def write_cpp_monomial(cpp_file, index, terms):
+    cpp_file.write("    p[{}] = {};\n".format(index, " + ".join(terms)))
 
-        first_term = False;
-
-        first_factor = True
-        
-        for variable_index, degree in enumerate(permutation):
-
-            if degree == 0:
-                continue
-
-            for term in range(degree):
-
-                if not first_factor:
-                    cpp_file.write("*")
-
-                first_factor = False
-
-                cpp_file.write("x[{}]".format(variable_index))
-
-    cpp_file.write(";\n")                
-
-def write_grd_monomial(grd_file, index, monomial, variable_permutations):
+def write_grd_monomial(grd_file, index, orbit):
     grd_file.write("    p[{}] := ".format(index))
 
     first_term = True
-    for permutation in set([tuple(permutation) for permutation in permute_monomial(monomial, variable_permutations)]):
+    for permutation in orbit:
 
         if not first_term:
             grd_file.write("+")
@@ -612,11 +760,11 @@ def write_grd_monomial(grd_file, index, monomial, variable_permutations):
 
     grd_file.write(":\n")                
 
-def write_nogrd_monomial(nogrd_file, index, monomial, variable_permutations):
+def write_nogrd_monomial(nogrd_file, index, orbit):
     nogrd_file.write("    p[{}] := ".format(index))
 
     first_term = True
-    for permutation in set([tuple(permutation) for permutation in permute_monomial(monomial, variable_permutations)]):
+    for permutation in orbit:
 
         if not first_term:
             nogrd_file.write("+")
@@ -641,6 +789,114 @@ def write_nogrd_monomial(nogrd_file, index, monomial, variable_permutations):
 
     nogrd_file.write(":\n")                
 
+def write_direct_cpp(cpp_file, orbits, total_terms, number_of_variables):
+    """
+    Writes the C++ of poly_model::eval_direct(), which computes the sum of the permutations of each monomial and then the energy
+
+    Every product of the variables is computed once, as the product of a smaller product times one variable, and reused in every
+    monomial it is part of.
+
+    Args:
+        cpp_file    - the file to write to
+        orbits      - list of the permutations of the monomial of each term of the polynomial, in order
+        total_terms - the number of terms of the polynomial
+        number_of_variables - the number of variables of the polynomial
+
+    Returns:
+        the number of additions and multiplications of eval_direct()
+    """
+
+    write_cpp_opening(cpp_file, total_terms, number_of_variables)
+
+    program, permutations = build_product_program(orbits, number_of_variables)
+
+    products = [product for orbit in permutations for product in orbit]
+
+    names = iter(program.write_cpp(cpp_file, products))
+
+    cpp_file.write("\n")
+
+    degree = None
+
+    for index, orbit in enumerate(orbits):
+
+        # monomials of each degree are separated by a blank line
+        if degree is not None and sum(next(iter(orbit))) != degree:
+            cpp_file.write("\n")
+
+        degree = sum(next(iter(orbit)))
+
+        write_cpp_monomial(cpp_file, index, [next(names) for permutation in orbit])
+
+    cpp_file.write("\n")
+
+    write_cpp_closing(cpp_file, total_terms)
+
+    # the permutations of each monomial are added together, and each coefficient is multiplied by its sum and added to the energy
+    return program.count_operations(products) + sum(len(orbit) - 1 for orbit in orbits) + 2 * total_terms
+
+def write_eval_cpp(grd_file, nogrd_file, orbits, total_terms, number_of_variables):
+    """
+    Writes the C++ of the energy and gradients of a polynomial, and of its energy alone, without maple
+
+    The energy is computed in Horner form, see build_polynomial_program(), and the gradients are found by reverse mode
+    differentiation of the program that computes it.
+
+    Args:
+        grd_file    - the file to write poly_model::eval() with gradients to
+        nogrd_file  - the file to write poly_model::eval() without gradients to
+        orbits      - list of the permutations of the monomial of each term of the polynomial, in order
+        total_terms - the number of terms of the polynomial
+        number_of_variables - the number of variables of the polynomial
+
+    Returns:
+        (number of additions and multiplications without gradients, number with gradients)
+    """
+
+    program, energy, variables = build_polynomial_program(orbits, number_of_variables)
+
+    nogrd_file.write("""#include "poly-model.h"
+
+namespace mb_system {{
+
+double poly_model::eval(const double a[{0}], const double x[{1}])
+{{
+""".format(total_terms, number_of_variables))
+
+    energy_expression, = program.write_cpp(nogrd_file, [energy])
+
+    nogrd_file.write("""    return {};
+
+}}
+
+}} // namespace mb_system
+""".format(energy_expression))
+
+    gradient = program.gradient(energy, variables) if energy is not None else [None for variable in variables]
+
+    grd_file.write("""#include "poly-model.h"
+
+namespace mb_system {{
+
+double poly_model::eval(const double a[{0}], const double x[{1}],
+                        double g[{1}])
+{{
+""".format(total_terms, number_of_variables))
+
+    energy_expression, *gradient_expressions = program.write_cpp(grd_file, [energy] + gradient)
+
+    for index, gradient_expression in enumerate(gradient_expressions):
+        grd_file.write("    g[{}] = {};\n".format(index, gradient_expression))
+
+    grd_file.write("""    return {};
+
+}}
+
+}} // namespace mb_system
+""".format(energy_expression))
+
+    return program.count_operations([energy]), program.count_operations([energy] + gradient)
+
 def write_cpp_closing(cpp_file, total_terms):
     cpp_file.write("""    double energy(0);
     for(int i = 0; i < {}; ++i)
@@ -0,0 +1,204 @@
+import numpy
+
+from potential_fitting.exceptions import InvalidValueError, InconsistentValueError
+
+# the number of permutation values to compute at once is at most about this many, so the memory used does not grow with the
+# number of configurations and each batch stays in cache
+EVALUATOR_BATCH_ELEMENTS = 1 << 19
+
+class PolynomialEvaluator(object):
+    """
+    Evaluates a polynomial written by generate_poly for many configurations at once, without compiling its C++
+
+    Every permutation of every monomial of the polynomial is a row of a matrix of the degrees of the variables, so the design
+    matrix of the polynomial, the sum of the permutations of each monomial for each configuration, is computed by indexing
+    a table of the powers of the variables of the configurations.
+    """
+
+    def __init__(self, term_indices, exponents):
+        """
+        Creates a new PolynomialEvaluator
+
+        Args:
+            term_indices - array of the index of the term of the polynomial each permutation is part of, in increasing order
+            exponents   - array of shape (number of permutations, number of variables) of the degree of each variable in each
+                    permutation
+
+        Returns:
+            A new PolynomialEvaluator
+        """
+
+        self.term_indices = numpy.asarray(term_indices, dtype = int)
+        self.exponents = numpy.asarray(exponents, dtype = int)
+
+        if numpy.any(numpy.diff(self.term_indices) < 0):
+            raise InvalidValueError("term_indices", self.term_indices, "in increasing order")
+
+        self.number_of_variables = self.exponents.shape[1]
+        self.number_of_terms = int(self.term_indices[-1]) + 1 if len(self.term_indices) > 0 else 0
+
+        # the index of the first permutation of each term
+        self.term_starts = numpy.searchsorted(self.term_indices, numpy.arange(self.number_of_terms))
+
+        self.max_degree = int(self.exponents.max()) if self.exponents.size > 0 else 0
+
+        # the powers of the variables of the configurations are a table with a row for each degree of each variable, so each
+        # permutation is the product of the rows of its variables. Permutations with fewer variables than others are padded
+        # with the row of variable 0 to the power 0, which is 1.
+        max_factors = int((self.exponents > 0).sum(axis = 1).max()) if self.exponents.size > 0 else 0
+
+        self.factor_rows = numpy.zeros((len(self.exponents), max_factors), dtype = int)
+
+        for index, permutation in enumerate(self.exponents):
+            variables = numpy.flatnonzero(permutation)
+            self.factor_rows[index, :len(variables)] = variables * (self.max_degree + 1) + permutation[variables]
+
+    def generate_design_matrix(self, x, batch_size = None):
+        """
+        Generates the rows of the design matrix of the polynomial in batches
+
+        Args:
+            x           - array of shape (number of configurations, number of variables) of the variables of each configuration
+            batch_size  - the number of configurations in each batch. Default is None, for as many as fit in
+                    EVALUATOR_BATCH_ELEMENTS permutation values.
+
+        Returns:
+            generator of (index of the first configuration, array of shape (batch size, number of terms)) of each batch
+        """
+
+        x = numpy.asarray(x, dtype = float)
+
+        if x.ndim != 2 or x.shape[1] != self.number_of_variables:
+            raise InconsistentValueError("number of variables of the polynomial", "shape of x", self.number_of_variables, x.shape,
+                    "x must have one column per variable of the polynomial")
+
+        if batch_size is None:
+            batch_size = max(1, EVALUATOR_BATCH_ELEMENTS // max(1, len(self.exponents)))
+
+        degrees = numpy.arange(self.max_degree + 1)
+
+        for start in range(0, len(x), batch_size):
+
+            batch = x[start:start + batch_size]
+
+            if self.number_of_terms == 0:
+                yield start, numpy.zeros((len(batch), 0))
+                continue
+
+            # the configurations are the columns, so each permutation is computed from whole rows of the table of powers
+            powers = (batch.T[:, numpy.newaxis, :] ** degrees[:, numpy.newaxis]).reshape(-1, len(batch))
+
+            permutations = numpy.ones((len(self.exponents), len(batch)))
+
+            for factor in range(self.factor_rows.shape[1]):
+                permutations *= powers[self.factor_rows[:, factor]]
+
+            yield start, numpy.add.reduceat(permutations, self.term_starts, axis = 0).T
+
+    def get_design_matrix(self, x, batch_size = None):
+        """
+        Computes the design matrix of the polynomial, the sum of the permutations of each monomial for each configuration, which
+        is the p array of poly_model::eval_direct()
+
+        Args:
+            x           - array of shape (number of configurations, number of variables) of the variables of each configuration
+            batch_size  - the number of configurations to compute at once. Default is None, see generate_design_matrix().
+
+        Returns:
+            array of shape (number of configurations, number of terms)
+        """
+
+        x = numpy.asarray(x, dtype = float)
+
+        design_matrix = numpy.empty((len(x), self.number_of_terms))
+
+        for start, batch in self.generate_design_matrix(x, batch_size):
+            design_matrix[start:start + len(batch)] = batch
+
+        return design_matrix
+
+    def evaluate(self, a, x, design_matrix = False, batch_size = None):
+        """
+        Evaluates the polynomial for many configurations, like poly_model::eval_direct()
+
+        Args:
+            a           - array of the coefficients of the terms of the polynomial
+            x           - array of shape (number of configurations, number of variables) of the variables of each configuration,
+                    or the variables of a single configuration
+            design_matrix - if True, the design matrix is also returned. Otherwise, it is never all in memory at once.
+                    Default is False.
+            batch_size  - the number of configurations to compute at once. Default is None, see generate_design_matrix().
+
+        Returns:
+            array of the energy of each configuration, or a single float if x was a single configuration. If design_matrix is
+            True, (energies, design matrix) instead.
+        """
+
+        a = numpy.asarray(a, dtype = float)
+
+        if a.shape != (self.number_of_terms,):
+            raise InconsistentValueError("number of terms of the polynomial", "number of coefficients", self.number_of_terms,
+                    len(a), "there must be one coefficient per term")
+
+        x = numpy.asarray(x, dtype = float)
+
+        if x.ndim == 1:
+            energies, matrix = self.evaluate(a, x[numpy.newaxis], True, batch_size)
+            return (float(energies[0]), matrix[0]) if design_matrix else float(energies[0])
+
+        if design_matrix:
+            matrix = self.get_design_matrix(x, batch_size)
+            return matrix @ a, matrix
+
+        energies = numpy.empty(len(x))
+
+        for start, batch in self.generate_design_matrix(x, batch_size):
+            energies[start:start + len(batch)] = batch @ a
+
+        return energies
+
+    def write(self, path):
+        """
+        Writes this evaluator to a .npy file, as an array with a row for each permutation of the index of its term followed by
+        its exponents
+
+        Args:
+            path        - the file to write to
+
+        Returns:
+            None
+        """
+
+        numpy.save(path, numpy.column_stack([self.term_indices, self.exponents]).astype(numpy.int32))
+
+def get_polynomial_evaluator(orbits, number_of_variables):
+    """
+    Makes the evaluator of a polynomial from the permutations of its monomials
+
+    Args:
+        orbits      - list of the permutations of the monomial of each term of the polynomial, in order
+        number_of_variables - the number of variables of the polynomial
+
+    Returns:
+        A new PolynomialEvaluator
+    """
+
+    term_indices = [index for index, orbit in enumerate(orbits) for permutation in orbit]
+    exponents = [permutation for orbit in orbits for permutation in orbit]
+
+    return PolynomialEvaluator(term_indices, numpy.reshape(exponents, (len(exponents), number_of_variables)))
+
+def read_polynomial_evaluator(path):
+    """
+    Reads the evaluator of a polynomial from the poly-direct.npy file written by generate_poly
+
+    Args:
+        path        - the .npy file to read
+
+    Returns:
+        A new PolynomialEvaluator
+    """
+
+    permutations = numpy.load(path)
+
+    return PolynomialEvaluator(permutations[:, 0], permutations[:, 1:])
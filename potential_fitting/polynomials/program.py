@@ -0,0 +1,391 @@
+import numpy
+
+class Program(object):
+    """
+    A straight-line program of additions and multiplications of the inputs of a polynomial, which can be differentiated in
+    reverse mode and written as C++
+
+    Each operation is a node, identified by its index. Nodes may only use nodes before them, so the nodes are always in an order
+    in which they can be evaluated.
+    """
+
+    def __init__(self):
+        """
+        Creates a new empty Program
+
+        Returns:
+            A new Program
+        """
+
+        # list of (operation, left, right) of each node. For inputs, operation is the name of the input array and left is the
+        # index in it. For constants, operation is "const" and left is the value. Otherwise operation is "+" or "*" and left and
+        # right are the indices of the nodes it operates on.
+        self.nodes = []
+
+        # index of the node of each input or constant, so each is only in the program once
+        self.leaves = {}
+
+    def input(self, name, index):
+        """
+        Gets the node of an element of an input array of this program
+
+        Args:
+            name        - the name of the input array, such as "x"
+            index       - the index of the element in the array
+
+        Returns:
+            the index of the node of the input
+        """
+
+        return self.get_leaf(name, index)
+
+    def constant(self, value):
+        """
+        Gets the node of a constant
+
+        Args:
+            value       - the value of the constant
+
+        Returns:
+            the index of the node of the constant
+        """
+
+        return self.get_leaf("const", float(value))
+
+    def get_leaf(self, operation, value):
+        """
+        Gets the node of an input or constant, adding it if it is not in this program yet
+
+        Args:
+            operation   - the name of the input array, or "const"
+            value       - the index in the input array, or the value of the constant
+
+        Returns:
+            the index of the node of the leaf
+        """
+
+        if (operation, value) not in self.leaves:
+            self.leaves[(operation, value)] = len(self.nodes)
+            self.nodes.append((operation, value, None))
+
+        return self.leaves[(operation, value)]
+
+    def add(self, left, right):
+        """
+        Adds two nodes
+
+        Args:
+            left        - the index of the first node to add
+            right       - the index of the second node to add
+
+        Returns:
+            the index of the node of the sum
+        """
+
+        self.nodes.append(("+", left, right))
+
+        return len(self.nodes) - 1
+
+    def multiply(self, left, right):
+        """
+        Multiplies two nodes, where multiplying by the constant 1 is skipped
+
+        Args:
+            left        - the index of the first node to multiply
+            right       - the index of the second node to multiply
+
+        Returns:
+            the index of the node of the product
+        """
+
+        if self.nodes[left] == ("const", 1.0, None):
+            return right
+
+        if self.nodes[right] == ("const", 1.0, None):
+            return left
+
+        self.nodes.append(("*", left, right))
+
+        return len(self.nodes) - 1
+
+    def sum(self, nodes):
+        """
+        Adds any number of nodes
+
+        Args:
+            nodes       - list of the indices of the nodes to add
+
+        Returns:
+            the index of the node of the sum, or None if there are no nodes to add
+        """
+
+        total = None
+
+        for node in nodes:
+            total = node if total is None else self.add(total, node)
+
+        return total
+
+    def gradient(self, output, inputs):
+        """
+        Differentiates a node with respect to some inputs by reverse mode differentiation
+
+        The adjoint of every node that depends on the inputs is accumulated by going back through the nodes the output depends on.
+        The nodes of the adjoints are added to this program, so the gradient costs a small multiple of the operations of the output,
+        however many inputs there are.
+
+        Args:
+            output      - the index of the node to differentiate
+            inputs      - list of the indices of the input nodes to differentiate with respect to
+
+        Returns:
+            list of the index of the node of the derivative with respect to each input, or None where it is 0
+        """
+
+        # only nodes that depend on the inputs have a derivative
+        active = [False for node in self.nodes]
+
+        for node in inputs:
+            active[node] = True
+
+        for node, (operation, left, right) in enumerate(self.nodes):
+            if operation in ("+", "*"):
+                active[node] = active[left] or active[right]
+
+        adjoints = {output: self.constant(1)}
+
+        def accumulate(node, adjoint):
+            if active[node]:
+                adjoints[node] = self.add(adjoints[node], adjoint) if node in adjoints else adjoint
+
+        # every node that uses a node comes after it, so its adjoint is complete by the time it is reached
+        for node in range(output, -1, -1):
+
+            if node not in adjoints:
+                continue
+
+            operation, left, right = self.nodes[node]
+
+            if operation == "+":
+                accumulate(left, adjoints[node])
+                accumulate(right, adjoints[node])
+
+            # the adjoint of a square is the same product twice, so it is only computed once
+            elif operation == "*" and left == right:
+                product = self.multiply(adjoints[node], left)
+                accumulate(left, product)
+                accumulate(left, product)
+
+            elif operation == "*":
+                if active[left]:
+                    accumulate(left, self.multiply(adjoints[node], right))
+                if active[right]:
+                    accumulate(right, self.multiply(adjoints[node], left))
+
+        return [adjoints.get(node) for node in inputs]
+
+    def evaluate(self, inputs):
+        """
+        Evaluates every node of this program
+
+        Args:
+            inputs      - dictionary of the values of each input array, by name
+
+        Returns:
+            list of the value of each node
+        """
+
+        values = []
+
+        for operation, left, right in self.nodes:
+            if operation == "+":
+                values.append(values[left] + values[right])
+            elif operation == "*":
+                values.append(values[left] * values[right])
+            elif operation == "const":
+                values.append(left)
+            else:
+                values.append(inputs[operation][left])
+
+        return values
+
+    def count_operations(self, outputs):
+        """
+        Counts the additions and multiplications needed to compute some nodes
+
+        Args:
+            outputs     - list of the indices of the nodes to compute, None is skipped
+
+        Returns:
+            the number of operations of the nodes the outputs depend on
+        """
+
+        return sum(self.nodes[node][0] in ("+", "*") for node in self.get_needed_nodes(outputs))
+
+    def get_needed_nodes(self, outputs):
+        """
+        Finds the nodes some nodes depend on
+
+        Args:
+            outputs     - list of the indices of the nodes to compute, None is skipped
+
+        Returns:
+            sorted list of the indices of the nodes needed to compute the outputs, including the outputs
+        """
+
+        needed = numpy.zeros(len(self.nodes), dtype = bool)
+
+        for node in outputs:
+            if node is not None:
+                needed[node] = True
+
+        for node in range(len(self.nodes) - 1, -1, -1):
+            operation, left, right = self.nodes[node]
+
+            if needed[node] and operation in ("+", "*"):
+                needed[left] = True
+                needed[right] = True
+
+        return numpy.flatnonzero(needed).tolist()
+
+    def write_cpp(self, cpp_file, outputs):
+        """
+        Writes the statements that compute some nodes of this program as C++, one const double per operation, in the style of
+        maple's optimized C output
+
+        Inputs are used as array elements and constants are written as literals, so only operations get a variable.
+
+        Args:
+            cpp_file    - the file to write to
+            outputs     - list of the indices of the nodes to compute, None is skipped
+
+        Returns:
+            list of the C++ expression of each output, "0.0" where it is None
+        """
+
+        names = {}
+
+        number_of_temporaries = 0
+
+        for node in self.get_needed_nodes(outputs):
+            operation, left, right = self.nodes[node]
+
+            if operation == "const":
+                names[node] = repr(left)
+
+            elif operation not in ("+", "*"):
+                names[node] = "{}[{}]".format(operation, left)
+
+            else:
+                number_of_temporaries += 1
+                names[node] = "t{}".format(number_of_temporaries)
+                cpp_file.write("    const double {} = {}{}{};\n".format(names[node], names[left], operation, names[right]))
+
+        return ["0.0" if node is None else names[node] for node in outputs]
+
+def build_polynomial_program(orbits, number_of_variables):
+    """
+    Builds the program of the energy of a polynomial, the sum of each of its coefficients times the sum of the permutations of
+    its monomial, in Horner form
+
+    Every permutation of every monomial is a path from the root of a tree, which takes one factor of its variables at a time,
+    in the order of the variables. Each node of the tree is the coefficient of the monomial that ends there, if any, plus each
+    variable times the node it leads to, so every factor common to several monomials is only multiplied once and the coefficients
+    never are.
+
+    Args:
+        orbits      - list of the permutations of the monomial of each term of the polynomial, in the order of the coefficients
+        number_of_variables - the number of variables of the polynomial
+
+    Returns:
+        (program, index of the node of the energy, list of the indices of the nodes of the variables)
+    """
+
+    program = Program()
+
+    variables = [program.input("x", index) for index in range(number_of_variables)]
+
+    # each node of the tree is a dictionary from the index of the next variable to the next node, with the index of the
+    # coefficient of the monomial that ends at this node under None
+    tree = {}
+
+    for index, orbit in enumerate(orbits):
+        for permutation in orbit:
+
+            node = tree
+
+            for variable_index, degree in enumerate(permutation):
+                for repeat in range(degree):
+                    node = node.setdefault(variable_index, {})
+
+            node[None] = index
+
+    def build_node(node):
+        terms = [program.input("a", node[None])] if None in node else []
+
+        for variable_index in sorted(key for key in node if key is not None):
+            terms.append(program.multiply(variables[variable_index], build_node(node[variable_index])))
+
+        return program.sum(terms)
+
+    return program, build_node(tree), variables
+
+def build_product_program(orbits, number_of_variables):
+    """
+    Builds the program of the products of the variables in every permutation of the monomials of a polynomial
+
+    Each product is the product of a smaller one times one variable, and each product is only in the program once, so every
+    product costs a single multiplication, however many monomials it is part of.
+
+    Args:
+        orbits      - list of the permutations of the monomial of each term of the polynomial
+        number_of_variables - the number of variables of the polynomial
+
+    Returns:
+        (program, list of the list of the indices of the nodes of the permutations of each monomial)
+    """
+
+    program = Program()
+
+    # the node of each product, by the degree of each variable in it
+    products = {}
+
+    for variable_index in range(number_of_variables):
+        products[tuple(int(index == variable_index) for index in range(number_of_variables))] = program.input("x", variable_index)
+
+    def get_product(monomial):
+        if monomial not in products:
+
+            # the product of the monomial without one of its last variable, times that variable
+            last_variable = max(index for index, degree in enumerate(monomial) if degree > 0)
+
+            smaller_monomial = list(monomial)
+            smaller_monomial[last_variable] -= 1
+
+            products[monomial] = program.multiply(get_product(tuple(smaller_monomial)), products[tuple(int(index == last_variable)
+                    for index in range(number_of_variables))])
+
+        return products[monomial]
+
+    return program, [[get_product(tuple(permutation)) for permutation in orbit] for orbit in orbits]
+
+def count_flat_operations(orbits):
+    """
+    Counts the additions and multiplications to compute the energy of a polynomial as the sum of each of its coefficients times
+    the sum of the permutations of its monomial, with each permutation multiplied out on its own
+
+    Args:
+        orbits      - list of the permutations of the monomial of each term of the polynomial
+
+    Returns:
+        the number of operations
+    """
+
+    # each permutation is 1 multiplication less than its degree
+    multiplications = sum(sum(permutation) - 1 for orbit in orbits for permutation in orbit)
+
+    # the permutations of each monomial are added together
+    additions = sum(len(orbit) - 1 for orbit in orbits)
+
+    # each coefficient is multiplied by its sum and added to the energy
+    return multiplications + additions + 2 * len(orbits)
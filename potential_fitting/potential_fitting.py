@@ -66,7 +66,7 @@ def generate_normal_modes(settings_path, geo, normal_modes):
     return dim_null
 
 
-def generate_1b_configurations(settings_path, geo, normal_modes, dim_null, config_path):
+def generate_1b_configurations(settings_path, geo, normal_modes, dim_null, config_path, seed = None, database_name = None):
     """
     Generates 1b configurations for a given monomer from a set of normal modes
 
@@ -75,20 +75,24 @@ def generate_1b_configurations(settings_path, geo, normal_modes, dim_null, confi
         geo         - file to read optimized geometry
         normal_modes - file to read normal modes
         dim_null    - the DIM NULL of this molecule, see generate_normal_modes()
-        config_path - file to write configurations
+        config_path - file to write configurations, may be None if database_name is given
+        seed        - seed of the pseudo-random numbers used when the random setting is P. Default is None, for different
+                configurations every time.
+        database_name - database to add the configurations to as they are generated. Default is None, to not add them to any database.
 
     Returns:
         None
     """
 
-    if os.path.dirname(config_path) == "":
-        config_path = "./" + config_path
-    if not os.path.isdir(os.path.dirname(config_path)):
-        os.mkdir(os.path.dirname(config_path))
+    if config_path is not None:
+        if os.path.dirname(config_path) == "":
+            config_path = "./" + config_path
+        if not os.path.isdir(os.path.dirname(config_path)):
+            os.mkdir(os.path.dirname(config_path))
 
-    configurations.generate_1b_configurations(settings_path, geo, normal_modes, dim_null, config_path)
+    configurations.generate_1b_configurations(settings_path, geo, normal_modes, dim_null, config_path, seed, database_name)
 
-def generate_2b_configurations(settings_path, geo1, geo2, number_of_configs, config_path, min_distance = 1, max_distance = 5, min_inter_distance = 1.2, use_grid = False, step_size = 0.5, seed = random.randint(-1000000, 1000000)):
+def generate_2b_configurations(settings_path, geo1, geo2, number_of_configs, config_path, min_distance = 1, max_distance = 5, min_inter_distance = 1.2, use_grid = False, step_size = 0.5, seed = random.randint(-1000000, 1000000), workers = 1, orientation_sampler = "random"):
     """
     Generates 2b configurations for a given dimer
 
@@ -103,7 +107,9 @@ def generate_2b_configurations(settings_path, geo1, geo2, number_of_configs, con
         min_inter_distance - the minimum distance of any intermolecular pair of atoms
         use_grid - if False, configurations are space roughly evenly between min_distance and max_distance. If True, then configurations are placed at intervals along this distance.
         step_size - if use_grid is True, then this dictates the distance of the spacing interval used to place the centers of masses of the molecules, otherwise, this parameter has no effect.
-        seed - the same seed will generate the same configurations.
+        seed - the same seed will generate the same configurations, regardless of workers.
+        workers - the number of processes to generate configurations in.
+        orientation_sampler - "random" for random orientations, or "sobol" for more evenly spread orientations from a low-discrepancy sequence.
 
     Returns:
         None
@@ -114,7 +120,7 @@ def generate_2b_configurations(settings_path, geo1, geo2, number_of_configs, con
     if not os.path.isdir(os.path.dirname(config_path)):
         os.mkdir(os.path.dirname(config_path))
 
-    configurations.generate_2b_configurations(geo1, geo2, number_of_configs, config_path, min_distance, max_distance, min_inter_distance, use_grid, step_size, seed)
+    configurations.generate_2b_configurations(geo1, geo2, number_of_configs, config_path, min_distance, max_distance, min_inter_distance, use_grid, step_size, seed, workers, orientation_sampler)
 
 def init_database(settings_path, database_name, config_files):
     """
@@ -137,19 +143,20 @@ def init_database(settings_path, database_name, config_files):
 
     database.initialize_database(settings_path, database_name, config_files)
 
-def fill_database(settings_path, database_name):
+def fill_database(settings_path, database_name, workers = 1):
     """
     Fills a given database with calculated energies, MAY TAKE A WHILE
     
     Args:
         settings_path - the file containing all relevent settings information
         database_name - the file in which the database is stored
+        workers     - the number of processes to calculate energies in, the threads and memory in the settings file are divided between them
 
     Returns:
         None
     """
 
-    database.fill_database(settings_path, database_name)
+    database.fill_database(settings_path, database_name, workers)
 
 def generate_1b_training_set(settings_path, database_name, training_set, molecule_name, method = "%", basis = "%", cp = "%", tag = "%"):
     """
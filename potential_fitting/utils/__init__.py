@@ -1,3 +1,4 @@
 from .settings_reader import SettingsReader
 from .utils import *
-from .quaternion import Quaternion
+from .quaternion import Quaternion, get_rotation_matrices, get_random_rotation_matrices, get_cube_rotation_matrices, get_sobol_rotation_matrices
+from .sobol import get_sobol_points
@@ -1,6 +1,10 @@
 import math
 from random import Random
 
+import numpy
+
+from .sobol import get_sobol_points
+
 class Quaternion(object):
 
     def get_random_quaternion(random = Random()):
@@ -223,3 +227,124 @@ class Quaternion(object):
         z = rotated_quaternion.k + origin_z
 
         return x, y, z
+
+    def get_rotation_matrix(self):
+        """
+        Gets the matrix that performs the same rotation as rotate(), so many points can be rotated at once
+
+        Args:
+            None
+
+        Returns:
+            array of shape (3, 3) such that rotating the row vector p about the origin gives p @ matrix
+        """
+
+        r, i, j, k = self.r, self.i, self.j, self.k
+
+        # the matrix of q * v * q.conjugate(), which is a rotation matrix if this Quaternion is a unit Quaternion
+        return numpy.array([
+            [r * r + i * i - j * j - k * k, 2 * (i * j - r * k), 2 * (i * k + r * j)],
+            [2 * (i * j + r * k), r * r - i * i + j * j - k * k, 2 * (j * k - r * i)],
+            [2 * (i * k - r * j), 2 * (j * k + r * i), r * r - i * i - j * j + k * k]
+        ]).T
+
+    def rotate_points(self, points, origin_x = 0, origin_y = 0, origin_z = 0):
+        """
+        Rotates many points in space at once by the rotation defined by this Quaternion, equivalent to calling rotate() on each of them
+
+        Args:
+            points - array of shape (number of points, 3), rotated in place
+            origin_x - the x of the point to rotate about
+            origin_y - the y of the point to rotate about
+            origin_z - the z of the point to rotate about
+
+        Returns:
+            None
+        """
+
+        origin = numpy.array([origin_x, origin_y, origin_z], dtype = float)
+
+        points[:] = (points - origin) @ self.get_rotation_matrix() + origin
+
+def get_rotation_matrices(quaternions):
+    """
+    Gets the rotation matrices of many unit Quaternions at once, same as Quaternion.get_rotation_matrix()
+
+    Args:
+        quaternions - array of shape (..., 4) of the r, i, j, k components of unit Quaternions
+
+    Returns:
+        array of shape (..., 3, 3) such that rotating the row vector p by each Quaternion gives p @ matrix
+    """
+
+    r, i, j, k = numpy.moveaxis(numpy.asarray(quaternions, dtype = float), -1, 0)
+
+    # the transpose of the matrix of q * v * q.conjugate(), see Quaternion.get_rotation_matrix()
+    return numpy.stack([
+        numpy.stack([r * r + i * i - j * j - k * k, 2 * (i * j + r * k), 2 * (i * k - r * j)], axis = -1),
+        numpy.stack([2 * (i * j - r * k), r * r - i * i + j * j - k * k, 2 * (j * k + r * i)], axis = -1),
+        numpy.stack([2 * (i * k + r * j), 2 * (j * k - r * i), r * r - i * i - j * j + k * k], axis = -1)
+    ], axis = -2)
+
+def get_random_rotation_matrices(random_state, shape):
+    """
+    Gets many uniformly distributed random rotation matrices at once
+
+    Args:
+        random_state - the numpy RandomState used to generate the rotations
+        shape       - the shape of the array of rotations to generate, as an int or tuple
+
+    Returns:
+        array of shape (*shape, 3, 3) of rotation matrices, see get_rotation_matrices()
+    """
+
+    if isinstance(shape, int):
+        shape = (shape,)
+
+    # normalizing a 4d gaussian gives a point uniformly distributed on the unit hypersphere, which is a uniformly distributed rotation
+    quaternions = random_state.normal(size = tuple(shape) + (4,))
+    quaternions /= numpy.linalg.norm(quaternions, axis = -1)[..., numpy.newaxis]
+
+    return get_rotation_matrices(quaternions)
+
+def get_cube_rotation_matrices(points):
+    """
+    Maps points in the unit cube to rotation matrices, such that uniformly distributed points give uniformly distributed rotations
+
+    Uses the map of K. Shoemake, "Uniform random rotations", Graphics Gems III (1992), which follows the Hopf fibration of the rotations,
+    so evenly spread points in the cube give evenly spread rotations.
+
+    Args:
+        points      - array of shape (..., 3) of points in [0, 1)
+
+    Returns:
+        array of shape (..., 3, 3) of rotation matrices, see get_rotation_matrices()
+    """
+
+    u1, u2, u3 = numpy.moveaxis(numpy.asarray(points, dtype = float), -1, 0)
+
+    quaternions = numpy.stack([
+        numpy.sqrt(1 - u1) * numpy.sin(2 * math.pi * u2),
+        numpy.sqrt(1 - u1) * numpy.cos(2 * math.pi * u2),
+        numpy.sqrt(u1) * numpy.sin(2 * math.pi * u3),
+        numpy.sqrt(u1) * numpy.cos(2 * math.pi * u3)
+    ], axis = -1)
+
+    return get_rotation_matrices(quaternions)
+
+def get_sobol_rotation_matrices(indices, rotations, shift = None):
+    """
+    Gets sets of rotations from the Sobol low-discrepancy sequence, which cover the space of rotations much more evenly than random rotations
+
+    Args:
+        indices     - array of the indices in the Sobol sequence of each set of rotations
+        rotations   - the number of rotations in each set, each uses 3 dimensions of the sequence
+        shift       - array of 3 * rotations integers used to randomize the sequence, see sobol.get_sobol_points(). Default is None, for no shift.
+
+    Returns:
+        array of shape (number of indices, rotations, 3, 3) of rotation matrices, see get_rotation_matrices()
+    """
+
+    points = get_sobol_points(indices, 3 * rotations, shift)
+
+    return get_cube_rotation_matrices(points.reshape(len(points), rotations, 3))
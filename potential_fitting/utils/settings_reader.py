@@ -172,6 +172,22 @@ class SettingsReader(object):
 
         return parse_array(string, type)
 
+    def getoptions(self, section):
+        """
+        Gets the values of all the fields of a section as strings.
+
+        Args:
+            section - the section of the settings file to look in
+
+        Return:
+            dictionary from each property of the given section to its value as a string, empty if the section does not exist
+        """
+
+        if not self.configparser.has_section(section):
+            return {}
+
+        return dict(self.configparser.items(section))
+
 def parse_array(string, type):
     print(string)
     num_open_brackets = 0
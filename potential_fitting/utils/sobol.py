@@ -0,0 +1,79 @@
+import numpy
+
+from potential_fitting.exceptions import InvalidValueError
+from .sobol_polynomials import SOBOL_POLYNOMIALS
+
+# number of bits of each coordinate of a Sobol point
+SOBOL_BITS = 32
+
+def get_direction_numbers(dimensions):
+    """
+    Gets the direction numbers of the first dimensions of the Sobol sequence
+
+    Args:
+        dimensions  - the number of dimensions
+
+    Returns:
+        array of shape (dimensions, SOBOL_BITS) of the direction numbers as integers
+    """
+
+    if dimensions < 1 or dimensions > len(SOBOL_POLYNOMIALS) + 1:
+        raise InvalidValueError("dimensions", dimensions, "between 1 and {}".format(len(SOBOL_POLYNOMIALS) + 1))
+
+    direction_numbers = numpy.zeros((dimensions, SOBOL_BITS), dtype = numpy.uint64)
+
+    # the first dimension is the van der Corput sequence in base 2
+    direction_numbers[0] = [1 << (SOBOL_BITS - bit - 1) for bit in range(SOBOL_BITS)]
+
+    for dimension, (degree, coefficients, initial) in zip(range(1, dimensions), SOBOL_POLYNOMIALS):
+
+        m = list(initial)
+
+        # m_i = 2 a_1 m_(i-1) ^ 4 a_2 m_(i-2) ^ ... ^ 2^(s-1) a_(s-1) m_(i-s+1) ^ 2^s m_(i-s) ^ m_(i-s)
+        for i in range(degree, SOBOL_BITS):
+            value = m[i - degree] ^ (m[i - degree] << degree)
+
+            for k in range(1, degree):
+                if (coefficients >> (degree - 1 - k)) & 1:
+                    value ^= m[i - k] << k
+
+            m.append(value)
+
+        direction_numbers[dimension] = [m[bit] << (SOBOL_BITS - bit - 1) for bit in range(SOBOL_BITS)]
+
+    return direction_numbers
+
+def get_sobol_points(indices, dimensions, shift = None):
+    """
+    Gets points of the Sobol low-discrepancy sequence in the unit cube
+
+    Any run of 2^m consecutive points starting at a multiple of 2^m puts exactly one point in each of the 2^m equal intervals of each
+    coordinate, so every part of the cube is covered much more evenly than by random points.
+
+    Args:
+        indices     - array of the indices of the points in the sequence
+        dimensions  - the number of dimensions of each point
+        shift       - array of one integer less than 2^SOBOL_BITS per dimension, XORed into every point to randomize the sequence
+                without losing its evenness. Default is None, for no shift.
+
+    Returns:
+        array of shape (number of indices, dimensions) of points in [0, 1)
+    """
+
+    direction_numbers = get_direction_numbers(dimensions)
+
+    indices = numpy.asarray(indices, dtype = numpy.uint64)
+
+    # the nth point is the XOR of the direction numbers of the set bits of the gray code of n
+    gray_codes = indices ^ (indices >> numpy.uint64(1))
+
+    points = numpy.zeros((len(indices), dimensions), dtype = numpy.uint64)
+
+    for bit in range(SOBOL_BITS):
+        is_set = ((gray_codes >> numpy.uint64(bit)) & numpy.uint64(1)).astype(bool)
+        points[is_set] ^= direction_numbers[:, bit]
+
+    if shift is not None:
+        points ^= numpy.asarray(shift, dtype = numpy.uint64)
+
+    return points / float(1 << SOBOL_BITS)
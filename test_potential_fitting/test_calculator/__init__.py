@@ -0,0 +1,4 @@
+import unittest
+from . import test_energy_cache
+
+suite = unittest.TestSuite([test_energy_cache.suite])
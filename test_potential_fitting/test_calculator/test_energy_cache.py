@@ -0,0 +1,123 @@
+import unittest, os, tempfile
+
+from potential_fitting.molecule import Atom, Fragment, Molecule
+from potential_fitting.calculator import EnergyCache, get_energy_cache, get_energy_key, get_energy_options, calculate_energy
+from potential_fitting.utils import SettingsReader
+
+"""
+Test cases for the energy cache of the calculator
+"""
+class TestEnergyCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "cache.db")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    """
+    Makes a dimer of two water molecules, the second one displaced by the given amount
+    """
+    def make_molecule(self, displacement):
+        molecule = Molecule()
+
+        for z in [0, displacement]:
+            water = Fragment("H2O", 0, 1)
+            water.add_atom(Atom("O", "A", 0, 0, z))
+            water.add_atom(Atom("H", "B", 1, 0, z))
+            water.add_atom(Atom("H", "B", 0, 1, z))
+            molecule.add_fragment(water)
+
+        return molecule
+
+    """
+    Tests that the same calculation in different molecules has the same key
+    """
+    def test_get_energy_key(self):
+        molecule1 = self.make_molecule(3)
+        molecule2 = self.make_molecule(4)
+
+        # the first monomer is the same in both dimers, but the ghost atoms of the second are not
+        self.assertEqual(get_energy_key(molecule1, [0], "HF/STO-3G", False, "psi4"), get_energy_key(molecule2, [0], "HF/STO-3G", False, "psi4"))
+        self.assertNotEqual(get_energy_key(molecule1, [0], "HF/STO-3G", True, "psi4"), get_energy_key(molecule2, [0], "HF/STO-3G", True, "psi4"))
+
+        # the model and code are part of the key
+        self.assertNotEqual(get_energy_key(molecule1, [0], "HF/STO-3G", False, "psi4"), get_energy_key(molecule1, [0], "MP2/STO-3G", False, "psi4"))
+        self.assertNotEqual(get_energy_key(molecule1, [0], "HF/STO-3G", False, "psi4"), get_energy_key(molecule1, [0], "HF/STO-3G", False, "qchem"))
+
+    """
+    Tests that the options of the code that may change the energy are part of the key
+    """
+    def test_get_energy_options(self):
+        settings_file = os.path.join(self.directory.name, "settings.ini")
+
+        with open(settings_file, "w") as settings:
+            settings.write("[energy_calculator]\ncode = qchem\n[qchem]\nnum_threads = 4\necp = def2-ecp\n")
+
+        settings = SettingsReader(settings_file)
+        molecule = self.make_molecule(3)
+
+        # the number of threads does not change the energy, so it is not part of the key
+        self.assertEqual(get_energy_options(settings, "qchem"), {"ecp": "def2-ecp"})
+        self.assertEqual(get_energy_options(settings, "psi4"), {})
+
+        self.assertNotEqual(get_energy_key(molecule, [0], "HF/STO-3G", False, "qchem", get_energy_options(settings, "qchem")),
+                get_energy_key(molecule, [0], "HF/STO-3G", False, "qchem"))
+
+    """
+    Tests that energies persist in the cache and are counted as hits and misses
+    """
+    def test_get_set(self):
+        with EnergyCache(self.file_name) as cache:
+            self.assertIsNone(cache.get("key"))
+            cache.set("key", -76.0)
+            self.assertEqual(cache.get("key"), -76.0)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        with EnergyCache(self.file_name) as cache:
+            self.assertEqual(cache.get("key"), -76.0)
+
+    """
+    Tests that calculate_energy() returns cached energies without calling the library
+    """
+    def test_calculate_energy(self):
+        settings_file = os.path.join(self.directory.name, "settings.ini")
+
+        with open(settings_file, "w") as settings:
+            settings.write("[files]\nlog_path = {}\n[energy_calculator]\ncode = nonexistent\nuse_cache = True\n".format(self.directory.name))
+
+        settings = SettingsReader(settings_file)
+        molecule = self.make_molecule(3)
+
+        cache = get_energy_cache(settings)
+        self.assertEqual(os.path.dirname(cache.file_name), self.directory.name)
+        self.assertIs(get_energy_cache(settings), cache)
+
+        cache.set(get_energy_key(molecule, [1], "HF/STO-3G", True, "nonexistent"), -152.0)
+
+        self.assertEqual(calculate_energy(molecule, [1], "HF/STO-3G", True, settings), -152.0)
+        self.assertEqual(cache.hits, 1)
+
+        settings.set("energy_calculator", "use_cache", "False")
+        self.assertIsNone(get_energy_cache(settings))
+
+    """
+    Tests that the cache is disabled by default and that cache_file does not need a log_path
+    """
+    def test_get_energy_cache(self):
+        settings_file = os.path.join(self.directory.name, "settings.ini")
+
+        with open(settings_file, "w") as settings:
+            settings.write("[energy_calculator]\ncode = psi4\n")
+
+        settings = SettingsReader(settings_file)
+
+        self.assertIsNone(get_energy_cache(settings))
+
+        settings.set("energy_calculator", "use_cache", "True")
+        settings.set("energy_calculator", "cache_file", self.file_name)
+
+        self.assertEqual(get_energy_cache(settings).file_name, self.file_name)
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestEnergyCache)
@@ -0,0 +1,4 @@
+import unittest
+from . import test_configurations_splitter, test_configuration_generator, test_configuration_generator_2b
+
+suite = unittest.TestSuite([test_configurations_splitter.suite, test_configuration_generator.suite, test_configuration_generator_2b.suite])
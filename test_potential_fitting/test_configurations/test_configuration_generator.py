@@ -0,0 +1,117 @@
+import unittest, os, tempfile
+
+import numpy
+
+from potential_fitting.configurations import generate_1b_configurations, configuration_generator
+from potential_fitting.molecule import xyz_to_coordinates
+from potential_fitting.database import Database
+from potential_fitting.exceptions import InvalidValueError, InconsistentValueError
+
+# the sulfate example of the Fortran normal distribution configuration generator
+example_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "configuration_generator", "norm_distribution", "examples", "sulfate")
+
+"""
+Test cases for generate_1b_configurations
+"""
+class TestConfigurationGenerator(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+        self.geo_path = os.path.join(example_directory, "so4_wb97mv-apc3_opt.xyz")
+        self.nm_path = os.path.join(example_directory, "so4_wb97mv-apc3_normal_modes.dat")
+        self.config_path = os.path.join(self.directory.name, "configs.xyz")
+        self.settings_path = os.path.join(self.directory.name, "settings.ini")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_settings(self, random, num_configs, geometric):
+        with open(self.settings_path, "w") as settings_file:
+            settings_file.write("[config_generator]\nrandom = {}\nnum_configs = {}\ngeometric = {}\nlinear = {}\n\n".format(random, num_configs, geometric, not geometric))
+            settings_file.write("[molecule]\nfragments = 5\ncharges = -2\nspins = 1\nnames = so4\nsymmetry = A1B4\ntag = none\n\n")
+            settings_file.write("[energy_calculator]\nmethod = HF\nbasis = STO-3G\ncp = False\n")
+
+    """
+    Tests that the Sobol configurations are the same as those of the Fortran generator
+    """
+    def test_generate_1b_configurations_sobol(self):
+        self.write_settings("Q", 8192, False)
+
+        generate_1b_configurations(self.settings_path, self.geo_path, self.nm_path, 6, self.config_path)
+
+        symbols, coordinates = xyz_to_coordinates(self.config_path)
+        expected_symbols, expected_coordinates = xyz_to_coordinates(os.path.join(example_directory, "expected_output", "so4_linear_Q.xyz"))
+
+        self.assertEqual(symbols, expected_symbols)
+
+        # the Fortran generator uses some single precision constants, which only changes the last printed digit
+        numpy.testing.assert_allclose(coordinates, expected_coordinates, rtol = 0, atol = 1e-7)
+
+        with open(self.config_path, "r") as config_file:
+            lines = config_file.read().splitlines()
+
+        self.assertEqual(lines[1::7], ["{:9d}".format(index) for index in range(1, 8193)])
+
+    """
+    Tests that pseudo-random configurations follow the expected normal distributions and depend only on the seed
+    """
+    def test_generate_normal_mode_coordinates_random(self):
+        symbols, coordinates = xyz_to_coordinates(self.geo_path)
+        frequencies, normal_modes = configuration_generator.read_normal_modes(self.nm_path, 9, 5)
+
+        batches = list(configuration_generator.generate_normal_mode_coordinates(symbols, coordinates[0], frequencies, normal_modes, 1000,
+                geometric = True, linear = False, seed = 12345, batch_size = 300))
+
+        self.assertEqual([first_index for first_index, batch in batches], [0, 300, 600, 900])
+
+        configurations = numpy.concatenate([batch for first_index, batch in batches])
+
+        other_configurations = numpy.concatenate([batch for first_index, batch in configuration_generator.generate_normal_mode_coordinates(symbols,
+                coordinates[0], frequencies, normal_modes, 1000, geometric = True, linear = False, seed = 12345)])
+
+        numpy.testing.assert_allclose(configurations, other_configurations)
+
+        # displacements along each mass-scaled normal mode, divided by their expected standard deviations, are standard normal
+        sqrt_masses = numpy.repeat(numpy.sqrt([configuration_generator.ISOTOPE_MASSES[symbol] * configuration_generator.DALTON_TO_AU for symbol in symbols]), 3)
+
+        modes = normal_modes * sqrt_masses
+        modes /= numpy.linalg.norm(modes, axis = 1)[:, numpy.newaxis]
+
+        displacements = (configurations - coordinates[0]).reshape(1000, -1) / configuration_generator.constants.bohr_to_ang * sqrt_masses
+        variances = configuration_generator.get_mode_variances(frequencies, 1000, geometric = True, linear = False)
+
+        normals = (displacements @ modes.T) / numpy.sqrt(variances)
+
+        numpy.testing.assert_allclose(normals.mean(axis = 0), 0, atol = 0.15)
+        numpy.testing.assert_allclose(normals.std(axis = 0), 1, atol = 0.1)
+
+    """
+    Tests that configurations can be added to a database as they are generated
+    """
+    def test_generate_1b_configurations_database(self):
+        self.write_settings("P", 20, True)
+
+        database_name = os.path.join(self.directory.name, "test.db")
+
+        generate_1b_configurations(self.settings_path, self.geo_path, self.nm_path, 6, None, seed = 1, database_name = database_name)
+
+        self.assertFalse(os.path.exists(self.config_path))
+
+        with Database(database_name) as database:
+            self.assertEqual(database.count_calculations("so4", "HF", "STO-3G", False, "none")[0], 20)
+
+    """
+    Tests the inverse normal CDF and the validation of the progression settings
+    """
+    def test_inverse_normal_cdf(self):
+        numpy.testing.assert_allclose(configuration_generator.inverse_normal_cdf([0.5, 0.8413447460685429, 0.022750131948179195, 1e-6]),
+                [0, 1, -2, -4.753424308822899], atol = 1e-8)
+
+        with self.assertRaises(InconsistentValueError):
+            configuration_generator.get_mode_variances(numpy.array([100, 200]), 10, geometric = True, linear = True)
+
+        with self.assertRaises(InvalidValueError):
+            configuration_generator.get_mode_variances(numpy.array([100, 200]), 1)
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestConfigurationGenerator)
@@ -0,0 +1,136 @@
+import unittest, os, tempfile
+
+import numpy
+
+from potential_fitting.configurations import generate_2b_configurations, configuration_generator_2b
+from potential_fitting.molecule import xyz_to_molecules
+from potential_fitting.utils import Quaternion, get_rotation_matrices, get_sobol_points, get_sobol_rotation_matrices
+from potential_fitting.exceptions import InvalidValueError
+
+"""
+Test cases for generate_2b_configurations
+"""
+class TestConfigurationGenerator2B(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+        self.geo1 = os.path.join(self.directory.name, "water.xyz")
+        self.geo2 = os.path.join(self.directory.name, "ammonia.xyz")
+        self.config_path = os.path.join(self.directory.name, "configs.xyz")
+
+        with open(self.geo1, "w") as geo_file:
+            geo_file.write("3\n\nO 0.0 0.0 0.1\nH 0.75 0.0 -0.5\nH -0.75 0.0 -0.5\n")
+
+        with open(self.geo2, "w") as geo_file:
+            geo_file.write("4\n\nN 0.0 0.0 0.1\nH 0.94 0.0 -0.3\nH -0.47 0.81 -0.3\nH -0.47 -0.81 -0.3\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    """
+    Tests that the configurations have the right number of atoms, distances between monomers, and no clashes
+    """
+    def test_generate_2b_configurations(self):
+        generate_2b_configurations(self.geo1, self.geo2, 50, self.config_path, min_distance = 2, max_distance = 6, min_inter_distance = 1.2, seed = 12345)
+
+        configurations = xyz_to_molecules(self.config_path)
+
+        self.assertEqual(len(configurations), 50)
+
+        with open(self.config_path, "r") as config_file:
+            lines = config_file.read().splitlines()
+
+        # comment lines count the configurations
+        self.assertEqual(lines[1::9], [str(index) for index in range(50)])
+
+        for configuration in configurations:
+            coordinates = configuration.get_coordinate_array()
+
+            self.assertEqual([atom.get_name() for atom in configuration.get_atoms()], ["O", "H", "H", "N", "H", "H", "H"])
+
+            # the water molecule is centered at the origin, and the ammonia along x
+            masses = configuration.get_masses()
+            numpy.testing.assert_allclose(masses[:3] @ coordinates[:3] / masses[:3].sum(), [0, 0, 0], atol = 1e-5)
+
+            center2 = masses[3:] @ coordinates[3:] / masses[3:].sum()
+            numpy.testing.assert_allclose(center2[1:], [0, 0], atol = 1e-5)
+            self.assertTrue(2 - 1e-5 <= center2[0] < 6)
+
+            distances = numpy.linalg.norm(coordinates[:3, numpy.newaxis] - coordinates[3:], axis = 2)
+            self.assertGreaterEqual(distances.min(), 1.2)
+
+        # the same seed gives the same configurations
+        with open(self.config_path, "r") as config_file:
+            first_configurations = config_file.read()
+
+        generate_2b_configurations(self.geo1, self.geo2, 50, self.config_path, min_distance = 2, max_distance = 6, min_inter_distance = 1.2, seed = 12345)
+
+        with open(self.config_path, "r") as config_file:
+            self.assertEqual(config_file.read(), first_configurations)
+
+    """
+    Tests that the configurations generated from a seed do not depend on the number of worker processes
+    """
+    def test_generate_2b_configurations_workers(self):
+        batch_size = configuration_generator_2b.CONFIG_BATCH_SIZE
+
+        # use small shards so there are many of them
+        configuration_generator_2b.CONFIG_BATCH_SIZE = 8
+
+        try:
+            outputs = []
+
+            for workers in [1, 3]:
+                generate_2b_configurations(self.geo1, self.geo2, 50, self.config_path, min_distance = 1, max_distance = 6, min_inter_distance = 1.2, seed = -7, workers = workers)
+
+                with open(self.config_path, "r") as config_file:
+                    outputs.append(config_file.read())
+
+        finally:
+            configuration_generator_2b.CONFIG_BATCH_SIZE = batch_size
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(len(xyz_to_molecules(self.config_path)), 50)
+
+    """
+    Tests that the batched rotation matrices rotate the same way as Quaternion.rotate()
+    """
+    def test_get_rotation_matrices(self):
+        quaternions = [Quaternion.get_random_quaternion() for i in range(5)]
+
+        matrices = get_rotation_matrices([[quaternion.r, quaternion.i, quaternion.j, quaternion.k] for quaternion in quaternions])
+
+        for quaternion, matrix in zip(quaternions, matrices):
+            numpy.testing.assert_allclose(matrix, quaternion.get_rotation_matrix(), atol = 1e-12)
+
+    """
+    Tests that the Sobol sequence spreads its points evenly and gives proper rotations
+    """
+    def test_sobol_rotations(self):
+        points = get_sobol_points(numpy.arange(256), 6, shift = [1, 2, 3, 4, 5, 6])
+
+        # each run of 2^m points starting at a multiple of 2^m has one point in each interval of width 1 / 2^m of each coordinate
+        for size in [4, 16, 64, 256]:
+            for start in range(0, 256, size):
+                for dimension in range(6):
+                    self.assertEqual(sorted((points[start:start + size, dimension] * size).astype(int).tolist()), list(range(size)))
+
+        rotations = get_sobol_rotation_matrices(numpy.arange(100), 2)
+
+        self.assertEqual(rotations.shape, (100, 2, 3, 3))
+        numpy.testing.assert_allclose(rotations @ numpy.swapaxes(rotations, -1, -2), numpy.broadcast_to(numpy.identity(3), rotations.shape), atol = 1e-12)
+        numpy.testing.assert_allclose(numpy.linalg.det(rotations), 1)
+
+    """
+    Tests generating configurations with Sobol orientations
+    """
+    def test_generate_2b_configurations_sobol(self):
+        generate_2b_configurations(self.geo1, self.geo2, 20, self.config_path, min_distance = 2, max_distance = 6, seed = 3, orientation_sampler = "sobol")
+
+        self.assertEqual(len(xyz_to_molecules(self.config_path)), 20)
+
+        with self.assertRaises(InvalidValueError):
+            generate_2b_configurations(self.geo1, self.geo2, 20, self.config_path, orientation_sampler = "grid")
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestConfigurationGenerator2B)
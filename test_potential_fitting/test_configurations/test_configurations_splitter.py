@@ -0,0 +1,106 @@
+import unittest, os, random, tempfile
+
+import numpy
+
+from potential_fitting.configurations import split_configurations, RMSDDescriptor, RMSDDistanceDescriptor, SortedDistanceDescriptor, CoulombMatrixDescriptor
+from potential_fitting.molecule import xyz_to_molecules, Atom, Fragment, Molecule
+from potential_fitting.utils import SettingsReader, Quaternion
+
+"""
+Test cases for split_configurations
+"""
+class TestConfigurationsSplitter(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+        self.settings_file = os.path.join(self.directory.name, "settings.ini")
+        self.configurations_path = os.path.join(self.directory.name, "configs.xyz")
+        self.training_set_path = os.path.join(self.directory.name, "training.xyz")
+        self.test_set_path = os.path.join(self.directory.name, "test.xyz")
+
+        with open(self.settings_file, "w") as settings_file:
+            settings_file.write("[molecule]\nfragments = 2\ncharges = 0\nspins = 1\nnames = H2\nsymmetry = A2\n")
+
+        # write 10 hydrogen molecules with bond lengths from 0.5 to 1.4
+        with open(self.configurations_path, "w") as xyz_file:
+            for frame in range(10):
+                xyz_file.write("2\n\nH 0.0 0.0 0.0\nH 0.0 0.0 {}\n".format(0.5 + frame / 10))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    """
+    Gets the bond lengths of the hydrogen molecules in an xyz file
+    """
+    def read_bond_lengths(self, file_path):
+        return [round(molecule.get_atoms()[0].distance(molecule.get_atoms()[1]), 6) for molecule in xyz_to_molecules(file_path, SettingsReader(self.settings_file))]
+
+    """
+    Tests that furthest point sampling chooses the most different molecules for the training set
+    """
+    def test_split_configurations(self):
+        random.seed(1)
+        split_configurations(self.settings_file, self.configurations_path, self.training_set_path, self.test_set_path, 3)
+
+        training_set = self.read_bond_lengths(self.training_set_path)
+        test_set = self.read_bond_lengths(self.test_set_path)
+
+        # the second molecule is whichever of the shortest and longest is furthest from the first, the third is the one
+        # furthest from both of those
+        self.assertEqual(len(training_set), 3)
+        self.assertEqual(training_set[1], max([0.5, 1.4], key = lambda bond_length: abs(bond_length - training_set[0])))
+        distance_to_first_two = lambda bond_length: min(abs(bond_length - training_set[0]), abs(bond_length - training_set[1]))
+        self.assertAlmostEqual(distance_to_first_two(training_set[2]), max(distance_to_first_two(bond_length) for bond_length in test_set))
+
+        # every molecule is in exactly one set, and the test set is in its original order
+        self.assertEqual(sorted(training_set + test_set), [round(0.5 + frame / 10, 6) for frame in range(10)])
+        self.assertEqual(test_set, sorted(test_set))
+
+        # computing the differences in worker processes chooses the same molecules
+        random.seed(1)
+        split_configurations(self.settings_file, self.configurations_path, self.training_set_path, self.test_set_path, 3, workers = 2)
+
+        self.assertEqual(self.read_bond_lengths(self.training_set_path), training_set)
+        self.assertEqual(self.read_bond_lengths(self.test_set_path), test_set)
+
+        # a training set larger than the number of configurations takes all of them
+        split_configurations(self.settings_file, self.configurations_path, self.training_set_path, self.test_set_path, 20)
+
+        self.assertEqual(len(self.read_bond_lengths(self.training_set_path)), 10)
+        self.assertEqual(self.read_bond_lengths(self.test_set_path), [])
+
+    """
+    Tests that the feature matrices of the descriptors give the same differences as comparing molecules one pair at a time
+    """
+    def test_feature_descriptors(self):
+        random_state = numpy.random.RandomState(0)
+
+        molecules = []
+
+        for i in range(5):
+            molecule = Molecule()
+            water = Fragment("H2O", 0, 1)
+
+            for (symbol, symmetry_class), (x, y, z) in zip([("O", "A"), ("H", "B"), ("H", "B")], random_state.normal(size = (3, 3))):
+                water.add_atom(Atom(symbol, symmetry_class, x, y, z))
+
+            molecule.add_fragment(water)
+            molecules.append(molecule)
+
+        for descriptor in [RMSDDescriptor(), RMSDDescriptor(align = True), RMSDDistanceDescriptor()]:
+            expected = [descriptor.difference(molecules[0], molecule) for molecule in molecules[1:]]
+
+            numpy.testing.assert_allclose(descriptor.differences(molecules[0], molecules[1:]), expected)
+
+        # sorted distances and Coulomb matrix eigenvalues do not change when a molecule is rotated, and are 0 for the same molecule
+        for descriptor in [SortedDistanceDescriptor(), CoulombMatrixDescriptor()]:
+            differences = descriptor.differences(molecules[0], molecules)
+
+            molecules[0].rotate(Quaternion.get_random_quaternion(), 1, 2, 3)
+
+            numpy.testing.assert_allclose(descriptor.differences(molecules[0], molecules), differences, atol = 1e-6)
+            self.assertAlmostEqual(differences[0], 0, places = 6)
+            self.assertTrue(all(differences[1:] > 0))
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestConfigurationsSplitter)
@@ -0,0 +1,4 @@
+import unittest
+from . import test_database
+
+suite = unittest.TestSuite([test_database.suite])
@@ -0,0 +1,416 @@
+import unittest, os, tempfile, sqlite3
+from unittest import mock
+
+from potential_fitting.molecule import Atom, Fragment, Molecule
+from potential_fitting.database import Database
+from potential_fitting.database import database as database_module
+from potential_fitting.exceptions import InconsistentDatabaseError
+
+"""
+Test cases for Database class
+"""
+class TestDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "test.db")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    """
+    Makes a dimer of water and carbon dioxide, displaced by the given amount
+    """
+    def make_molecule(self, displacement):
+        water = Fragment("H2O", 0, 1)
+        water.add_atom(Atom("O", "A", 0, 0, displacement))
+        water.add_atom(Atom("H", "B", 1, 0, displacement))
+        water.add_atom(Atom("H", "B", 0, 1, displacement))
+
+        carbon_dioxide = Fragment("CO2", 0, 1)
+        carbon_dioxide.add_atom(Atom("C", "C", 5, 0, displacement))
+        carbon_dioxide.add_atom(Atom("O", "D", 6, 0, displacement))
+        carbon_dioxide.add_atom(Atom("O", "D", 4, 0, displacement))
+
+        molecule = Molecule()
+        molecule.add_fragment(water)
+        molecule.add_fragment(carbon_dioxide)
+
+        return molecule
+
+    """
+    Calculates every missing energy in the database, setting each energy to its job id
+    """
+    def fill(self, database):
+        for job in database.missing_energies():
+            database.set_energy(job.job_id, float(job.job_id), "log")
+
+    """
+    Tests the get_energies() function of the Database class
+    """
+    def test_get_energies(self):
+        with Database(self.file_name) as database:
+            database.create()
+
+            database.add_calculation(self.make_molecule(0), "HF", "STO-3G", False, "tag", False)
+            database.add_calculation(self.make_molecule(1), "HF", "STO-3G", False, "tag", False)
+            database.add_calculation(self.make_molecule(2), "HF", "STO-3G", True, "tag", True)
+
+            # no energies are calculated, so there should be no complete calculations
+            self.assertEqual(list(database.get_energies("CO2-H2O", "%", "%", "%", "%")), [])
+
+            self.fill(database)
+
+            # mark one of the jobs of the second calculation as failed
+            database.set_failed(4, "failed", "log")
+
+            energies = list(database.get_energies("CO2-H2O", "%", "%", "%", "%"))
+
+            self.assertEqual(len(energies), 2)
+            self.assertEqual(energies[0][0].to_xyz(), self.make_molecule(0).to_xyz())
+            self.assertEqual(energies[0][1], [1.0, 2.0, 3.0])
+            self.assertEqual(energies[1][0].to_xyz(), self.make_molecule(2).to_xyz())
+            self.assertEqual(energies[1][1], [7.0, 8.0, 9.0, 10.0, 11.0])
+
+            # filter by model and optimized
+            self.assertEqual(len(list(database.get_energies("CO2-H2O", "HF", "STO-3G", 0, "tag"))), 1)
+            self.assertEqual(len(list(database.get_energies("CO2-H2O", "%", "%", "%", "%", True))), 1)
+            self.assertEqual(len(list(database.get_energies("CO2-H2O", "%", "%", "%", "other"))), 0)
+            self.assertEqual(len(list(database.get_energies("H2O", "%", "%", "%", "%"))), 0)
+
+    """
+    Tests the get_molecules() function of the Database class
+    """
+    def test_get_molecules(self):
+        with Database(self.file_name) as database:
+            database.create()
+
+            for displacement in range(3):
+                database.add_calculation(self.make_molecule(displacement), "HF", "STO-3G", False, "tag", False)
+
+            molecules = database.get_molecules([3, 1])
+
+            self.assertEqual(sorted(molecules.keys()), [1, 3])
+            self.assertEqual(molecules[1].to_xyz(), database.get_molecule(1).to_xyz())
+            self.assertEqual(molecules[3].to_xyz(), self.make_molecule(2).to_xyz())
+
+    """
+    Tests the molecule cache of the Database class
+    """
+    def test_molecule_cache(self):
+        with Database(self.file_name) as database:
+            database.create()
+
+            for displacement in range(3):
+                database.add_calculation(self.make_molecule(displacement), "HF", "STO-3G", False, "tag", False)
+
+        with Database(self.file_name, molecule_cache_size = 2) as database:
+
+            # molecules in the cache are not reconstructed again
+            molecule = database.get_molecule(1)
+            self.assertIs(database.get_molecule(1), molecule)
+            self.assertIs(database.get_molecules([1, 2])[1], molecule)
+
+            # reading a third molecule evicts the least recently used one
+            database.get_molecule(3)
+            self.assertEqual(list(database.molecule_cache.keys()), [2, 3])
+            self.assertIsNot(database.get_molecule(1), molecule)
+            self.assertEqual(database.get_molecule(1).to_xyz(), molecule.to_xyz())
+
+            # all jobs of a calculation share one molecule
+            jobs = database.claim_jobs(3)
+            self.assertEqual([job.fragments for job in jobs], [(0,), (1,), (0, 1)])
+            self.assertIs(jobs[0].molecule, jobs[2].molecule)
+
+        with Database(self.file_name, molecule_cache_size = 0) as database:
+            self.assertIsNot(database.get_molecule(1), database.get_molecule(1))
+            self.assertEqual(len(database.molecule_cache), 0)
+
+    """
+    Tests that add_calculations() adds the same rows as add_calculation()
+    """
+    def test_add_calculations(self):
+        with Database(self.file_name) as database:
+            database.create()
+
+            database.add_calculation(self.make_molecule(0), "HF", "STO-3G", False, "tag", False)
+
+            calculations = [(self.make_molecule(displacement), "HF", "STO-3G", cp, "tag", False) for displacement in range(3) for cp in [False, True]]
+
+            # the calculation added above and the duplicate at the end should be skipped
+            self.assertEqual(database.add_calculations(calculations + calculations[-1:]), 5)
+            self.assertEqual(database.add_calculations(calculations), 0)
+
+            self.assertEqual(database.count_calculations(), (6, 0, 0, 0))
+            self.assertEqual(database.count_energies(), (3 * 3 + 3 * 5, 0, 0, 0))
+
+            self.fill(database)
+
+            energies = list(database.get_energies("CO2-H2O", "HF", "STO-3G", 1, "tag"))
+
+            self.assertEqual(len(energies), 3)
+            self.assertEqual([molecule.to_xyz() for molecule, energy in energies], [self.make_molecule(displacement).to_xyz() for displacement in range(3)])
+
+    """
+    Tests that add_calculations() skips a calculation repeated in a later batch
+    """
+    def test_add_calculations_batches(self):
+        with Database(self.file_name) as database:
+            database.create()
+
+            calculations = [(self.make_molecule(displacement), "HF", "STO-3G", False, "tag", False) for displacement in [0, 1, 0]]
+
+            with mock.patch.object(database_module, "INSERT_BATCH_SIZE", 2):
+                self.assertEqual(database.add_calculations(calculations), 2)
+
+            self.assertEqual(database.count_calculations(), (2, 0, 0, 0))
+            self.assertEqual(database.count_energies(), (2 * 3, 0, 0, 0))
+
+    """
+    Tests that add_calculations() uses models and molecules added by another connection between its batches
+    """
+    def test_add_calculations_concurrent(self):
+        with Database(self.file_name) as database, Database(self.file_name) as other:
+            database.create()
+
+            def calculations():
+                yield self.make_molecule(0), "HF", "STO-3G", False, "tag", False
+
+                # the first batch has been committed, so the other connection may add rows before the second
+                other.add_calculation(self.make_molecule(1), "MP2", "STO-3G", False, "tag", False)
+                other.save()
+
+                yield self.make_molecule(1), "MP2", "STO-3G", False, "tag", False
+                yield self.make_molecule(1), "MP2", "STO-3G", False, "other tag", False
+
+            with mock.patch.object(database_module, "INSERT_BATCH_SIZE", 1):
+                self.assertEqual(database.add_calculations(calculations()), 2)
+
+            self.assertEqual(database.cursor.execute("SELECT COUNT(*) FROM Models").fetchone()[0], 2)
+            self.assertEqual(database.cursor.execute("SELECT COUNT(*) FROM Molecules").fetchone()[0], 2)
+            self.assertEqual(database.count_calculations(), (3, 0, 0, 0))
+
+    """
+    Tests the count_calculations(), count_energies(), what_models(), and what_molecules() functions of the Database class
+    """
+    def test_count_calculations(self):
+        with Database(self.file_name) as database:
+            database.create()
+
+            database.add_calculations([(self.make_molecule(displacement), "HF", "STO-3G", False, "tag", displacement == 0) for displacement in range(4)])
+            database.add_calculation(self.make_molecule(0), "MP2", "STO-3G", True, "tag", False)
+
+            self.assertEqual(database.count_calculations(), (5, 0, 0, 0))
+            self.assertEqual(database.count_energies(), (4 * 3 + 5, 0, 0, 0))
+
+            # complete the first calculation, fail the second, and start the third
+            jobs = database.claim_jobs(8)
+            for job in jobs[:4]:
+                database.set_energy(job.job_id, 1.0, "log")
+            database.set_failed(jobs[4].job_id, "failed", "log")
+
+            self.assertEqual(database.count_calculations(), (2, 1, 1, 1))
+            self.assertEqual(database.count_calculations(optimized = True), (0, 0, 1, 0))
+            self.assertEqual(database.count_calculations(method = "MP2"), (1, 0, 0, 0))
+            self.assertEqual(database.count_energies(), (9, 3, 4, 1))
+            self.assertEqual(database.count_energies("CO2-H2O", "HF", "STO-3G", 0, "tag", True), (0, 0, 3, 0))
+            self.assertEqual(database.count_energies(tag = "other"), (0, 0, 0, 0))
+
+            self.assertEqual(list(database.what_models()), [("HF", "STO-3G", False, (1, 1, 1, 1)), ("MP2", "STO-3G", True, (1, 0, 0, 0))])
+            self.assertEqual(list(database.what_models(optimized = True)), [("HF", "STO-3G", False, (0, 0, 1, 0))])
+            self.assertEqual(list(database.what_molecules("HF")), [("CO2-H2O", (1, 1, 1, 1))])
+            self.assertEqual(list(database.what_molecules("CCSD")), [])
+
+    """
+    Makes a database with the tables as they were before the schema version was introduced
+    """
+    def make_unversioned_database(self):
+        connection = sqlite3.connect(self.file_name)
+        connection.execute("CREATE TABLE Models(method TEXT, basis TEXT, cp INT)")
+        connection.execute("CREATE TABLE Molecules(name TEXT, hash TEXT)")
+        connection.execute("CREATE TABLE Fragments(molecule_id INT, name TEXT, charge INT, spin INT)")
+        connection.execute("CREATE TABLE Atoms(fragment_id INT, symbol TEXT, symmetry_class TEST, x REAL, y REAL, z REAL)")
+        connection.execute("CREATE TABLE Calculations(molecule_id INT, model_id INT, tag TEXT, optimized INT)")
+        connection.execute("CREATE TABLE Energies(calculation_id INT, job_id INT, energy_index INT, energy REAL)")
+        connection.execute("CREATE TABLE Jobs(status TEXT, log_file TEXT, start_date TEXT, end_date TEXT)")
+
+        return connection
+
+    """
+    Tests that databases without a schema version are upgraded when they are opened
+    """
+    def test_upgrade(self):
+        connection = self.make_unversioned_database()
+        connection.execute("INSERT INTO Calculations (molecule_id, model_id, tag, optimized) VALUES (1, 1, 'tag', 0)")
+        connection.execute("INSERT INTO Jobs (status) VALUES ('running')")
+        connection.execute("INSERT INTO Jobs (status) VALUES ('completed')")
+        connection.execute("INSERT INTO Energies (calculation_id, job_id, energy_index) VALUES (1, 1, 0)")
+        connection.execute("INSERT INTO Energies (calculation_id, job_id, energy_index) VALUES (1, 2, 1)")
+        connection.commit()
+        connection.close()
+
+        with Database(self.file_name) as database:
+            self.assertNotEqual(database.cursor.execute("PRAGMA user_version").fetchone()[0], 0)
+            self.assertTrue(database.cursor.execute("SELECT EXISTS(SELECT * FROM sqlite_master WHERE type='index' AND name='calculations_index')").fetchone()[0])
+
+            # the summaries of existing calculations should be filled in
+            self.assertEqual(database.cursor.execute("SELECT pending, running, completed, failed FROM Summaries").fetchall(), [(0, 1, 1, 0)])
+
+            # jobs claimed before leases existed should be reclaimed by clean()
+            self.assertEqual(database.clean(), 1)
+            self.assertEqual(database.cursor.execute("SELECT pending, running, completed, failed FROM Summaries").fetchall(), [(1, 0, 1, 0)])
+
+    """
+    Tests that upgrading a database with duplicate calculations fails with an InconsistentDatabaseError
+    """
+    def test_upgrade_duplicates(self):
+        connection = self.make_unversioned_database()
+        connection.execute("INSERT INTO Calculations (molecule_id, model_id, tag, optimized) VALUES (1, 1, 'tag', 0)")
+        connection.execute("INSERT INTO Calculations (molecule_id, model_id, tag, optimized) VALUES (1, 1, 'tag', 0)")
+        connection.commit()
+        connection.close()
+
+        with self.assertRaises(InconsistentDatabaseError):
+            Database(self.file_name)
+
+    """
+    Tests that an upgrade that fails partway through leaves the database as it was, so it can be upgraded again
+    """
+    def test_upgrade_rollback(self):
+        connection = self.make_unversioned_database()
+        connection.execute("INSERT INTO Calculations (molecule_id, model_id, tag, optimized) VALUES (1, 1, 'tag', 0)")
+        connection.execute("INSERT INTO Jobs (status) VALUES ('pending')")
+        connection.execute("INSERT INTO Energies (calculation_id, job_id, energy_index) VALUES (1, 1, 0)")
+        connection.commit()
+        connection.close()
+
+        with mock.patch.object(Database, "create_triggers", side_effect = RuntimeError("interrupted")):
+            with self.assertRaises(RuntimeError):
+                Database(self.file_name)
+
+        connection = sqlite3.connect(self.file_name)
+        self.assertEqual(connection.execute("PRAGMA user_version").fetchone()[0], 0)
+        self.assertFalse(connection.execute("SELECT EXISTS(SELECT * FROM sqlite_master WHERE name='Summaries')").fetchone()[0])
+        self.assertNotIn("worker", [column[1] for column in connection.execute("PRAGMA table_info(Jobs)")])
+        connection.close()
+
+        with Database(self.file_name) as database:
+            self.assertEqual(database.cursor.execute("SELECT pending, running, completed, failed FROM Summaries").fetchall(), [(1, 0, 0, 0)])
+
+    """
+    Tests the claim_jobs(), heartbeat(), and clean() functions of the Database class
+    """
+    def test_claim_jobs(self):
+        with Database(self.file_name) as database:
+            database.create()
+
+            for displacement in range(3):
+                database.add_calculation(self.make_molecule(displacement), "HF", "STO-3G", False, "tag", False)
+
+        with Database(self.file_name) as database1, Database(self.file_name) as database2:
+
+            jobs1 = database1.claim_jobs(4, "worker1")
+            jobs2 = database2.claim_jobs(10, "worker2", lease_time = -1)
+
+            # the two workers must never be given the same job
+            self.assertEqual(len(jobs1), 4)
+            self.assertEqual(len(jobs2), 5)
+            self.assertEqual(set(job.job_id for job in jobs1) & set(job.job_id for job in jobs2), set())
+
+            # there are no more pending jobs
+            self.assertEqual(database1.claim_jobs(1, "worker1"), [])
+            self.assertIsNone(database1.get_missing_energy())
+
+            self.assertEqual(database1.heartbeat("worker1"), 4)
+
+            # only the expired leases of worker2 should be reclaimed
+            self.assertEqual(database1.clean(), 5)
+            self.assertEqual(database1.count_energies(), (5, 4, 0, 0))
+
+            self.assertEqual(sorted(job.job_id for job in database1.missing_energies()), sorted(job.job_id for job in jobs2))
+
+            # released jobs may be claimed again, but jobs that are no longer running are not released
+            database1.set_energy(jobs1[0].job_id, 1.0, "log")
+            self.assertEqual(database1.release_jobs(job.job_id for job in jobs1), 3)
+            self.assertEqual(database1.count_energies(), (3, 5, 1, 0))
+            database1.save()
+            self.assertEqual(len(database2.claim_jobs(10, "worker2")), 3)
+
+    """
+    Tests that heartbeat() does not keep other connections from claiming jobs
+    """
+    def test_heartbeat(self):
+        with Database(self.file_name) as database:
+            database.create()
+            database.add_calculation(self.make_molecule(0), "HF", "STO-3G", False, "tag", False)
+
+        # fail quickly instead of waiting for the lock if heartbeat() does not release it
+        with mock.patch.object(database_module, "DATABASE_TIMEOUT", 0.1):
+            with Database(self.file_name) as database1, Database(self.file_name) as database2:
+
+                database1.claim_jobs(1, "worker1")
+                self.assertEqual(database1.heartbeat("worker1"), 1)
+
+                self.assertEqual(len(database2.claim_jobs(10, "worker2")), 2)
+
+    """
+    Tests that filling a database with missing_energies() commits by the commit policy instead of once per job
+    """
+    def test_missing_energies_commits(self):
+        with Database(self.file_name) as database:
+            database.create()
+
+            for displacement in range(4):
+                database.add_calculation(self.make_molecule(displacement), "HF", "STO-3G", False, "tag", False)
+
+        with Database(self.file_name, commit_writes = 6, commit_seconds = 1000) as database:
+
+            statements = []
+            database.connection.set_trace_callback(statements.append)
+
+            self.fill(database)
+
+            # 12 jobs are claimed in 2 batches and their energies are committed every 6 writes, then the last empty claim
+            self.assertEqual(database.count_energies(), (0, 0, 12, 0))
+            self.assertEqual(statements.count("COMMIT"), 5)
+
+        # jobs that were claimed but not generated are released when the generator is closed
+        with Database(self.file_name) as database:
+            database.cursor.execute("UPDATE Jobs SET status=?", ("pending",))
+            database.save()
+
+            jobs = database.missing_energies(5)
+            next(jobs)
+            jobs.close()
+
+            self.assertEqual(database.count_energies(), (11, 1, 0, 0))
+
+    """
+    Tests that set_energy() and set_failed() follow the commit policy of the Database class
+    """
+    def test_commit_policy(self):
+        with Database(self.file_name) as database:
+            database.create()
+            database.add_calculation(self.make_molecule(0), "HF", "STO-3G", False, "tag", False)
+
+        with Database(self.file_name, commit_writes = 2, commit_seconds = 1000) as database, Database(self.file_name) as reader:
+
+            self.assertEqual(database.cursor.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+            jobs = database.claim_jobs(3)
+
+            # the first write is not committed, so it is not visible to other connections
+            database.set_energy(jobs[0].job_id, 1.0, "log")
+            self.assertEqual(reader.count_energies(), (0, 3, 0, 0))
+
+            # the second write causes both to be committed
+            database.set_failed(jobs[1].job_id, "failed", "log")
+            self.assertEqual(reader.count_energies(), (0, 1, 1, 1))
+
+            database.set_energy(jobs[2].job_id, 1.0, "log")
+
+        # closing the database commits the remaining write
+        with Database(self.file_name) as reader:
+            self.assertEqual(reader.count_energies(), (0, 0, 2, 1))
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestDatabase)
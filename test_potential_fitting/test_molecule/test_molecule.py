@@ -3,6 +3,11 @@ import unittest
 from potential_fitting.molecule import Atom
 from potential_fitting.molecule import Fragment
 from potential_fitting.molecule import Molecule
+from potential_fitting.molecule import rmsd_many
+from potential_fitting.utils import Quaternion
+from potential_fitting.exceptions import InconsistentValueError
+
+import numpy
 
 """
 Test cases for molecule class
@@ -220,4 +225,128 @@ class TestMolecule(unittest.TestCase):
         molecule.add_fragment(fragment2)
         self.assertEqual(molecule.to_xyz(), fragment1.to_xyz() + fragment0.to_xyz() + fragment2.to_xyz()[:-1])
 
+    """
+    Tests that the atoms and fragments of a Molecule are views of its coordinate array
+    """
+    def test_get_coordinate_array(self):
+        molecule = Molecule()
+
+        fragment0 = Fragment("HClHe", -1, 1)
+        fragment0.add_atom(Atom("H", "A", 5, 3, 0.00343))
+        fragment0.add_atom(Atom("Cl", "B", 2, 0, -13))
+
+        # a fragment not in a molecule has its own array
+        fragment0.translate(1, 0, 0)
+        self.assertEqual(fragment0.get_coordinate_array().tolist(), [[6, 3, 0.00343], [3, 0, -13]])
+
+        fragment1 = Fragment("Ar", -2, 1)
+        fragment1.add_atom(Atom("Ar", "D", 0, 0, 0))
+
+        molecule.add_fragment(fragment0)
+        molecule.add_fragment(fragment1)
+
+        # the array is in standard order
+        self.assertEqual(molecule.get_coordinate_array().tolist(), [[0, 0, 0], [6, 3, 0.00343], [3, 0, -13]])
+
+        # moving the molecule moves its atoms and fragments, and moving an atom or fragment moves the molecule
+        molecule.translate(0, 1, 0)
+        self.assertEqual(molecule.get_atoms()[1].get_y(), 4)
+        self.assertEqual(fragment0.get_coordinate_array().tolist(), [[6, 4, 0.00343], [3, 1, -13]])
+
+        molecule.get_atoms()[0].set_xyz(1, 2, 3)
+        fragment0.translate(0, 0, 1)
+        self.assertEqual(molecule.get_coordinate_array().tolist(), [[1, 2, 3], [6, 4, 1.00343], [3, 1, -12]])
+
+        # atoms added to a fragment in a molecule are added to the molecule's array
+        fragment1.add_atom(Atom("Ar", "D", 0, 0, 1))
+        self.assertEqual(molecule.get_coordinate_array().tolist(), [[1, 2, 3], [0, 0, 1], [6, 4, 1.00343], [3, 1, -12]])
+
+        # moving to the center of mass of the two argon atoms
+        molecule.translate(-6, -4, -1.00343)
+        molecule.get_atoms()[0].set_xyz(0, 0, 1)
+        molecule.get_atoms()[1].set_xyz(0, 0, -1)
+        fragment0.translate(0, 0, 1.00343)
+        molecule.move_to_center_of_mass()
+        self.assertAlmostEqual(sum(molecule.get_masses() * molecule.get_coordinate_array()[:, 2]), 0)
+
+    """
+    Test the rmsd() and compare() functions of the Molecule class, with and without Kabsch superposition
+    """
+    def test_rmsd(self):
+        # a non-planar fragment, so its mirror image cannot be superimposed on it
+        coordinates = [[0, 0, 0], [1, 0, 0], [0, 1.5, 0], [0.2, 0.3, 2]]
+
+        def make_molecule(coordinates):
+            molecule = Molecule()
+            fragment = Fragment("CHNO", 0, 1)
+
+            for symbol, symmetry_class, (x, y, z) in zip(["C", "H", "N", "O"], "ABCD", coordinates):
+                fragment.add_atom(Atom(symbol, symmetry_class, x, y, z))
+
+            molecule.add_fragment(fragment)
+            return molecule
+
+        molecule = make_molecule(coordinates)
+        moved = make_molecule(coordinates)
+        moved.rotate(Quaternion.get_random_quaternion(), 1, 2, 3)
+        moved.translate(4, 5, 6)
+
+        self.assertGreater(molecule.rmsd(moved), 1)
+        self.assertAlmostEqual(molecule.rmsd(moved, align = True), 0)
+        self.assertFalse(molecule.compare(moved))
+        self.assertTrue(molecule.compare(moved, align = True))
+
+        # neither molecule is moved by aligning them
+        self.assertEqual(molecule.get_coordinate_array().tolist(), coordinates)
+
+        # a reflection is not a rotation
+        mirrored = make_molecule([[x, y, -z] for x, y, z in coordinates])
+        self.assertGreater(molecule.rmsd(mirrored, align = True), 0.1)
+
+        # rmsd_many() agrees with rmsd() for each molecule
+        stacked = numpy.array([molecule.get_coordinate_array(), moved.get_coordinate_array(), mirrored.get_coordinate_array()])
+
+        for align in [False, True]:
+            numpy.testing.assert_allclose(rmsd_many(molecule.get_coordinate_array(), stacked, align), [molecule.rmsd(other, align) for other in [molecule, moved, mirrored]], atol = 1e-12)
+
+    """
+    Test the distancermsd() and distancermsd_many() functions of the Molecule class and the cached distances they use
+    """
+    def test_distancermsd(self):
+        random_state = numpy.random.RandomState(0)
+
+        def make_molecule(symbols):
+            molecule = Molecule()
+            fragment = Fragment("H2O", 0, 1)
+
+            for symbol, symmetry_class, (x, y, z) in zip(symbols, "ABB", random_state.normal(size = (3, 3))):
+                fragment.add_atom(Atom(symbol, symmetry_class, x, y, z))
+
+            molecule.add_fragment(fragment)
+            return molecule
+
+        molecules = [make_molecule(["O", "H", "H"]) for i in range(4)]
+
+        # compare to the interatomic distances computed one pair at a time
+        def expected_distancermsd(molecule1, molecule2):
+            atoms1, atoms2 = molecule1.get_atoms(), molecule2.get_atoms()
+            squared_difference = sum((atoms1[i].distance(atoms1[k]) - atoms2[i].distance(atoms2[k])) ** 2 for i in range(3) for k in range(i + 1, 3))
+            return (squared_difference / 3) ** 0.5
+
+        self.assertAlmostEqual(molecules[0].distancermsd(molecules[1]), expected_distancermsd(molecules[0], molecules[1]))
+        numpy.testing.assert_allclose(molecules[0].distancermsd_many(molecules), [expected_distancermsd(molecules[0], molecule) for molecule in molecules])
+
+        # comparing to no molecules gives no distance RMSDs
+        self.assertEqual(molecules[0].distancermsd_many([]).shape, (0,))
+
+        # moving an atom through its own setter updates the cached distances
+        distances = molecules[1].get_distances().copy()
+        molecules[1].get_atoms()[0].set_xyz(10, 10, 10)
+        self.assertFalse(numpy.allclose(molecules[1].get_distances(), distances))
+        self.assertAlmostEqual(molecules[0].distancermsd(molecules[1]), expected_distancermsd(molecules[0], molecules[1]))
+
+        # molecules with different atoms cannot be compared
+        with self.assertRaises(InconsistentValueError):
+            molecules[0].distancermsd(make_molecule(["S", "H", "H"]))
+
 suite = unittest.TestLoader().loadTestsFromTestCase(TestMolecule)
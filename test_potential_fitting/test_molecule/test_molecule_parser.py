@@ -0,0 +1,82 @@
+import unittest, os, tempfile
+
+import numpy
+
+from potential_fitting.molecule import xyz_to_molecules, xyz_to_molecules_generator, xyz_to_coordinates, XYZIndex
+from potential_fitting.exceptions import XYZFormatError
+
+"""
+Test cases for the xyz readers of the molecule parser
+"""
+class TestMoleculeParser(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "configs.xyz")
+
+        # write 5 frames of a water molecule, each moved along z by its index
+        with open(self.file_name, "w") as xyz_file:
+            for frame in range(5):
+                xyz_file.write("3\ncomment {}\nO 0.0 0.0 {}\nH 1.0 0.0 {}\nH 0.0 1.0 {}\n".format(frame, frame, frame + 0.5, frame - 0.5))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    """
+    Tests that the generator reads the same molecules as xyz_to_molecules()
+    """
+    def test_xyz_to_molecules_generator(self):
+        molecules = xyz_to_molecules(self.file_name)
+
+        self.assertEqual(len(molecules), 5)
+        self.assertEqual([molecule.to_xyz() for molecule in xyz_to_molecules_generator(self.file_name)], [molecule.to_xyz() for molecule in molecules])
+
+        # a truncated last frame is an error
+        with open(self.file_name, "a") as xyz_file:
+            xyz_file.write("3\ncomment\nO 0.0 0.0 0.0\n")
+
+        with self.assertRaises(XYZFormatError):
+            list(xyz_to_molecules_generator(self.file_name))
+
+    """
+    Tests that xyz_to_coordinates() reads every frame into one array
+    """
+    def test_xyz_to_coordinates(self):
+        symbols, coordinates = xyz_to_coordinates(self.file_name)
+
+        self.assertEqual(symbols, ["O", "H", "H"])
+        self.assertEqual(coordinates.shape, (5, 3, 3))
+        self.assertTrue(numpy.array_equal(coordinates[3], [[0, 0, 3], [1, 0, 3.5], [0, 1, 2.5]]))
+
+        # frames with different numbers of atoms are an error
+        with open(self.file_name, "a") as xyz_file:
+            xyz_file.write("1\ncomment\nO 0.0 0.0 0.0\n")
+
+        with self.assertRaises(XYZFormatError):
+            xyz_to_coordinates(self.file_name)
+
+    """
+    Tests that xyz_to_coordinates() reports a malformed atom count line of any frame
+    """
+    def test_xyz_to_coordinates_count_line(self):
+        with open(self.file_name, "a") as xyz_file:
+            xyz_file.write("three\ncomment\nO 0.0 0.0 0.0\nH 1.0 0.0 0.0\nH 0.0 1.0 0.0\n")
+
+        with self.assertRaisesRegex(XYZFormatError, "frame 5"):
+            xyz_to_coordinates(self.file_name)
+
+    """
+    Tests that XYZIndex reads any molecule in the file
+    """
+    def test_xyz_index(self):
+        index = XYZIndex(self.file_name)
+        molecules = xyz_to_molecules(self.file_name)
+
+        self.assertEqual(len(index), 5)
+        self.assertEqual(index[3].to_xyz(), molecules[3].to_xyz())
+        self.assertEqual(index[-1].to_xyz(), molecules[4].to_xyz())
+
+        with self.assertRaises(IndexError):
+            index[5]
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestMoleculeParser)
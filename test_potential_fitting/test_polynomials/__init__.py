@@ -0,0 +1,4 @@
+import unittest
+from . import test_generate_poly, test_filters, test_program, test_polynomial_evaluator
+
+suite = unittest.TestSuite([test_generate_poly.suite, test_filters.suite, test_program.suite, test_polynomial_evaluator.suite])
@@ -0,0 +1,58 @@
+import unittest
+
+import numpy
+
+from potential_fitting.polynomials.filters import parse_filter, parse_range, CompiledDegreeFilter
+from potential_fitting.polynomials.generate_poly import Variable, generate_monomials
+from potential_fitting.exceptions import InvalidValueError
+
+"""
+Test cases for the monomial filters
+"""
+class TestFilters(unittest.TestCase):
+
+    def setUp(self):
+        # the variables of A1B2_A1B2, like two water molecules
+        self.variables = [Variable("add_variable['{}', '{}', '{}', '{}', '{}']".format(*line)) for line in [
+                ("A", "a", "B1", "a", "x-intra-AB"), ("A", "a", "B2", "a", "x-intra-AB"), ("B1", "a", "B2", "a", "x-intra-BB"),
+                ("A", "b", "B1", "b", "x-intra-AB"), ("A", "b", "B2", "b", "x-intra-AB"), ("B1", "b", "B2", "b", "x-intra-BB"),
+                ("A", "a", "A", "b", "x-AA"), ("A", "a", "B1", "b", "x-AB"), ("A", "a", "B2", "b", "x-AB"),
+                ("B1", "a", "A", "b", "x-AB"), ("B1", "a", "B1", "b", "x-BB"), ("B1", "a", "B2", "b", "x-BB"),
+                ("B2", "a", "A", "b", "x-AB"), ("B2", "a", "B1", "b", "x-BB"), ("B2", "a", "B2", "b", "x-BB")]]
+
+        self.monomials = [monomial for degree in range(1, 4) for monomial in generate_monomials(len(self.variables), degree)]
+
+    """
+    Tests that compiled filters keep the same monomials as filtering them one at a time
+    """
+    def test_compile(self):
+        for args in [["degree", "x-intra-**", "1+", "*"], ["degree", "*", "2-", "3"], ["degree", "x-*-AB/x-BB", "1-2", "2+"],
+                ["degree", "x-A*", "2/3", "1-3"], ["degree", "x-intra-*B", "*", "2-"], ["not", "degree", "x-**", "1+", "2"],
+                ["degree", "x-AA", "0", "*"]]:
+
+            monomial_filter = parse_filter(*args)
+
+            expected = [monomial_filter.keep(monomial, self.variables) for monomial in self.monomials]
+
+            self.assertEqual(monomial_filter.compile(self.variables).keep(numpy.array(self.monomials)).tolist(), expected)
+
+    """
+    Tests that the variable strings and ranges of a degree filter are parsed once into masks and ranges
+    """
+    def test_parse_filter(self):
+        compiled_filter = parse_filter("degree", "x-*-AB", "2+", "3").compile(self.variables)
+
+        self.assertIsInstance(compiled_filter, CompiledDegreeFilter)
+        self.assertEqual(compiled_filter.variable_mask.tolist(), [True, True, False, True, True, False, False, True, True, True, False, False, True, False, False])
+
+        self.assertEqual(compiled_filter.keep(numpy.array([[2] + [0] * 14, [2, 1] + [0] * 13, [0, 0, 2, 1] + [0] * 11])).tolist(), [True, False, True])
+
+        self.assertEqual([parse_range(range_string) for range_string in ["3", "2-", "2+", "1-3"]], [(3, 3), (-numpy.inf, 2), (2, numpy.inf), (1, 3)])
+
+        with self.assertRaises(InvalidValueError):
+            parse_filter("degree", "x-**", "a+", "*")
+
+        with self.assertRaises(InvalidValueError):
+            parse_filter("sum", "x-**", "1+", "*")
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestFilters)
@@ -0,0 +1,113 @@
+import unittest, os, tempfile, filecmp
+
+from potential_fitting.polynomials.generate_poly import generate_poly, Variable, make_permutations, combine_permutations, make_variable_permutations, generate_monomials, eliminate_redundant_monomials, permute_monomial, get_orbit
+
+"""
+Test cases for the monomial generation of generate_poly
+"""
+class TestGeneratePoly(unittest.TestCase):
+
+    def setUp(self):
+        # A1B2_A1B2, like two water molecules
+        fragments = ["A1B2", "A1B2"]
+        atom_names = ["Aa", "B1a", "B2a", "Ab", "B1b", "B2b"]
+
+        fragment_permutations = [[[index + 3 * fragment_index for index in permutation] for permutation in make_permutations(fragment)]
+                for fragment_index, fragment in enumerate(fragments)]
+
+        atom_permutations = list(combine_permutations(fragments, fragment_permutations))
+
+        self.variables = [Variable("add_variable['{}', '{}', '{}', '{}', 'x']".format(atom1[:-1], atom1[-1], atom2[:-1], atom2[-1]))
+                for index1, atom1 in enumerate(atom_names) for atom2 in atom_names[index1 + 1:]]
+
+        self.variable_permutations = list(make_variable_permutations(self.variables, atom_permutations, atom_names))
+
+    """
+    Tests that exactly one monomial of each set of permutations is kept, the first one, in reverse order
+    """
+    def test_eliminate_redundant_monomials(self):
+        for degree in range(1, 4):
+            monomials = list(generate_monomials(len(self.variables), degree))
+
+            accepted_monomials = list(eliminate_redundant_monomials(monomials, self.variable_permutations))
+
+            orbits = [set(tuple(permutation) for permutation in permute_monomial(monomial, self.variable_permutations)) for monomial in accepted_monomials]
+
+            # every monomial is a permutation of exactly one accepted monomial
+            for monomial in monomials:
+                self.assertEqual(sum(tuple(monomial) in orbit for orbit in orbits), 1)
+
+            # the accepted monomials are the first of their orbit, in reverse order
+            orbit_indices = {permutation: index for index, orbit in enumerate(orbits) for permutation in orbit}
+
+            first_monomials = []
+            seen_orbits = set()
+
+            for monomial in monomials:
+                if orbit_indices[tuple(monomial)] not in seen_orbits:
+                    seen_orbits.add(orbit_indices[tuple(monomial)])
+                    first_monomials.append(monomial)
+
+            self.assertEqual(accepted_monomials, first_monomials[::-1])
+
+    """
+    Tests that permuting a monomial moves the degree of each variable to the variable it is permuted into, and that the orbits of
+    accepted monomials are kept
+    """
+    def test_permute_monomial(self):
+        monomials = list(generate_monomials(len(self.variables), 2))
+
+        for monomial in monomials[::7]:
+
+            expected_permutations = []
+
+            for variable_permutation in self.variable_permutations:
+                permutation = [0 for degree in monomial]
+
+                for index, degree in enumerate(monomial):
+                    permutation[variable_permutation.index(index)] = degree
+
+                expected_permutations.append(permutation)
+
+            self.assertEqual(permute_monomial(monomial, self.variable_permutations), expected_permutations)
+
+        orbits = {}
+
+        accepted_monomials = list(eliminate_redundant_monomials(monomials, self.variable_permutations, orbits))
+
+        self.assertEqual(orbits, {tuple(monomial): get_orbit(monomial, self.variable_permutations) for monomial in accepted_monomials})
+
+    """
+    Tests that generating the monomials in several processes writes the same files as generating them in one
+    """
+    def test_generate_poly_workers(self):
+        with tempfile.TemporaryDirectory() as directory:
+
+            settings_path = os.path.join(directory, "settings.ini")
+            input_path = os.path.join(directory, "A1B2_A1B2.in")
+
+            open(settings_path, "w").close()
+
+            with open(input_path, "w") as input_file:
+                input_file.write("add_molecule['A1B2']\nadd_molecule['A1B2']\n\n")
+
+                for variable in self.variables:
+                    input_file.write("add_variable['{}', '{}', '{}', '{}', 'x']\n".format(variable.atom1_name, variable.atom1_fragment,
+                            variable.atom2_name, variable.atom2_fragment))
+
+                input_file.write("\nadd_filter['degree', 'x', '1+', '*']\n")
+
+            for workers in [1, 2]:
+                os.mkdir(os.path.join(directory, str(workers)))
+                generate_poly(settings_path, input_path, 3, os.path.join(directory, str(workers)), workers = workers)
+
+            file_names = sorted(os.listdir(os.path.join(directory, "1")))
+
+            self.assertIn("poly.log", file_names)
+            self.assertIn("poly-direct.npy", file_names)
+
+            matches, mismatches, errors = filecmp.cmpfiles(os.path.join(directory, "1"), os.path.join(directory, "2"), file_names, shallow = False)
+
+            self.assertEqual(matches, file_names)
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestGeneratePoly)
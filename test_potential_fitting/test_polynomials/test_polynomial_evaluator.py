@@ -0,0 +1,61 @@
+import unittest, os, tempfile
+
+import numpy
+
+from potential_fitting.polynomials import PolynomialEvaluator, read_polynomial_evaluator
+from potential_fitting.polynomials.polynomial_evaluator import get_polynomial_evaluator
+from potential_fitting.exceptions import InvalidValueError, InconsistentValueError
+
+"""
+Test cases for evaluating polynomials in python
+"""
+class TestPolynomialEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        # a polynomial of 3 variables where the first 2 variables are equivalent
+        self.orbits = [[(1, 0, 0), (0, 1, 0)], [(0, 0, 2)], [(1, 1, 0)], [(2, 0, 1), (0, 2, 1)], [(1, 2, 0), (2, 1, 0)]]
+
+        self.a = numpy.array([0.5, -1.5, 2.0, 0.25, -0.75])
+        self.x = numpy.random.RandomState(0).uniform(0.5, 1.5, (10, 3))
+
+        self.evaluator = get_polynomial_evaluator(self.orbits, 3)
+
+    """
+    Tests that the design matrix and energies are the sums of the permutations of each monomial, in batches of any size
+    """
+    def test_evaluate(self):
+        expected_design_matrix = numpy.array([[sum(numpy.prod(configuration ** numpy.array(permutation)) for permutation in orbit)
+                for orbit in self.orbits] for configuration in self.x])
+
+        for batch_size in [None, 1, 3]:
+            energies, design_matrix = self.evaluator.evaluate(self.a, self.x, design_matrix = True, batch_size = batch_size)
+
+            numpy.testing.assert_allclose(design_matrix, expected_design_matrix)
+            numpy.testing.assert_allclose(energies, expected_design_matrix @ self.a)
+
+            numpy.testing.assert_allclose(self.evaluator.evaluate(self.a, self.x, batch_size = batch_size), expected_design_matrix @ self.a)
+
+        self.assertAlmostEqual(self.evaluator.evaluate(self.a, self.x[4]), expected_design_matrix[4] @ self.a)
+
+        with self.assertRaises(InconsistentValueError):
+            self.evaluator.evaluate(self.a[:4], self.x)
+
+        with self.assertRaises(InconsistentValueError):
+            self.evaluator.get_design_matrix(self.x[:, :2])
+
+        with self.assertRaises(InvalidValueError):
+            PolynomialEvaluator([1, 0], [[1, 0], [0, 1]])
+
+    """
+    Tests that an evaluator is the same after being written and read
+    """
+    def test_read_polynomial_evaluator(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.evaluator.write(os.path.join(directory, "poly-direct.npy"))
+
+            evaluator = read_polynomial_evaluator(os.path.join(directory, "poly-direct.npy"))
+
+        numpy.testing.assert_array_equal(evaluator.exponents, self.evaluator.exponents)
+        numpy.testing.assert_allclose(evaluator.get_design_matrix(self.x), self.evaluator.get_design_matrix(self.x))
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestPolynomialEvaluator)
@@ -0,0 +1,93 @@
+import unittest, io
+
+import numpy
+
+from potential_fitting.polynomials.program import Program, build_polynomial_program, build_product_program, count_flat_operations
+
+"""
+Test cases for the programs the C++ of polynomials is written from
+"""
+class TestProgram(unittest.TestCase):
+
+    def setUp(self):
+        # a polynomial of 3 variables where the first 2 variables are equivalent
+        self.orbits = [[(1, 0, 0), (0, 1, 0)], [(0, 0, 2)], [(1, 1, 0)], [(2, 0, 1), (0, 2, 1)], [(1, 2, 0), (2, 1, 0)]]
+
+        self.a = numpy.array([0.5, -1.5, 2.0, 0.25, -0.75])
+        self.x = numpy.array([1.1, 0.7, 1.3])
+
+    def get_energy_and_gradient(self):
+        energy = 0
+        gradient = numpy.zeros(3)
+
+        for coefficient, orbit in zip(self.a, self.orbits):
+            for permutation in orbit:
+                energy += coefficient * numpy.prod(self.x ** permutation)
+
+                for index, degree in enumerate(permutation):
+                    if degree > 0:
+                        gradient[index] += coefficient * degree * numpy.prod(self.x ** permutation) / self.x[index]
+
+        return energy, gradient
+
+    """
+    Tests that the energy and its reverse mode gradient are the same as those of the polynomial
+    """
+    def test_gradient(self):
+        program, energy, variables = build_polynomial_program(self.orbits, 3)
+
+        gradient = program.gradient(energy, variables)
+
+        values = program.evaluate({"x": self.x, "a": self.a})
+
+        expected_energy, expected_gradient = self.get_energy_and_gradient()
+
+        self.assertAlmostEqual(values[energy], expected_energy)
+        numpy.testing.assert_allclose([values[node] for node in gradient], expected_gradient)
+
+        # variables the output does not depend on have no derivative
+        self.assertEqual(program.gradient(energy, variables + [program.input("x", 3)])[3], None)
+
+    """
+    Tests that every product of the variables is computed once, and that sharing them and Horner form take fewer operations
+    """
+    def test_shared_products(self):
+        program, permutations = build_product_program(self.orbits, 3)
+
+        values = program.evaluate({"x": self.x})
+
+        for orbit, nodes in zip(self.orbits, permutations):
+            numpy.testing.assert_allclose([values[node] for node in nodes], [numpy.prod(self.x ** permutation) for permutation in orbit])
+
+        # x0*x0, x1*x1, x0*x0*x2, x1*x1*x2, x2*x2, x0*x1, x0*x1*x1, x0*x0*x1 or x0*x1*x0
+        self.assertEqual(program.count_operations([node for nodes in permutations for node in nodes]), 8)
+
+        # 10 multiplications and 3 additions in the permutations, and 10 operations to multiply and add the coefficients
+        self.assertEqual(count_flat_operations(self.orbits), 23)
+
+        program, energy, variables = build_polynomial_program(self.orbits, 3)
+
+        self.assertLess(program.count_operations([energy]), 8 + 3 + 10)
+
+    """
+    Tests the C++ of a program
+    """
+    def test_write_cpp(self):
+        program = Program()
+
+        x0 = program.input("x", 0)
+        x1 = program.input("x", 1)
+        output = program.add(program.multiply(program.input("a", 0), program.multiply(x0, x0)), x1)
+
+        gradient = program.gradient(output, [x0, x1])
+
+        cpp_file = io.StringIO()
+
+        self.assertEqual(program.write_cpp(cpp_file, [output] + gradient), ["t3", "t5", "1.0"])
+
+        self.assertEqual(cpp_file.getvalue(), "    const double t1 = x[0]*x[0];\n    const double t2 = a[0]*t1;\n    const double t3 = t2+x[1];\n"
+                "    const double t4 = a[0]*x[0];\n    const double t5 = t4+t4;\n")
+
+        self.assertEqual(program.count_operations([output]), 3)
+
+suite = unittest.TestLoader().loadTestsFromTestCase(TestProgram)
@@ -1,4 +1,4 @@
 import unittest
-from . import test_molecule
+from . import test_molecule, test_database, test_calculator, test_configurations, test_polynomials
 
-suite = unittest.TestSuite([test_molecule.suite])
+suite = unittest.TestSuite([test_molecule.suite, test_database.suite, test_calculator.suite, test_configurations.suite, test_polynomials.suite])